@@ -20,7 +20,7 @@ if platform.python_implementation() == "CPython":
         print("Unable to import Cython. Pure Python version will be used.")
     else:
         ext_modules = cythonize(
-            str(here / "validx/cy/*.pyx"),
+            [str(here / "validx/cy/*.pyx"), str(here / "validx/exc/errors.py")],
             compiler_directives={"language_level": sys.version_info.major},
         )
 
@@ -0,0 +1,34 @@
+import pytest
+
+
+def schema(module):
+    return module.Dict(
+        {
+            "tenant%s" % num: module.Dict(
+                {
+                    "id": module.Int(min=0),
+                    "name": module.Str(maxlen=100),
+                    "tags": module.List(module.Str(options=["a", "b", "c"])),
+                    "kind": module.OneOf(module.Int(), module.Str()),
+                }
+            )
+            for num in range(50)
+        }
+    )
+
+
+@pytest.mark.benchmark(group="Clone")
+def test_clone_dump_load(module, benchmark):
+    v = schema(module)
+    update = {"schema.tenant0.schema.id.max": 10}
+    result = benchmark(lambda: v.load(v.dump(), update))
+    assert result.schema["tenant0"].schema["id"].max == 10
+
+
+@pytest.mark.benchmark(group="Clone")
+def test_clone(module, benchmark):
+    v = schema(module)
+    update = {"schema.tenant0.schema.id.max": 10}
+    result = benchmark(v.clone, update)
+    assert result.schema["tenant0"].schema["id"].max == 10
+    assert result.schema["tenant1"] is v.schema["tenant1"]
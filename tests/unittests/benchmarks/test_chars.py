@@ -1,5 +1,7 @@
 import pytest
 
+from validx import exc
+
 
 @pytest.mark.benchmark(group="Str")
 def test_str(module, benchmark):
@@ -31,12 +33,38 @@ def test_str_pattern(module, benchmark):
     assert benchmark(v, "abc") == "abc"
 
 
+@pytest.mark.benchmark(group="Str")
+def test_str_pattern_full(module, benchmark):
+    v = module.Str(pattern="[a-z]+", match="full")
+    assert benchmark(v, "abc") == "abc"
+
+
 @pytest.mark.benchmark(group="Str")
 def test_str_options(module, benchmark):
     v = module.Str(options=("abc", "xyz"))
     assert benchmark(v, "abc") == "abc"
 
 
+@pytest.mark.benchmark(group="Str")
+def test_str_normspace(module, benchmark):
+    v = module.Str(normspace=True)
+    assert benchmark(v, " a  b\tc ") == "a b c"
+
+
+@pytest.mark.benchmark(group="Str")
+def test_str_max_input_len(module, benchmark):
+    v = module.Str(normspace=True, maxlen=64, max_input_len=1024)
+
+    def validate(value):
+        try:
+            v(value)
+        except exc.MaxLengthError as e:
+            return e
+
+    e = benchmark(validate, "a  " * 10**6)
+    assert e.expected == 1024
+
+
 # =============================================================================
 
 
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 import pytest
 
 
@@ -25,6 +27,18 @@ def test_list_unique(module, benchmark):
     assert benchmark(v, [1, 2, 3, 3, 2, 1]) == [1, 2, 3]
 
 
+@pytest.mark.benchmark(group="List")
+def test_list_dontcopy(module, benchmark):
+    v = module.List(module.Int(), dontcopy=True)
+    assert benchmark(v, [1, 2, 3]) == [1, 2, 3]
+
+
+@pytest.mark.benchmark(group="List")
+def test_list_inplace(module, benchmark):
+    v = module.List(module.Int(), inplace=True)
+    assert benchmark(v, [1, 2, 3]) == [1, 2, 3]
+
+
 # =============================================================================
 
 
@@ -34,6 +48,12 @@ def test_tuple(module, benchmark):
     assert benchmark(v, (1, 2)) == (1, 2)
 
 
+@pytest.mark.benchmark(group="Tuple")
+def test_tuple_dontcopy(module, benchmark):
+    v = module.Tuple(module.Int(), module.Int(), dontcopy=True)
+    assert benchmark(v, (1, 2)) == (1, 2)
+
+
 @pytest.mark.benchmark(group="Tuple")
 def test_tuple_nullable(module, benchmark):
     v = module.Tuple(module.Int(), module.Int(), nullable=True)
@@ -49,6 +69,38 @@ def test_dict(module, benchmark):
     assert benchmark(v, {"x": 1, "y": 2}) == {"x": 1, "y": 2}
 
 
+@pytest.mark.benchmark(group="Dict")
+def test_dict_dontcopy(module, benchmark):
+    v = module.Dict({"x": module.Int(), "y": module.Int()}, dontcopy=True)
+    assert benchmark(v, {"x": 1, "y": 2}) == {"x": 1, "y": 2}
+
+
+@pytest.mark.benchmark(group="Dict")
+def test_dict_inplace(module, benchmark):
+    v = module.Dict(extra=(module.Str(), module.Int()), dispose=["z"], inplace=True)
+    assert benchmark(v, {"x": 1, "y": 2}) == {"x": 1, "y": 2}
+
+
+@dataclass
+class Point:
+    __slots__ = ("x", "y")
+    x: int
+    y: int
+
+
+@pytest.mark.benchmark(group="Dict")
+def test_dict_then_dataclass(module, benchmark):
+    v = module.Dict({"x": module.Int(), "y": module.Int()})
+    result = benchmark(lambda value: Point(**v(value)), {"x": 1, "y": 2})
+    assert result == Point(1, 2)
+
+
+@pytest.mark.benchmark(group="Dict")
+def test_dict_into_dataclass(module, benchmark):
+    v = module.Dict({"x": module.Int(), "y": module.Int()}, into=Point)
+    assert benchmark(v, {"x": 1, "y": 2}) == Point(1, 2)
+
+
 @pytest.mark.benchmark(group="Dict")
 def test_dict_nullable(module, benchmark):
     v = module.Dict({"x": module.Int(), "y": module.Int()}, nullable=True)
@@ -67,12 +119,35 @@ def test_dict_defaults(module, benchmark):
     assert benchmark(v, {"y": 2}) == {"x": 1, "y": 2}
 
 
+@pytest.mark.benchmark(group="Dict")
+def test_dict_defaults_mutable(module, benchmark):
+    v = module.Dict(
+        {"x": module.List(module.Int()), "y": module.Int()}, defaults={"x": [1, 2]}
+    )
+    assert benchmark(v, {"y": 2}) == {"x": [1, 2], "y": 2}
+
+
+@pytest.mark.benchmark(group="Dict")
+def test_dict_defaults_prevalidate(module, benchmark):
+    v = module.Dict(
+        {"x": module.Int(), "y": module.Int()}, defaults={"x": 1}, prevalidate=True
+    )
+    assert benchmark(v, {"y": 2}) == {"x": 1, "y": 2}
+
+
 @pytest.mark.benchmark(group="Dict")
 def test_dict_optional(module, benchmark):
     v = module.Dict({"x": module.Int(), "y": module.Int()}, optional=("x",))
     assert benchmark(v, {"y": 2}) == {"y": 2}
 
 
+@pytest.mark.benchmark(group="Dict")
+def test_dict_wide_sparse(module, benchmark):
+    keys = ["field_%s" % num for num in range(800)]
+    v = module.Dict({key: module.Int() for key in keys}, optional=keys[1:])
+    assert benchmark(v, {"field_0": 0}) == {"field_0": 0}
+
+
 @pytest.mark.benchmark(group="Dict")
 def test_dict_extra(module, benchmark):
     v = module.Dict(
@@ -85,3 +160,27 @@ def test_dict_extra(module, benchmark):
 def test_dict_dispose(module, benchmark):
     v = module.Dict({"x": module.Int(), "y": module.Int()}, dispose=("z",))
     assert benchmark(v, {"x": 1, "y": 2, "z": 3}) == {"x": 1, "y": 2}
+
+
+# =============================================================================
+
+
+@pytest.mark.benchmark(group="Loads")
+def test_loads(module, benchmark):
+    v = module.Dict({"x": module.List(module.Int()), "y": module.Str()})
+    assert benchmark(v.loads, b'{"x": [1, 2, 3], "y": "z"}') == {
+        "x": [1, 2, 3],
+        "y": "z",
+    }
+
+
+@pytest.mark.benchmark(group="Loads")
+def test_loads_inplace(module, benchmark):
+    v = module.Dict(
+        {"x": module.List(module.Int(), inplace=True), "y": module.Str()},
+        inplace=True,
+    )
+    assert benchmark(v.loads, b'{"x": [1, 2, 3], "y": "z"}') == {
+        "x": [1, 2, 3],
+        "y": "z",
+    }
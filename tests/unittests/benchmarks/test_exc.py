@@ -0,0 +1,105 @@
+import pytest
+
+from validx import exc
+
+
+def raises(v, value):
+    try:
+        v(value)
+    except exc.ValidationError as e:
+        return e
+
+
+# =============================================================================
+
+
+@pytest.mark.benchmark(group="Errors")
+def test_condition_error(benchmark):
+    e = benchmark(exc.InvalidTypeError, expected=int, actual=str)
+    assert e == exc.InvalidTypeError(expected=int, actual=str)
+
+
+@pytest.mark.benchmark(group="Errors")
+def test_mapping_key_error(benchmark):
+    e = benchmark(exc.MissingKeyError, "x")
+    assert e == exc.MissingKeyError("x")
+
+
+@pytest.mark.benchmark(group="Errors")
+def test_schema_error(benchmark):
+    def schema_error():
+        return exc.SchemaError(
+            [exc.MissingKeyError("x"), exc.ForbiddenKeyError("y")]
+        ).add_context("z")
+
+    e = benchmark(schema_error)
+    assert len(e) == 2
+
+
+# =============================================================================
+
+
+@pytest.mark.benchmark(group="Failed Validation")
+def test_failed_int(module, benchmark):
+    v = module.Int(max=10)
+    e = benchmark(raises, v, 20)
+    assert isinstance(e, exc.MaxValueError)
+
+
+@pytest.mark.benchmark(group="Failed Validation")
+def test_failed_list(module, benchmark):
+    v = module.List(module.Int(max=0))
+    e = benchmark(raises, v, list(range(1, 101)))
+    assert len(e) == 100
+
+
+@pytest.mark.benchmark(group="Failed Validation")
+def test_failed_nested(module, benchmark):
+    v = module.Dict({"x": module.List(module.Dict({"y": module.List(module.Int())}))})
+    data = {"x": [{"y": [None] * 10, "z": None}] * 10}
+    e = benchmark(raises, v, data)
+    assert len(e) == 110
+
+
+@pytest.mark.benchmark(group="Failed Validation")
+def test_failed_nested_format(module, benchmark):
+    v = module.Dict({"x": module.List(module.Dict({"y": module.List(module.Int())}))})
+    data = {"x": [{"y": [None] * 10, "z": None}] * 10}
+    result = benchmark(lambda: exc.format_error(raises(v, data)))
+    assert len(result) == 110
+
+
+@pytest.mark.benchmark(group="Failed Validation")
+def test_failed_nested_to_dicts(module, benchmark):
+    v = module.Dict({"x": module.List(module.Dict({"y": module.List(module.Int())}))})
+    data = {"x": [{"y": [None] * 10, "z": None}] * 10}
+    result = benchmark(lambda: exc.format_error.to_dicts(raises(v, data)))
+    assert len(result) == 110
+
+
+@pytest.mark.benchmark(group="Failed Validation")
+def test_failed_list_type(module, benchmark):
+    v = module.List(module.Int())
+    e = benchmark(raises, v, 1)
+    assert isinstance(e, exc.InvalidTypeError)
+
+
+@pytest.mark.benchmark(group="Failed Validation")
+def test_failed_dict_type(module, benchmark):
+    v = module.Dict({"x": module.Int()})
+    e = benchmark(raises, v, [1])
+    assert isinstance(e, exc.InvalidTypeError)
+
+
+@pytest.mark.benchmark(group="Failed Validation")
+def test_failed_list_maxlen(module, benchmark):
+    v = module.List(module.Int(), maxlen=100)
+    e = benchmark(raises, v, list(range(100000)))
+    assert isinstance(e, exc.MaxLengthError)
+
+
+@pytest.mark.benchmark(group="Failed Validation")
+def test_failed_dict_maxlen(module, benchmark):
+    v = module.Dict(extra=(module.Str(), module.Int()), maxlen=100)
+    e = benchmark(raises, v, {str(num): num for num in range(100000)})
+    assert isinstance(e, exc.MaxLengthError)
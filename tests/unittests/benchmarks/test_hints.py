@@ -0,0 +1,27 @@
+import typing as t
+from dataclasses import dataclass
+
+import pytest
+
+from validx import hints
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    tags: t.List[str]
+    price: t.Optional[float] = None
+
+
+@pytest.mark.benchmark(group="Type Hints")
+def test_from_type_cached(module, benchmark):
+    v = hints.from_type(Item, module.classes)
+    assert benchmark(hints.from_type, Item, module.classes) is v
+
+
+@pytest.mark.benchmark(group="Type Hints")
+def test_from_type_validate(module, benchmark):
+    v = hints.from_type(Item, module.classes)
+    data = {"id": 1, "name": "x", "tags": ["y"]}
+    assert benchmark(v, data) == Item(1, "x", ["y"])
@@ -0,0 +1,45 @@
+import pytest
+
+from validx import jsonschema
+
+
+doc = {
+    "type": "object",
+    "properties": {
+        "location": {
+            "type": "object",
+            "properties": {
+                "lat": {"type": "number", "minimum": -90, "maximum": 90},
+                "lng": {"type": "number", "minimum": -180, "maximum": 180},
+            },
+        },
+        "name": {"type": "string"},
+        "alt_names": {"type": "array", "items": {"type": "string"}},
+        "population": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "integer", "minimum": 0},
+                "metro": {"type": "integer", "minimum": 0},
+            },
+        },
+    },
+}
+
+data = {
+    "location": {"lat": 50.046_428_4, "lng": 19.724_694_2},
+    "name": "Kraków",
+    "alt_names": ["Krakow", "Cracow"],
+    "population": {"city": 766_739, "metro": 1_725_894},
+}
+
+
+@pytest.mark.benchmark(group="JSON Schema")
+def test_jsonschema_load(module, benchmark):
+    v = benchmark(jsonschema.load, doc, classes=module.classes)
+    assert v(data) == data
+
+
+@pytest.mark.benchmark(group="JSON Schema")
+def test_jsonschema_validate(module, benchmark):
+    v = jsonschema.load(doc, classes=module.classes)
+    assert benchmark(v, data) == data
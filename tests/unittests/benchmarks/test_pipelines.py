@@ -14,3 +14,52 @@ def test_all_of(module, benchmark):
 def test_any_of(module, benchmark):
     v = module.OneOf(module.Int(min=0), module.Int(min=10))
     assert benchmark(v, 1) == 1
+
+
+@pytest.mark.benchmark(group="OneOf")
+def test_one_of_last_step(module, benchmark):
+    v = module.OneOf(module.Int(), module.Float(), module.Str())
+    assert benchmark(v, "x") == "x"
+
+
+@pytest.mark.benchmark(group="OneOf")
+def test_one_of_last_step_adaptive(module, benchmark):
+    v = module.OneOf(module.Int(), module.Float(), module.Str(), adaptive=True)
+    assert benchmark(v, "x") == "x"
+
+
+@pytest.mark.benchmark(group="OneOf")
+def test_one_of_dispatch(module, benchmark):
+    v = module.OneOf(
+        module.Int(),
+        module.Str(),
+        module.Dict({"x": module.Int()}),
+        module.List(module.Int()),
+    )
+    assert benchmark(v, [1]) == [1]
+
+
+# =============================================================================
+
+
+def events(module):
+    return {
+        "event_%s" % num: module.Dict(
+            {"type": module.Const("event_%s" % num), "value": module.Int()}
+        )
+        for num in range(60)
+    }
+
+
+@pytest.mark.benchmark(group="Tagged")
+def test_tagged_one_of(module, benchmark):
+    v = module.OneOf(*events(module).values())
+    data = {"type": "event_59", "value": 1}
+    assert benchmark(v, data) == data
+
+
+@pytest.mark.benchmark(group="Tagged")
+def test_tagged(module, benchmark):
+    v = module.Tagged("type", events(module))
+    data = {"type": "event_59", "value": 1}
+    assert benchmark(v, data) == data
@@ -0,0 +1,62 @@
+import json
+from decimal import Decimal
+from datetime import date
+
+import pytest
+
+
+def default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(value)
+
+
+@pytest.fixture()
+def schema(module):
+    return module.List(
+        module.Dict(
+            {
+                "id": module.Int(),
+                "name": module.Str(),
+                "price": module.Decimal(),
+                "date": module.Date(),
+                "tags": module.List(module.Str()),
+            }
+        )
+    )
+
+
+@pytest.fixture()
+def data():
+    return [
+        {
+            "id": num,
+            "name": "item",
+            "price": Decimal("9.99"),
+            "date": date(2020, 1, 2),
+            "tags": ["x", "y", "z"],
+        }
+        for num in range(100)
+    ]
+
+
+@pytest.mark.benchmark(group="Serializer")
+def test_dumps_default(module, schema, data, benchmark):
+    result = benchmark(json.dumps, data, default=default)
+    assert len(json.loads(result)) == 100
+
+
+@pytest.mark.benchmark(group="Serializer")
+def test_dumps_serializer(module, schema, data, benchmark):
+    serialize = schema.serializer()
+    result = benchmark(lambda: json.dumps(serialize(data)))
+    assert len(json.loads(result)) == 100
+
+
+@pytest.mark.benchmark(group="Serializer")
+def test_dumps_probe(module, schema, data, benchmark):
+    serialize = module.Any().serializer()
+    result = benchmark(lambda: json.dumps(serialize(data)))
+    assert len(json.loads(result)) == 100
@@ -19,6 +19,42 @@ def test_lazyref_maxdepth(module, benchmark):
     assert benchmark(v, data) == data
 
 
+@pytest.mark.benchmark(group="LazyRef")
+def test_lazyref_deep(module, benchmark):
+    v = module.Dict(
+        {"x": module.Int(), "y": module.LazyRef("foo")},
+        alias="foo",
+        optional=("x", "y"),
+    )
+    data = {"x": 1}
+    for _ in range(500):
+        data = {"y": data}
+    assert benchmark(v, data) == data
+
+
+# =============================================================================
+
+
+@pytest.mark.benchmark(group="Budget")
+def test_budget_baseline(module, benchmark):
+    v = module.Dict({"x": module.List(module.Str()), "y": module.Int()})
+    data = {"x": ["abc"] * 100, "y": 1}
+    assert benchmark(v, data) == data
+
+
+@pytest.mark.benchmark(group="Budget")
+def test_budget(module, benchmark):
+    v = module.Budget(
+        module.Dict({"x": module.List(module.Str()), "y": module.Int()}),
+        maxnodes=1000,
+        maxchars=1000,
+        maxdepth=10,
+        timeout=1,
+    )
+    data = {"x": ["abc"] * 100, "y": 1}
+    assert benchmark(v, data) == data
+
+
 # =============================================================================
 
 
@@ -1,5 +1,11 @@
+import json
+import decimal
+from collections import deque
+
 import pytest
 
+from validx import exc
+
 
 def test_repr(module):
     v = module.Dict({"x": module.Int(min=0, max=100)}, nullable=True)
@@ -39,6 +45,22 @@ def test_load_dump(module):
     assert v1.dump() == data
 
 
+def test_loads(module):
+    v = module.Dict({"x": module.List(module.Int())})
+    assert v.loads('{"x": [1, 2]}') == {"x": [1, 2]}
+    assert v.loads(b'{"x": [1, 2]}') == {"x": [1, 2]}
+
+    v = module.Decimal()
+    assert v.loads("1.5", parse_float=decimal.Decimal) == decimal.Decimal("1.5")
+
+    with pytest.raises(exc.SchemaError) as info:
+        module.Dict({"x": module.Int()}).loads('{"x": "1"}')
+    assert info.value[0].context == deque(["x"])
+
+    with pytest.raises(json.JSONDecodeError):
+        v.loads("{")
+
+
 def test_clone(module):
     v = module.Int()
     assert v.clone(nullable=True) == module.Int(nullable=True)
@@ -113,6 +135,43 @@ def test_clone(module):
     )
 
 
+
+def test_clone_sharing(module):
+    x = module.Int(min=1)
+    y = module.Str(pattern="^a", options=["a", "ab"])
+    z = module.Tuple(module.Int(), module.OneOf(module.Int(), module.Str()))
+    v = module.Dict(
+        {"x": x, "y": y, "z": z}, optional=["y"], extra=(module.Str(), module.Int())
+    )
+
+    def clone(update):
+        result = v.clone(update)
+        assert result == v.load(v.dump(), update)
+        return result
+
+    c = clone({})
+    assert c is not v
+    assert c.schema["x"] is x
+    assert c.extra[0] is v.extra[0]
+
+    c = clone({"schema.x.max": 10})
+    assert c.schema["x"] == module.Int(min=1, max=10)
+    assert c.schema["y"] is y
+    assert c.schema["z"] is z
+    assert c.extra[1] is v.extra[1]
+
+    c = clone({"schema.y.options+": ["b"], "schema.z.items.1.steps-": [module.Str()]})
+    assert c.schema["x"] is x
+    assert c.schema["y"] == module.Str(pattern="^a", options=["a", "ab", "b"])
+    assert c.schema["z"].items[0] is z.items[0]
+    assert c.schema["z"].items[1] == module.OneOf(module.Int())
+    assert c.schema["z"].items[1].steps[0] is z.items[1].steps[0]
+
+    # Updates of scalar parameters are ignored, as well as by load
+    c = clone({"schema.x.min+": [5], "schema.y.pattern+": ["b"]})
+    assert c.schema["x"] == x
+    assert c.schema["y"] == y
+
 def test_alias(module):
     v1 = module.Int(alias="foo")
     assert module.instances.get("foo") is v1
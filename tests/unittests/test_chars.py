@@ -1,4 +1,5 @@
 import pickle
+import re
 
 import pytest
 
@@ -81,6 +82,14 @@ def test_normspace(module, normspace):
         assert v("a  b\xa0\t\n\r\tc") == "a  b\xa0\t\n\r\tc"
 
 
+
+def test_normspace_dontstrip(module):
+    v = module.Str(normspace=True, dontstrip=True)
+    assert v(" \t a  b\xa0\t\n\r\tc \n") == " a b c "
+
+    v = module.Str(normspace=True)
+    assert v(" \t a  b\xa0\x1c\u3000c \n") == "a b c"
+
 @pytest.mark.parametrize("encoding", [None, "utf-8"])
 def test_str_encoding(module, encoding):
     v = module.Str(encoding=encoding)
@@ -128,6 +137,26 @@ def test_str_minlen_maxlen(module, minlen, maxlen):
         assert info.value.actual == 6
 
 
+
+def test_str_max_input_len(module):
+    v = module.Str(max_input_len=5, encoding="utf-8", coerce=True)
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+    assert v(" abc ") == "abc"
+    assert v(b" abc ") == "abc"
+    assert v(12345) == "12345"
+
+    for value in [" abc  ", b" abc  ", 123456]:
+        with pytest.raises(exc.MaxLengthError) as info:
+            v(value)
+        assert info.value.expected == 5
+        assert info.value.actual == 6
+
+    # Input limit is checked before decoding
+    with pytest.raises(exc.MaxLengthError) as info:
+        v(b"\xff" * 6)
+    assert info.value.actual == 6
+
 @pytest.mark.parametrize("pattern", [None, "(?i)^[a-z]+$"])
 def test_str_pattern(module, pattern):
     v = module.Str(pattern=pattern)
@@ -145,6 +174,54 @@ def test_str_pattern(module, pattern):
         assert info.value.actual == "123"
 
 
+def test_str_pattern_compiled(module):
+    v = module.Str(pattern=re.compile("^[a-z]+$", re.I | re.M))
+    assert v.pattern == "(?im)^[a-z]+$"
+    assert dict(v.params()) == {"pattern": "(?im)^[a-z]+$"}
+    assert v("ABC") == "ABC"
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    v = module.Str(pattern=re.compile("(?i)^[a-z]+$", re.I))
+    assert v.pattern == "(?i)^[a-z]+$"
+
+    with pytest.raises(TypeError) as info:
+        module.Str(pattern=re.compile(b"^[a-z]+$"))
+    assert info.value.args == (
+        "%s.Str.pattern should be of type %r" % (module.Str.__module__, str),
+    )
+
+
+@pytest.mark.parametrize(
+    "match, valid, invalid",
+    [
+        (None, ["abc", "abc1"], ["1abc"]),
+        ("prefix", ["abc", "abc1"], ["1abc"]),
+        ("full", ["abc"], ["abc1", "1abc"]),
+        ("search", ["abc", "abc1", "1abc"], ["123"]),
+    ],
+)
+def test_str_pattern_match(module, match, valid, invalid):
+    v = module.Str(pattern="[a-z]+", match=match)
+    assert v.match == match
+    for value in valid:
+        assert v(value) == value
+    for value in invalid:
+        with pytest.raises(exc.PatternMatchError) as info:
+            v(value)
+        assert info.value.expected == "[a-z]+"
+        assert info.value.actual == value
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    with pytest.raises(ValueError) as info:
+        module.Str(pattern="[a-z]+", match="exact")
+    assert info.value.args == (
+        "%s.Str.match should be one of ('full', 'prefix', 'search')"
+        % module.Str.__module__,
+    )
+
+
 @pytest.mark.parametrize("options", [None, ["abc", "xyz"]])
 def test_str_options(module, options):
     v = module.Str(options=options)
@@ -16,7 +16,7 @@ def test_public_names(module):
 
         obj = getattr(module, name)
 
-        if inspect.isclass(obj) and not name == "Validator":
+        if inspect.isclass(obj) and name not in ("Validator", "ValidationContext"):
             assert module.classes.get(name) is obj
             assert issubclass(obj, module.Validator)
 
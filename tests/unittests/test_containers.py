@@ -1,6 +1,9 @@
 import pickle
+import itertools
 from collections import OrderedDict, defaultdict, deque
-from collections.abc import Sequence, Mapping, Iterable
+from collections.abc import Sequence, Mapping, Iterable, Callable
+from dataclasses import dataclass
+from typing import NamedTuple
 
 import pytest
 
@@ -227,6 +230,74 @@ def test_list_unique(module, unique):
         assert v([1, 2, 3, 3, 2, 1]) == [1, 2, 3, 3, 2, 1]
 
 
+def test_list_dontcopy(module):
+    v = module.List(module.Str(), dontcopy=True)
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    value = ["x", "y"]
+    assert v(value) is value
+
+    value = ["x", " y ", "z"]
+    result = v(value)
+    assert result == ["x", "y", "z"]
+    assert value == ["x", " y ", "z"]
+
+    value = ("x", "y")
+    assert v(value) == ["x", "y"]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v(["x", None])
+    assert info.value[0].context == deque([1])
+
+    v = module.List(module.Str(), unique=True, dontcopy=True)
+    value = ["x", "y", "x"]
+    assert v(value) == ["x", "y"]
+    assert value == ["x", "y", "x"]
+
+    v = module.List(module.Str(), sort=1, dontcopy=True)
+    value = ["x", "y"]
+    result = v(value)
+    assert result == ["x", "y"]
+    assert result is not value
+
+
+def test_list_inplace(module):
+    v = module.List(module.Str(), inplace=True)
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    value = ["x", " y ", "z"]
+    assert v(value) is value
+    assert value == ["x", "y", "z"]
+
+    value = ("x", " y ")
+    assert v(value) == ["x", "y"]
+
+    value = [" x ", None]
+    with pytest.raises(exc.SchemaError) as info:
+        v(value)
+    assert info.value[0].context == deque([1])
+    assert value == ["x", None]
+
+    v = module.List(module.Str(), unique=True, sort=-1, inplace=True)
+    value = ["x", " y ", "x", "z", "y"]
+    assert v(value) is value
+    assert value == ["z", "y", "x"]
+
+    v = module.List(module.Str(), unique=True, minlen=2, inplace=True)
+    with pytest.raises(exc.MinLengthError) as info:
+        v(["x", "x"])
+    assert info.value.expected == 2
+    assert info.value.actual == 1
+
+    v = module.List(module.Str(), maxlen=1, inplace=True)
+    with pytest.raises(exc.MaxLengthError) as info:
+        v(["x", "y"])
+    assert info.value.expected == 1
+    assert info.value.actual == 2
+
+
 def test_list_context(module):
     class MarkContext(module.Validator):
         def __call__(self, value, __context=None):
@@ -421,6 +492,21 @@ def test_tuple_nullable(module, nullable):
         assert info.value.actual == NoneType
 
 
+def test_tuple_dontcopy(module):
+    v = module.Tuple(module.Str(), module.Int(), dontcopy=True)
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    value = ("x", 1)
+    assert v(value) is value
+    assert v((" x ", 1)) == ("x", 1)
+    assert v(["x", 1]) == ("x", 1)
+
+    with pytest.raises(exc.SchemaError) as info:
+        v(("x", None))
+    assert info.value[0].context == deque([1])
+
+
 def test_tuple_context(module):
     class MarkContext(module.Validator):
         def __call__(self, value, __context=None):
@@ -583,6 +669,370 @@ def test_dict_defaults_validation(module):
     assert info.value[0].actual == list
 
 
+def test_dict_defaults_factories(module):
+    v = module.Dict(
+        {
+            "a": module.Any(),
+            "b": module.Any(),
+            "c": module.Any(),
+            "d": module.Any(),
+        },
+        defaults={"a": ("x", 1), "b": [], "c": [{"x": 1}], "d": list, "e": 1},
+    )
+    first = v({})
+    second = v({})
+    assert first == second == {"a": ("x", 1), "b": [], "c": [{"x": 1}], "d": []}
+    assert first["a"] is second["a"]
+    assert first["b"] is not second["b"]
+    assert first["c"] is not second["c"]
+    assert first["c"][0] is not second["c"][0]
+    assert first["d"] is not second["d"]
+
+
+def test_dict_defaults_prevalidate(module):
+    calls = []
+
+    class Counted(module.Validator):
+        def __call__(self, value, __context=None):
+            calls.append(value)
+            return value
+
+    v = module.Dict(
+        {"x": Counted(), "y": module.Str(), "z": module.List(module.Int())},
+        defaults={"x": (1, 2), "y": " a ", "z": (3,)},
+        prevalidate=True,
+    )
+    assert calls == [(1, 2)]
+
+    assert v({}) == {"x": (1, 2), "y": "a", "z": [3]}
+    assert v({}) == {"x": (1, 2), "y": "a", "z": [3]}
+    assert calls == [(1, 2)]
+    assert v({})["z"] is not v({})["z"]
+
+    v = module.Dict({"x": module.Int(min=1)}, defaults={"x": 0}, prevalidate=True)
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+    with pytest.raises(exc.SchemaError) as info:
+        v({})
+    assert isinstance(info.value[0], exc.MinValueError)
+    assert info.value[0].context == deque(["x"])
+
+    # Defaults of referenced validators are validated on each use,
+    # since the referenced validator is not registered yet, or can be replaced
+    v = module.Dict(
+        {"a": module.LazyRef("later"), "b": module.List(module.LazyRef("node"))},
+        defaults={"a": 1, "b": ()},
+        optional=["b"],
+        prevalidate=True,
+        alias="node",
+    )
+    module.Int(alias="later")
+    assert v({}) == {"a": 1, "b": []}
+    module.Int(min=2, alias="later", replace=True)
+    with pytest.raises(exc.SchemaError) as info:
+        v({})
+    assert isinstance(info.value[0], exc.MinValueError)
+
+    v = module.Dict(
+        {"a": module.OneOf(module.Dict({"x": module.LazyRef("later")}), module.Int())},
+        defaults={"a": 1},
+        prevalidate=True,
+    )
+    assert v({}) == {"a": 1}
+
+
+def test_dict_missing_keys_order(module):
+    v = module.Dict(
+        {key: module.Int() for key in "abcdef"},
+        defaults={"b": 2, "e": 5, "f": 6},
+        optional=["c", "d", "f"],
+    )
+    result = v({"a": 1, "d": 4})
+    assert result == {"a": 1, "b": 2, "d": 4, "e": 5, "f": 6}
+    assert list(result) == ["a", "d", "b", "e", "f"]
+
+    v = module.Dict({key: module.Int() for key in "zyx"}, defaults={"y": 2})
+    with pytest.raises(exc.SchemaError) as info:
+        v({})
+    assert [e.context for e in info.value] == [deque(["z"]), deque(["x"])]
+
+
+def test_dict_exact_keys(module):
+    v = module.Dict({"x": module.Int(), "y": module.Int()})
+    assert v({"y": 2, "x": 1}) == {"y": 2, "x": 1}
+    assert list(v({"y": 2, "x": 1})) == ["y", "x"]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({"x": None, "y": None})
+    assert [e.context for e in info.value] == [deque(["x"]), deque(["y"])]
+
+    # Length limits are checked even if keys match the schema
+    v = module.Dict({"x": module.Int()}, extra=(module.Str(), module.Int()), minlen=2)
+    assert v({"x": 1, "y": 2}) == {"x": 1, "y": 2}
+    with pytest.raises(exc.MinLengthError):
+        v({"x": 1})
+    v = module.Dict({"x": module.Int(), "y": module.Int()}, optional=["y"], maxlen=1)
+    assert v({"x": 1}) == {"x": 1}
+    with pytest.raises(exc.MaxLengthError):
+        v({"x": 1, "y": 2})
+
+    # Disposed keys are removed even if they are specified in the schema
+    v = module.Dict({"x": module.Int(), "y": module.Int()}, dispose=["y"])
+    with pytest.raises(exc.SchemaError) as info:
+        v({"x": 1, "y": 2})
+    assert isinstance(info.value[0], exc.MissingKeyError)
+    assert info.value[0].context == deque(["y"])
+
+
+def test_dict_dontcopy(module):
+    v = module.Dict({"x": module.Str(), "y": module.Str()}, dontcopy=True)
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    value = {"x": "a", "y": "b"}
+    assert v(value) is value
+
+    value = {"x": " a ", "y": "b"}
+    result = v(value)
+    assert result == {"x": "a", "y": "b"}
+    assert value == {"x": " a ", "y": "b"}
+
+    value = {"y": "b", "x": " a "}
+    assert list(v(value)) == ["y", "x"]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({"x": None, "y": "b"})
+    assert info.value[0].context == deque(["x"])
+
+    v = module.Dict(
+        {"x": module.Str(), "y": module.Str()},
+        extra=(module.Str(), module.Str()),
+        defaults={"y": "b"},
+        dispose=["z"],
+        dontcopy=True,
+    )
+    value = {"x": "a", "y": "b", "w": "c"}
+    assert v(value) is value
+
+    value = {"x": "a", "y": "b", " w ": "c", "v": "d"}
+    result = v(value)
+    assert result == {"x": "a", "y": "b", "w": "c", "v": "d"}
+    assert list(result) == ["x", "y", "w", "v"]
+    assert value == {"x": "a", "y": "b", " w ": "c", "v": "d"}
+
+    value = {"x": "a", "y": "b", "z": "c", "w": "d"}
+    result = v(value)
+    assert result == {"x": "a", "y": "b", "w": "d"}
+    assert value == {"x": "a", "y": "b", "z": "c", "w": "d"}
+
+    value = {"x": "a"}
+    result = v(value)
+    assert result == {"x": "a", "y": "b"}
+    assert value == {"x": "a"}
+
+    value = OrderedDict({"x": "a", "y": "b"})
+    result = v(value)
+    assert result == {"x": "a", "y": "b"}
+    assert type(result) is dict
+
+
+def test_dict_inplace(module):
+    v = module.Dict({"x": module.Str(), "y": module.Str()}, inplace=True)
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    value = {"x": " a ", "y": "b"}
+    assert v(value) is value
+    assert value == {"x": "a", "y": "b"}
+
+    value = OrderedDict({"x": " a ", "y": "b"})
+    result = v(value)
+    assert result == {"x": "a", "y": "b"}
+    assert type(result) is dict
+    assert value == {"x": " a ", "y": "b"}
+
+    v = module.Dict(
+        {"x": module.Str(), "y": module.Str()},
+        extra=(module.Str(), module.Str()),
+        defaults={"y": "b"},
+        dispose=["z"],
+        inplace=True,
+    )
+    value = {"x": " a ", "z": "c", " w ": " d ", "v": "e"}
+    assert v(value) is value
+    assert value == {"x": "a", "w": "d", "v": "e", "y": "b"}
+
+    value = {"x": None, "u": None, None: "f"}
+    with pytest.raises(exc.SchemaError) as info:
+        v(value)
+    assert [e.context for e in info.value] == [
+        deque(["x"]),
+        deque(["u", exc.EXTRA_VALUE]),
+        deque([None, exc.EXTRA_KEY]),
+    ]
+
+    v = module.Dict({"x": module.Int()}, inplace=True)
+    with pytest.raises(exc.SchemaError) as info:
+        v({"y": 1})
+    assert [type(e) for e in info.value] == [
+        exc.ForbiddenKeyError,
+        exc.MissingKeyError,
+    ]
+
+    v = module.Dict(extra=(module.Str(), module.Int()), minlen=2, inplace=True)
+    with pytest.raises(exc.MinLengthError) as info:
+        v({"x": 1})
+    assert info.value.expected == 2
+    assert info.value.actual == 1
+
+    v = module.Dict(extra=(module.Str(), module.Int()), maxlen=1, inplace=True)
+    with pytest.raises(exc.MaxLengthError) as info:
+        v({"x": 1, "y": 2})
+    assert info.value.expected == 1
+    assert info.value.actual == 2
+
+
+class PointTuple(NamedTuple):
+    x: int
+    y: int
+
+
+@dataclass
+class PointData:
+    x: int
+    y: int = 0
+
+
+class PointSlots(object):
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y=0):
+        self.x = x
+        self.y = y
+
+
+def test_dict_into(module):
+    v = module.Dict(
+        {"x": module.Int(coerce=True), "y": module.Int(coerce=True)}, into=PointTuple
+    )
+    assert v.into is PointTuple
+    assert dict(v.params())["into"] is PointTuple
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+    assert v({"x": 1, "y": 2}) == PointTuple(1, 2)
+    assert v({"y": "2", "x": 1.0}) == PointTuple(1, 2)
+
+    v = module.Dict(
+        {"x": module.Int(), "y": module.Int()},
+        optional=["y"],
+        nullable=True,
+        into=PointData,
+    )
+    assert v({"x": 1, "y": 2}) == PointData(1, 2)
+    assert v({"x": 1}) == PointData(1)
+    assert v(OrderedDict({"x": 1})) == PointData(1)
+    assert v(None) is None
+    with pytest.raises(exc.SchemaError) as info:
+        v({"x": None})
+    assert info.value[0].context == deque(["x"])
+
+    v = module.Dict(
+        {"x": module.Int(coerce=True), "y": module.Int()},
+        defaults={"y": 2},
+        dispose=["z"],
+        into=PointSlots,
+    )
+    value = {"x": "1", "z": None}
+    result = v(value)
+    assert type(result) is PointSlots
+    assert (result.x, result.y) == (1, 2)
+    assert value == {"x": "1", "z": None}
+
+    v = module.Dict({"x": module.Int()}, extra=(module.Str(), module.Int()), into=dict)
+    assert v({"x": 1, "y": 2}) == {"x": 1, "y": 2}
+
+    v = module.Dict(
+        {"x": module.Int(coerce=True), "y": module.Int()}, inplace=True, into=PointData
+    )
+    value = {"x": "1", "y": 2}
+    assert v(value) == PointData(1, 2)
+    assert value == {"x": 1, "y": 2}
+
+    value = OrderedDict({"x": "1", "y": 2})
+    assert v(value) == PointData(1, 2)
+    assert value == {"x": "1", "y": 2}
+
+    with pytest.raises(TypeError) as info:
+        module.Dict({"x": module.Int()}, into=1)
+    assert info.value.args == (
+        "%s.Dict.into should be of type %r" % (module.Dict.__module__, Callable),
+    )
+
+
+def test_dict_into_signature(module):
+    with pytest.raises(ValueError) as info:
+        module.Dict(
+            {"x": module.Int()}, extra=(module.Str(), module.Int()), into=PointData
+        )
+    assert info.value.args == (
+        "%s.Dict.into should accept arbitrary keyword arguments along with extra"
+        % module.Dict.__module__,
+    )
+
+    for into in (PointTuple, PointData, PointSlots):
+        with pytest.raises(ValueError) as info:
+            module.Dict(
+                {"x": module.Int(), "y": module.Int()}, optional=["x"], into=into
+            )
+        assert info.value.args == (
+            "%s.Dict.into should provide defaults of keys %r, that may be missing"
+            % (module.Dict.__module__, ["x"]),
+        )
+    with pytest.raises(ValueError) as info:
+        module.Dict({"y": module.Int()}, into=PointTuple)
+    assert info.value.args[0].endswith("keys ['x'], that may be missing")
+
+    # Keys with defaults of the validator do not need defaults of the class
+    v = module.Dict(
+        {"x": module.Int()}, optional=["x"], defaults={"x": 1}, into=PointSlots
+    )
+    assert v({}).x == 1
+
+    def build(x, **kw):
+        return (x, kw)
+
+    v = module.Dict({"x": module.Int()}, extra=(module.Str(), module.Int()), into=build)
+    assert v({"x": 1, "y": 2}) == (1, {"y": 2})
+
+    # Errors of unchecked signature are reported on validation
+    v = module.Dict({"x": module.Int()}, optional=["x"], into=build)
+    with pytest.raises(exc.CoerceError) as info:
+        v({})
+    assert info.value.expected is build
+    assert info.value.actual == {}
+
+    v = module.Dict(extra=(module.Int(), module.Int()), into=dict)
+    with pytest.raises(exc.CoerceError) as info:
+        v({1: 1})
+    assert info.value.expected is dict
+    assert info.value.actual == {1: 1}
+
+    class Point(PointSlots):
+        def __init__(self, x, y=0):
+            if x < 0:
+                raise ValueError(x)
+            super().__init__(x, y)
+
+    v = module.Dict({"x": module.Int(), "y": module.Int()}, into=Point)
+    for data in ({"x": -1, "y": 0}, {"y": 0, "x": -1}):
+        with pytest.raises(exc.CoerceError) as info:
+            v(data)
+        assert info.value.actual == {"x": -1, "y": 0}
+    v = module.Dict({"x": module.Int(), "y": module.Int()}, inplace=True, into=Point)
+    with pytest.raises(exc.CoerceError):
+        v({"x": -1, "y": 0})
+
+
 def test_dict_defaults_and_minlen_maxlen(module):
     v = module.Dict(
         {"x": module.Int()},
@@ -702,3 +1152,80 @@ def test_dict_context(module):
     context = {}
     v({"x": None}, context)
     assert context["marked"]
+
+
+@pytest.mark.parametrize(
+    "value", [None, True, 1, 1.0, "x", b"x", {"x": 1}, [1], (1,), {1}, frozenset([1])]
+)
+def test_containers_builtin_types(module, value):
+    # Builtin types are checked without ``collections.abc``,
+    # but results must be the same.
+    validators = [
+        (module.List(module.Any()), Iterable, (list, tuple, set, frozenset)),
+        (module.Set(module.Any()), Iterable, (list, tuple, set, frozenset)),
+        (module.Tuple(module.Any()), Sequence, (list, tuple)),
+        (module.Dict(extra=(module.Any(), module.Any())), Mapping, (dict,)),
+    ]
+    for v, expected, accepted in validators:
+        if isinstance(value, accepted):
+            v(value)
+            continue
+        with pytest.raises(exc.InvalidTypeError) as info:
+            v(value)
+        assert info.value.expected == expected
+        assert info.value.actual == type(value)
+
+
+def test_containers_early_maxlen(module):
+    # Oversized values are rejected before all of their items are validated
+    v = module.List(module.Int(max=0), maxlen=2)
+    with pytest.raises(exc.MaxLengthError) as info:
+        v([1, 1, 1])
+    assert info.value.actual == 3
+
+    v = module.List(module.Int(), maxlen=3)
+    with pytest.raises(exc.MaxLengthError) as info:
+        v(itertools.count())
+    assert info.value.expected == 3
+    assert info.value.actual == 4
+
+    # Invalid items are counted too
+    v = module.List(module.Int(max=0), maxlen=3)
+    with pytest.raises(exc.MaxLengthError) as info:
+        v(itertools.count(1))
+    assert info.value.actual == 4
+
+    v = module.List(module.Int(), maxlen=2, unique=True)
+    with pytest.raises(exc.MaxLengthError) as info:
+        v(itertools.cycle([1, 2, 3]))
+    assert info.value.actual == 3
+
+    v = module.List(module.Int(), maxlen=2, unique=True, inplace=True)
+    with pytest.raises(exc.MaxLengthError) as info:
+        v([1, 1, 2, 3, "4"])
+    assert info.value.actual == 3
+
+    v = module.Set(module.Int(), maxlen=2)
+    with pytest.raises(exc.MaxLengthError) as info:
+        v(itertools.count())
+    assert info.value.actual == 3
+
+    value = {"a": 0, "b": 0, "c": 0, "d": 1}
+    for params in [{}, {"dontcopy": True}, {"inplace": True}]:
+        v = module.Dict(extra=(module.Str(), module.Int(max=0)), maxlen=2, **params)
+        with pytest.raises(exc.MaxLengthError) as info:
+            v(dict(value))
+        assert info.value.expected == 2
+        assert info.value.actual == 3
+
+    # Defaults are added after iteration, so the result is checked again
+    v = module.Dict(
+        {"x": module.Int()},
+        defaults={"x": 1},
+        extra=(module.Str(), module.Int()),
+        maxlen=1,
+        inplace=True,
+    )
+    with pytest.raises(exc.MaxLengthError) as info:
+        v({"y": 2})
+    assert info.value.actual == 2
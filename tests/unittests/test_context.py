@@ -0,0 +1,128 @@
+from collections.abc import MutableMapping
+
+import pytest
+
+
+def test_context_mapping(module):
+    context = module.ValidationContext()
+    assert isinstance(context, MutableMapping)
+    assert context.data is None
+    assert len(context) == 0
+    assert list(context) == []
+    assert "x" not in context
+    assert context.get("x") is None
+    assert context.get("x", 1) == 1
+    assert context.pop("x", 1) == 1
+    with pytest.raises(KeyError):
+        context["x"]
+    with pytest.raises(KeyError):
+        del context["x"]
+    with pytest.raises(KeyError):
+        context.pop("x")
+    assert context.data is None
+    assert repr(context) == "<ValidationContext({})>"
+
+    context["x"] = 1
+    assert context.setdefault("x", 2) == 1
+    assert context.setdefault("y", 2) == 2
+    assert context.data == {"x": 1, "y": 2}
+    assert len(context) == 2
+    assert "x" in context
+    assert context["x"] == 1
+    assert list(context.keys()) == ["x", "y"]
+    assert list(context.values()) == [1, 2]
+    assert list(context.items()) == [("x", 1), ("y", 2)]
+    assert repr(context) == "<ValidationContext({'x': 1, 'y': 2})>"
+
+    del context["x"]
+    assert context.pop("y") == 2
+    assert context.data == {}
+
+
+def test_context_mutable_mapping(module):
+    context = module.ValidationContext()
+    assert context == {}
+    assert context == module.ValidationContext({})
+    assert not context != {}
+    assert context != {"x": 1}
+    assert not context == []
+    assert context != []
+    with pytest.raises(KeyError):
+        context.popitem()
+    context.clear()
+    assert context.data is None
+    assert context.copy() == {}
+
+    context.update({"x": 1}, y=2)
+    context.update([("z", 3)])
+    assert context == {"x": 1, "y": 2, "z": 3}
+    assert context == module.ValidationContext({"x": 1, "y": 2, "z": 3})
+    assert context != module.ValidationContext({"x": 1})
+    assert context.popitem() == ("z", 3)
+
+    copy = context.copy()
+    assert type(copy) is dict
+    assert copy == {"x": 1, "y": 2}
+    copy["z"] = 3
+    assert "z" not in context
+
+    data = context.data
+    context.clear()
+    assert context.data is data
+    assert data == {}
+
+
+def test_context_data(module):
+    data = {"x": 1}
+    context = module.ValidationContext(data)
+    context["y"] = 2
+    assert data == {"x": 1, "y": 2}
+
+
+def test_context_setup(module):
+    setup_context = module.context.setup_context
+
+    context = module.ValidationContext()
+    assert setup_context(context) is context
+
+    context = setup_context(None)
+    assert isinstance(context, module.ValidationContext)
+    assert context.data is None
+
+    data = {}
+    context = setup_context(data)
+    assert context.data is data
+    assert context.depth == 0
+    assert context.recursion is None
+    assert context.budget is None
+    assert context.outcomes is None
+
+
+def test_context_validators(module):
+    contexts = []
+
+    class Collect(module.Validator):
+        def __call__(self, value, __context=None):
+            contexts.append(__context)
+            __context["marked"] = True
+            return value
+
+    Collect(alias="collect")
+    v = module.Budget(module.List(module.LazyRef("collect", maxdepth=1)), maxnodes=10)
+
+    data = {}
+    assert v([1, 2], data) == [1, 2]
+    assert data == {"marked": True}
+    assert len(contexts) == 2
+    context = contexts[0]
+    assert context is contexts[1]
+    assert isinstance(context, module.ValidationContext)
+    assert context.data is data
+    assert context.depth == 0
+    assert context.recursion == {"collect": 0}
+    assert context.budget is None
+
+    context = module.ValidationContext()
+    assert v([1], context) == [1]
+    assert contexts[-1] is context
+    assert context.data == {"marked": True}
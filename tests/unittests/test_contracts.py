@@ -96,6 +96,18 @@ def test_expect_str():
         ("%s.ContextMock.attr should be of type %r" % (ContextMock.__module__, str)),
     )
 
+    assert c("abc", options=("abc", "xyz")) == "abc"
+    assert c(None, nullable=True, options=("abc", "xyz")) is None
+
+    with pytest.raises(ValueError) as info:
+        c("123", options=("abc", "xyz"))
+    assert info.value.args == (
+        (
+            "%s.ContextMock.attr should be one of %r"
+            % (ContextMock.__module__, ("abc", "xyz"))
+        ),
+    )
+
 
 def test_expect_callable():
     def somefunc():
@@ -0,0 +1,262 @@
+import itertools
+import sys
+from collections import deque
+
+import pytest
+
+from validx import exc, engine
+
+
+def nested(depth, leaf, wrap):
+    data = leaf
+    for _ in range(depth):
+        data = wrap(data)
+    return data
+
+
+def outcome(v, data, context=None):
+    try:
+        return v(data, context), None
+    except exc.ValidationError as e:
+        e.sort()
+        return None, repr(e)
+
+
+@pytest.fixture()
+def recursive(monkeypatch):
+    # Validates data by plain recursion of validator calls
+    def recursive(v, data, context=None):
+        with monkeypatch.context() as patch:
+            patch.setattr(engine, "DEPTH_THRESHOLD", sys.maxsize)
+            limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(100000)
+            try:
+                return outcome(v, data, context)
+            finally:
+                sys.setrecursionlimit(limit)
+
+    return recursive
+
+
+def test_deep_data(module):
+    v = module.Dict(
+        {"x": module.LazyRef("node"), "y": module.Int()},
+        optional=["x"],
+        alias="node",
+    )
+    data = nested(5000, {"y": 1}, lambda data: {"x": data, "y": 1})
+    result = v(data)
+    for _ in range(5000):
+        assert result is not data
+        assert result["y"] == 1
+        result, data = result["x"], data["x"]
+    assert result == {"y": 1}
+
+    data = nested(5000, {"y": None}, lambda data: {"x": data, "y": 1})
+    with pytest.raises(exc.SchemaError) as info:
+        v(data)
+    assert len(info.value) == 1
+    assert isinstance(info.value[0], exc.InvalidTypeError)
+    assert info.value[0].context == deque(["x"] * 5000 + ["y"])
+
+
+def test_same_outcome(module, recursive):
+    module.Tagged(
+        "kind",
+        {
+            "list": module.Dict(
+                {"kind": module.Str(), "items": module.List(module.LazyRef("node"))}
+            ),
+            "pair": module.Dict(
+                {
+                    "kind": module.Str(),
+                    "pair": module.Tuple(module.LazyRef("node"), module.Int()),
+                },
+                dispose=["comment"],
+            ),
+            "any": module.Dict(
+                {"kind": module.Str()},
+                extra=(
+                    module.Str(),
+                    module.OneOf(
+                        module.Int(),
+                        module.AllOf(module.LazyRef("node"), module.Any()),
+                    ),
+                ),
+            ),
+            "set": module.Dict(
+                {
+                    "kind": module.Str(),
+                    "set": module.Set(module.Int()),
+                    "next": module.LazyRef("node"),
+                }
+            ),
+        },
+        alias="node",
+    )
+    v = module.Budget(module.LazyRef("node"), maxnodes=10000, maxdepth=1000)
+
+    kinds = itertools.cycle(["list", "pair", "any", "set"])
+
+    def wrap(data):
+        return {
+            "list": lambda: {"kind": "list", "items": [data]},
+            "pair": lambda: {"kind": "pair", "pair": [data, 1], "comment": data},
+            "any": lambda: {"kind": "any", "x": data, "y": 1},
+            "set": lambda: {"kind": "set", "set": {1, 2}, "next": data},
+        }[next(kinds)]()
+
+    for leaf in (
+        {"kind": "list", "items": []},
+        {"kind": "any"},
+        {"kind": "any", "x": None},
+        {"kind": "pair", "pair": [{"kind": "any"}, None]},
+        {"kind": "set", "set": [None], "next": {"kind": "any"}},
+        {"kind": "set", "set": None, "next": {"kind": "any"}},
+        {"kind": "pair", "pair": [{"kind": "any"}, 1, 2]},
+        {"kind": []},
+        {"kind": "unknown"},
+        [],
+    ):
+        data = nested(150, leaf, wrap)
+        expected = recursive(v, data)
+        assert outcome(v, data) == expected
+
+        # The same object is validated twice
+        data = {"kind": "list", "items": [data, data]}
+        expected = recursive(v, data)
+        assert outcome(v, data) == expected
+
+
+def test_same_outcome_maxdepth(module, recursive):
+    v = module.Dict(
+        {"x": module.List(module.LazyRef("node", maxdepth=110))},
+        alias="node",
+    )
+    for depth in (100, 120):
+        for leaf in ({"x": []}, {"x": None}, {"x": [None]}):
+            data = nested(depth, leaf, lambda data: {"x": [data]})
+            expected = recursive(v, data)
+            assert outcome(v, data) == expected
+
+    v = module.Budget(v, maxdepth=105)
+    for depth in (100, 120):
+        for leaf in ({"x": []}, {"x": None}, {"x": [None]}):
+            data = nested(depth, leaf, lambda data: {"x": [data]})
+            expected = recursive(v, data)
+            assert outcome(v, data) == expected
+
+
+def test_same_outcome_context(module, recursive):
+    v = module.Dict({"x": module.LazyRef("node")}, optional=["x"], alias="node")
+    data = nested(120, {}, lambda data: {"x": data})
+
+    context = {}
+    expected = recursive(v, data, context)
+    assert context == {}
+
+    context = {}
+    assert outcome(v, data, context) == expected
+    assert context == {}
+
+
+def test_same_outcome_branches(module, recursive):
+    v = module.OneOf(
+        module.Dict(
+            {"kind": module.Const("a"), "child": module.LazyRef("node")},
+            optional=["child"],
+        ),
+        module.Dict(
+            {"kind": module.Const("b"), "child": module.LazyRef("node")},
+            optional=["child"],
+        ),
+        module.List(module.LazyRef("node")),
+        alias="node",
+    )
+
+    def wrap(data):
+        return {"kind": "a", "child": [data]}
+
+    for leaf in ({"kind": "b"}, [], [{"kind": "b"}]):
+        data = nested(120, leaf, wrap)
+        expected = recursive(v, data)
+        assert outcome(v, data) == expected
+
+        # Errors are at the top, while deep data is shared by the variants
+        data = {"kind": "c", "child": data}
+        expected = recursive(v, data)
+        assert outcome(v, data) == expected
+
+    # Each variant meets validated data, instead of descending again
+    data = nested(5000, {"kind": "b"}, lambda data: {"kind": "a", "child": data})
+    result = v(data)
+    for _ in range(5000):
+        assert result["kind"] == "a"
+        result = result["child"]
+    assert result == {"kind": "b"}
+
+
+def test_same_outcome_all_of(module, recursive):
+    v = module.AllOf(
+        module.Type(list),
+        module.Const([[]]),
+        module.List(module.LazyRef("node")),
+        alias="node",
+    )
+    for depth in (100, 120):
+        data = nested(depth, [], lambda data: [data])
+        expected = recursive(v, data)
+        assert outcome(v, data) == expected
+
+    # Steps after the ones, which return the value itself, are walked too
+    v = module.AllOf(
+        module.Type(list), module.Any(), module.List(module.LazyRef("node"))
+    )
+    module.AllOf(v, alias="node", replace=True)
+    for leaf in ([], [None]):
+        data = nested(120, leaf, lambda data: [data])
+        expected = recursive(v, data)
+        assert outcome(v, data) == expected
+
+    data = nested(5000, [], lambda data: [data])
+    result = v(data)
+    for _ in range(5000):
+        assert result is not data
+        assert len(result) == 1
+        result, data = result[0], data[0]
+    assert result == []
+
+    # Coerced value is not walked by next steps
+    v = module.AllOf(
+        module.Type(list, coerce=True), module.List(module.LazyRef("node"))
+    )
+    module.AllOf(v, alias="node", replace=True)
+    data = nested(60, (), lambda data: (data,))
+    expected = recursive(v, data)
+    assert outcome(v, data) == expected
+
+
+def test_budget_bottom_up(module, recursive):
+    # Deep data is charged bottom-up,
+    # so exceeded limit is reported at a different place of data
+    v = module.Budget(module.List(module.LazyRef("node"), alias="node"), maxnodes=150)
+    data = nested(200, [], lambda data: [data, []])
+    for result, error in (recursive(v, data), outcome(v, data)):
+        assert result is None
+        assert error.count("BudgetExceededError") == 1
+
+
+def test_unknown_alias(module, recursive):
+    v = module.Dict(
+        {"x": module.LazyRef("node"), "y": module.LazyRef("unknown")},
+        optional=["x", "y"],
+        alias="node",
+    )
+    data = nested(120, {"y": None}, lambda data: {"x": data})
+    with pytest.raises(KeyError):
+        recursive(v, data)
+
+    context = {}
+    with pytest.raises(KeyError):
+        v(data, context)
+    assert context == {}
@@ -10,9 +10,25 @@ from pytz import UTC
 from validx import exc
 
 
+class CustomError(exc.ConditionError):
+    __slots__ = exc.ConditionError.__slots__ + ("hint",)
+
+
+def test_custom_error():
+    ce = CustomError(expected=1, actual=2, hint="x")
+    assert ce.context == deque([])
+    assert repr(ce) == "<CustomError(expected=1, actual=2, hint='x')>"
+    assert ce == CustomError(deque([]), 1, 2, "x")
+    assert ce != CustomError(expected=1, actual=2, hint="y")
+    ce.add_context("a")
+    assert repr(ce) == "<a: CustomError(expected=1, actual=2, hint='x')>"
+    assert pickle.loads(pickle.dumps(ce)) == ce
+
+
 def test_validation_error():
     te = exc.InvalidTypeError(expected=int, actual=str)
     assert te.context == deque([])
+    assert te.args == (deque([]), int, str)
     assert te.format_context() == ""
     assert te.format_error() == "InvalidTypeError(expected=%r, actual=%r)" % (int, str)
     assert repr(te) == "<InvalidTypeError(expected=%r, actual=%r)>" % (int, str)
@@ -27,6 +43,7 @@ def test_validation_error():
     te.add_context("a.b")
     assert te.format_context() == "[a.b].1.x"
     assert te.context == deque(["a.b", 1, "x"])
+    assert te.args == (deque(["a.b", 1, "x"]), int, str)
     assert repr(te) == "<[a.b].1.x: InvalidTypeError(expected=%r, actual=%r)>" % (
         int,
         str,
@@ -40,6 +57,7 @@ def test_validation_error():
     assert te == exc.InvalidTypeError(te.context, expected=int, actual=str)
     assert te != exc.ConditionError(te.context, expected=int, actual=str)
     assert te != exc.InvalidTypeError(te.context, expected=int, actual=float)
+    assert te != exc.InvalidTypeError(expected=int, actual=str)
     with pytest.raises(IndexError):
         te[1]
 
@@ -59,6 +77,7 @@ def test_mapping_key_error():
     assert repr(fke) == "<y: ForbiddenKeyError()>"
     assert mke == exc.MissingKeyError(key="x")
     assert mke == exc.MissingKeyError(deque(["x"]))
+    assert mke.args == (deque(["x"]),)
     assert pickle.loads(pickle.dumps(mke)) == mke
     assert pickle.loads(pickle.dumps(fke)) == fke
 
@@ -111,6 +130,106 @@ def test_schema_error():
     assert pickle.loads(pickle.dumps(se)) == se
 
 
+def test_schema_error_nested():
+    mve = exc.MaxValueError(context=deque([0]), expected=100, actual=200)
+    mke = exc.MissingKeyError("x")
+
+    inner = exc.SchemaError([mve, mke])
+    inner.add_context("y")
+    outer = exc.SchemaError([inner])
+    outer.add_context("z")
+    assert mve.context == deque(["z", "y", 0])
+    assert mke.context == deque(["z", "y", "x"])
+    assert inner.context == deque([])
+    assert list(outer) == [mve, mke]
+    assert outer == exc.SchemaError(
+        [
+            exc.MaxValueError(deque(["z", "y", 0]), expected=100, actual=200),
+            exc.MissingKeyError(deque(["z", "y", "x"])),
+        ]
+    )
+    assert pickle.loads(pickle.dumps(outer)) == outer
+
+    # Wrapping nested errors into another schema error
+    # keeps their context
+    wrapper = exc.SchemaError([mve])
+    wrapper.add_context("a")
+    assert mve.context == deque(["a", "z", "y", 0])
+
+    # Adding context to the nested error directly
+    mke.add_context("b")
+    assert mke.context == deque(["b", "z", "y", "x"])
+
+    # Wrapping nested schema error into another schema error
+    wrapper = exc.SchemaError([inner])
+    wrapper.add_context("c")
+    assert list(wrapper) == [mve, mke]
+    assert mve.context == deque(["a", "z", "y", 0])
+    assert mke.context == deque(["b", "z", "y", "x"])
+    assert inner.context == deque([])
+    outer.add_context("d")
+    assert mve.context == deque(["d", "a", "z", "y", 0])
+    assert mke.context == deque(["d", "b", "z", "y", "x"])
+
+    # Mixing nested schema errors and plain ones
+    mixed = exc.SchemaError(
+        [exc.SchemaError([exc.MissingKeyError("x")]), exc.ForbiddenKeyError("y")]
+    )
+    mixed.add_context("z")
+    assert [e.context for e in mixed] == [deque(["z", "x"]), deque(["z", "y"])]
+
+    # Setting context explicitly
+    mve.context = deque(["e"])
+    assert repr(mve) == "<e: MaxValueError(expected=100, actual=200)>"
+
+
+def test_schema_error_sort():
+    errors = [
+        exc.MissingKeyError(deque([exc.EXTRA_VALUE])),
+        exc.MissingKeyError(deque([exc.Step(1)])),
+        exc.MissingKeyError(deque([(1, 2)])),
+        exc.MissingKeyError(deque(["b"])),
+        exc.MissingKeyError(deque([exc.EXTRA_KEY])),
+        exc.MissingKeyError(deque([10])),
+        exc.MissingKeyError(deque([exc.Step(0)])),
+        exc.MissingKeyError(deque([None])),
+        exc.MissingKeyError(deque(["a", 1])),
+        exc.MissingKeyError(deque([2])),
+    ]
+    se = exc.SchemaError(list(errors))
+    se.sort()
+    assert [e.context for e in se] == [
+        deque([2]),
+        deque([10]),
+        deque([None]),
+        deque(["a", 1]),
+        deque(["b"]),
+        deque([exc.Step(0)]),
+        deque([exc.Step(1)]),
+        deque([exc.EXTRA_KEY]),
+        deque([exc.EXTRA_VALUE]),
+        deque([(1, 2)]),
+    ]
+    se.sort(reverse=True)
+    assert se[0].context == deque([(1, 2)])
+    assert se[-1].context == deque([2])
+
+    # Sort key is rebuilt, when context is changed
+    se[-1].add_context((9,))
+    se.add_context(0)
+    se.sort()
+    assert se[-1].context == deque([0, (9,), 2])
+
+    # ... including context shared through the parent error
+    nested = exc.SchemaError([exc.SchemaError([exc.MinValueError()])])
+    outer = exc.SchemaError([nested, exc.MinValueError(deque([1]))])
+    outer.sort()
+    assert [e.context for e in outer] == [deque([]), deque([1])]
+    nested.add_context(2)
+    outer.sort()
+    assert [e.context for e in outer] == [deque([1]), deque([2])]
+
+
 def test_extra():
     assert exc.EXTRA_KEY == exc.Extra("KEY")
     assert exc.EXTRA_VALUE == exc.Extra("VALUE")
@@ -200,6 +319,12 @@ def test_format_error():
     assert exc.format_error(exc.RecursionMaxDepthError(expected=2, actual=3)) == [
         ("", "Too many nested structures, limit is 2.")
     ]
+    assert exc.format_error(
+        exc.BudgetExceededError(expected=10, actual=11, resource="nodes")
+    ) == [("", "Validation budget is exceeded, limit of nodes is 10.")]
+    assert exc.format_error(
+        exc.BudgetExceededError(expected=0.5, actual=0.6, resource="time")
+    ) == [("", "Validation takes too long, limit is 0.5 seconds.")]
     assert exc.format_error(exc.ForbiddenKeyError("x")) == [
         ("x", "Key is not allowed.")
     ]
@@ -207,6 +332,21 @@ def test_format_error():
         ("x", "Required key is not provided.")
     ]
 
+    # Test sorting
+    se = exc.SchemaError([exc.MissingKeyError("y"), exc.ForbiddenKeyError("x")])
+    assert exc.format_error(se, sort=False) == [
+        ("y", "Required key is not provided."),
+        ("x", "Key is not allowed."),
+    ]
+    assert exc.Formatter({}, sort=False)(se) == [
+        ("y", "MissingKeyError()"),
+        ("x", "ForbiddenKeyError()"),
+    ]
+    assert exc.format_error(se) == [
+        ("x", "Key is not allowed."),
+        ("y", "Required key is not provided."),
+    ]
+
     # Test fallback
     assert exc.format_error(exc.ConditionError(expected=1, actual=2)) == [
         ("", "ConditionError(expected=1, actual=2)")
@@ -222,3 +362,48 @@ def test_format_error():
             "DatetimeTypeError(expected='something', actual=datetime.datetime(2018, 12, 5, 0, 0))",
         )
     ]
+
+    # Test templates without conditions
+    formatter = exc.Formatter({exc.MissingKeyError: ["Missing."]})
+    assert formatter(exc.MissingKeyError("x")) == [("x", "Missing.")]
+
+
+def test_format_error_to_dicts():
+    se = exc.SchemaError(
+        [
+            exc.MissingKeyError("y"),
+            exc.ForbiddenKeyError("x").add_context(exc.EXTRA_KEY),
+            exc.SchemaError(
+                [exc.MaxValueError(expected=10, actual=20).add_context(1)]
+            ).add_context(exc.Step(2)),
+        ]
+    ).add_context("z")
+    assert exc.format_error.to_dicts(se, sort=False) == [
+        {
+            "path": ["z", "y"],
+            "code": "MissingKeyError",
+            "message": "Required key is not provided.",
+        },
+        {
+            "path": ["z", "@KEY", "x"],
+            "code": "ForbiddenKeyError",
+            "message": "Key is not allowed.",
+        },
+        {
+            "path": ["z", "#2", 1],
+            "code": "MaxValueError",
+            "message": "Expected value ≤ 10, got 20.",
+        },
+    ]
+    assert [d["path"] for d in exc.format_error.to_dicts(se)] == [
+        ["z", "y"],
+        ["z", "#2", 1],
+        ["z", "@KEY", "x"],
+    ]
+    assert exc.Formatter({}).to_dicts(exc.ConditionError(expected=1, actual=2)) == [
+        {
+            "path": [],
+            "code": "ConditionError",
+            "message": "ConditionError(expected=1, actual=2)",
+        }
+    ]
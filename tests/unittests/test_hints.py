@@ -0,0 +1,305 @@
+import sys
+import typing as t
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, time, datetime
+from decimal import Decimal
+
+import pytest
+
+import validx
+from validx import exc, hints
+
+
+if sys.version_info < (3, 9):  # pragma: no cover
+    pytest.skip("Type hints of Python 3.9+ are used", allow_module_level=True)
+
+
+@dataclass
+class Tag:
+    name: str
+    weight: float = 1.0
+
+
+@dataclass
+class Item:
+    id: int
+    tags: t.List[Tag]
+    price: t.Optional[Decimal] = None
+    kind: t.Literal["a", "b"] = "a"
+    notes: t.List[str] = field(default_factory=list)
+    internal: int = field(default=0, init=False)
+
+
+class Point(t.NamedTuple):
+    x: int
+    y: int = 0
+
+
+class Movie(t.TypedDict, total=False):
+    title: str
+    year: int
+
+
+class Book(t.TypedDict):
+    title: str
+    authors: t.Sequence[str]
+
+
+@dataclass
+class Node:
+    value: int
+    children: t.List["Node"] = field(default_factory=list)
+    parent: t.Optional["Node"] = None
+
+
+def test_scalars(module):
+    for tp, name in [
+        (int, "Int"),
+        (float, "Float"),
+        (bool, "Bool"),
+        (str, "Str"),
+        (bytes, "Bytes"),
+        (Decimal, "Decimal"),
+        (date, "Date"),
+        (time, "Time"),
+        (datetime, "Datetime"),
+    ]:
+        params = {"dontstrip": True} if tp is str else {}
+        v = hints.from_type(tp, module.classes)
+        assert v == getattr(module, name)(**params)
+
+        v = hints.from_type(t.Optional[tp], module.classes)
+        assert v == getattr(module, name)(nullable=True, **params)
+
+    assert hints.from_type(t.Any, module.classes) == module.Any()
+    assert hints.from_type(object, module.classes) == module.Any()
+    assert hints.from_type(t.Optional[t.Any], module.classes) == module.Any()
+
+
+def test_containers(module):
+    def from_type(tp):
+        return hints.from_type(tp, module.classes)
+
+    assert from_type(t.List[int]) == module.List(module.Int())
+    assert from_type(list) == module.List(module.Any())
+    assert from_type(t.List) == module.List(module.Any())
+    assert from_type(t.List[t.TypeVar("T")]) == module.List(module.Any())
+    assert from_type(t.Sequence[str]) == module.List(module.Str(dontstrip=True))
+    assert from_type(t.Tuple[int, ...]) == module.List(module.Int())
+    assert from_type(tuple) == module.List(module.Any())
+    assert from_type(t.Tuple[int, str]) == module.Tuple(module.Int(), module.Str(dontstrip=True))
+    assert from_type(t.Set[int]) == module.Set(module.Int())
+    assert from_type(t.FrozenSet[int]) == module.Set(module.Int())
+    assert from_type(t.Dict[str, int]) == module.Dict(
+        extra=(module.Str(dontstrip=True), module.Int())
+    )
+    assert from_type(t.Mapping) == module.Dict(extra=(module.Any(), module.Any()))
+    assert from_type(t.Optional[t.List[int]]) == module.List(
+        module.Int(), nullable=True
+    )
+    assert from_type(t.List[t.Optional[int]]) == module.List(
+        module.Int(nullable=True)
+    )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Python 3.10+ syntax")
+def test_builtin_generics(module):
+    def from_type(tp):
+        return hints.from_type(tp, module.classes)
+
+    assert from_type(list[int]) == module.List(module.Int())
+    assert from_type(dict[str, list[int]]) == module.Dict(
+        extra=(module.Str(dontstrip=True), module.List(module.Int()))
+    )
+    assert from_type(int | None) == module.Int(nullable=True)
+    assert from_type(int | str) == module.OneOf(module.Int(), module.Str(dontstrip=True))
+
+
+def test_unions_and_literals(module):
+    def from_type(tp):
+        return hints.from_type(tp, module.classes)
+
+    assert from_type(t.Union[int, str]) == module.OneOf(module.Int(), module.Str(dontstrip=True))
+    assert from_type(t.Union[int, str, None]) == module.OneOf(
+        module.Const(None), module.OneOf(module.Int(), module.Str(dontstrip=True))
+    )
+    assert from_type(t.Literal["a", "b"]) == module.Str(options=["a", "b"], dontstrip=True)
+    assert from_type(t.Literal[1, 2, None]) == module.Int(
+        options=[1, 2], nullable=True
+    )
+    assert from_type(t.Literal["a"]) == module.Str(options=["a"], dontstrip=True)
+    assert from_type(t.Literal[None]) == module.Const(None)
+    assert from_type(t.Literal[1, "a", 2]) == module.OneOf(
+        module.Int(options=[1, 2]), module.Str(options=["a"], dontstrip=True)
+    )
+    assert from_type(t.Optional[t.Literal["a"]]) == module.Str(
+        options=["a"], dontstrip=True, nullable=True
+    )
+    assert from_type(t.Literal[b"a"]) == module.Type(bytes, options=[b"a"])
+
+    # Values of different types are never equal
+    v = from_type(t.Literal[1])
+    assert v(1) == 1
+    with pytest.raises(exc.InvalidTypeError):
+        v(True)
+    v = from_type(t.Literal[True, None])
+    assert v == module.Type(bool, options=[True], nullable=True)
+    assert v(True) is True
+    assert v(None) is None
+    for value in (1, 1.0, False):
+        with pytest.raises(exc.ValidationError):
+            v(value)
+    v = from_type(t.Literal[True, 2])
+    assert v(True) is True
+    assert v(2) == 2
+    for value in (1, False, 2.5):
+        with pytest.raises(exc.ValidationError):
+            v(value)
+
+    # Strings are not stripped
+    v = from_type(t.Literal["a", "b"])
+    with pytest.raises(exc.OptionsError):
+        v(" a ")
+    assert from_type(str)(" a ") == " a "
+
+
+def test_annotated(module):
+    def from_type(tp):
+        return hints.from_type(tp, module.classes)
+
+    v = module.Int(min=0)
+    assert from_type(t.Annotated[int, v]) is v
+    assert from_type(t.Annotated[int, "note"]) == module.Int()
+    assert from_type(t.Annotated[t.Optional[int], "note"]) == module.Int(
+        nullable=True
+    )
+    assert from_type(t.List[t.Annotated[int, v]]) == module.List(v)
+
+    @dataclass
+    class Range:
+        start: t.Annotated[int, module.Int(min=0)]
+        end: t.Annotated[int, module.Int(min=0)]
+
+    v = from_type(Range)
+    assert v({"start": 1, "end": 2}) == Range(1, 2)
+    with pytest.raises(exc.SchemaError) as info:
+        v({"start": -1, "end": 2})
+    assert isinstance(info.value[0], exc.MinValueError)
+
+
+def test_dataclass(module):
+    v = hints.from_type(Item, module.classes)
+    assert v == module.Dict(
+        {
+            "id": module.Int(),
+            "tags": module.List(
+                module.Dict(
+                    {"name": module.Str(dontstrip=True), "weight": module.Float()},
+                    optional=["weight"],
+                    into=Tag,
+                )
+            ),
+            "price": module.Decimal(nullable=True),
+            "kind": module.Str(options=["a", "b"], dontstrip=True),
+            "notes": module.List(module.Str(dontstrip=True)),
+        },
+        optional=["price", "kind", "notes"],
+        into=Item,
+    )
+    assert v({"id": 1, "tags": [{"name": "x"}]}) == Item(1, [Tag("x")])
+    assert v(
+        {"id": 1, "tags": [], "price": Decimal("1.5"), "kind": "b", "notes": ["y"]}
+    ) == Item(1, [], Decimal("1.5"), "b", ["y"])
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({"id": 1, "tags": [{"weight": 2}], "internal": 1})
+    info.value.sort()
+    assert [(type(e), e.context) for e in info.value] == [
+        (exc.ForbiddenKeyError, deque(["internal"])),
+        (exc.MissingKeyError, deque(["tags", 0, "name"])),
+    ]
+
+    v = hints.from_type(t.Optional[Tag], module.classes)
+    assert v(None) is None
+    assert v({"name": "x"}) == Tag("x")
+
+
+def test_named_tuple(module):
+    v = hints.from_type(Point, module.classes)
+    assert v({"x": 1}) == Point(1, 0)
+    assert v({"x": 1, "y": 2}) == Point(1, 2)
+
+
+def test_typed_dict(module):
+    v = hints.from_type(Movie, module.classes)
+    assert v({}) == {}
+    assert v({"title": "x", "year": 2000}) == {"title": "x", "year": 2000}
+
+    v = hints.from_type(Book, module.classes)
+    assert v({"title": "x", "authors": ["y"]}) == {"title": "x", "authors": ["y"]}
+    with pytest.raises(exc.SchemaError) as info:
+        v({"title": "x"})
+    assert isinstance(info.value[0], exc.MissingKeyError)
+
+
+def test_recursive(module):
+    v = hints.from_type(Node, module.classes)
+    assert module.instances.get("%s.Node" % __name__) is v
+    result = v({"value": 1, "children": [{"value": 2, "parent": {"value": 3}}]})
+    assert result == Node(1, [Node(2, [], Node(3))])
+
+    # Cached validator restores cleared registry
+    module.instances.clear()
+    assert hints.from_type(Node, module.classes) is v
+    assert v({"value": 1, "parent": {"value": 2}}) == Node(1, [], Node(2))
+
+    @dataclass
+    class Tree:
+        root: t.Optional[Node]
+
+    module.instances.clear()
+    v = hints.from_type(Tree, module.classes)
+    assert v({"root": {"value": 1, "children": [{"value": 2}]}}) == Tree(
+        Node(1, [Node(2)])
+    )
+
+
+def test_cache(module):
+    v = hints.from_type(Item, module.classes)
+    assert hints.from_type(Item, module.classes) is v
+    assert hints.from_type(Tag, module.classes) is v.schema["tags"].item
+    assert hints.from_type(t.List[int], module.classes) is hints.from_type(
+        t.List[int], module.classes
+    )
+
+    @dataclass
+    class Leaf:
+        name: str
+
+    @dataclass
+    class Pair:
+        first: Leaf
+        second: Leaf
+
+    v = hints.from_type(Pair, module.classes)
+    assert v.schema["first"] is v.schema["second"]
+
+    # Unhashable hints are not cached
+    tp = t.Annotated[t.List[int], {"note": "x"}]
+    assert hints.from_type(tp, module.classes) == module.List(module.Int())
+    assert hints.from_type(tp, module.classes) is not hints.from_type(
+        tp, module.classes
+    )
+
+
+def test_default_classes():
+    assert validx.from_type is hints.from_type
+    assert type(validx.from_type(int)) is validx.Int
+
+
+def test_unsupported(module):
+    for tp in [complex, t.Callable[[], int], "int", t.Type[int]]:
+        with pytest.raises(TypeError) as info:
+            hints.from_type(tp, module.classes)
+        assert info.value.args[0].startswith("Unsupported type hint")
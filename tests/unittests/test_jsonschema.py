@@ -0,0 +1,612 @@
+import pytest
+
+import validx
+from validx import exc, jsonschema
+
+
+def load(module, doc, **kw):
+    return jsonschema.load(doc, classes=module.classes, **kw)
+
+
+def test_load_scalars(module):
+    assert load(module, {}) == module.Any()
+    assert load(module, True) == module.Any()
+    assert load(module, {"title": "x", "format": "email"}) == module.Any()
+    assert load(module, {"type": "string"}) == module.Str(dontstrip=True)
+    assert load(
+        module,
+        {"type": "string", "minLength": 1, "maxLength": 5, "pattern": "[a-z]"},
+    ) == module.Str(
+        dontstrip=True, minlen=1, maxlen=5, pattern="[a-z]", match="search"
+    )
+    assert load(
+        module, {"type": ["string", "null"], "enum": ["a", "b", None]}
+    ) == module.Str(dontstrip=True, nullable=True, options=["a", "b"])
+    assert load(
+        module, {"type": ["string", "null"], "enum": ["a", "b"]}
+    ) == module.Str(dontstrip=True, options=["a", "b"])
+    assert load(module, {"type": ["integer", "null"], "enum": [1]}) == module.Int(
+        options=[1]
+    )
+    assert load(module, {"type": "integer"}) == module.Int()
+    assert load(
+        module, {"type": "integer", "minimum": 0.5, "maximum": 10.5}
+    ) == module.Int(min=1, max=10)
+    assert load(
+        module,
+        {
+            "type": "integer",
+            "minimum": 0,
+            "exclusiveMinimum": 0,
+            "maximum": 5,
+            "exclusiveMaximum": 10,
+        },
+    ) == module.Int(min=1, max=5)
+    assert load(module, {"type": "integer", "enum": [1, 2]}) == module.Int(
+        options=[1, 2]
+    )
+    assert load(
+        module, {"type": "number", "minimum": -1, "maximum": 1}
+    ) == module.Float(min=-1, max=1)
+    assert load(module, {"type": "boolean"}) == module.Bool()
+    assert load(module, {"type": "null"}) == module.Const(None)
+    assert load(module, {"const": "x"}) == module.Const("x")
+    assert load(module, {"enum": ["x"]}) == module.Const("x")
+    assert load(module, {"enum": ["x", 1]}) == module.OneOf(
+        module.Const("x"), module.Int(options=[1])
+    )
+    assert load(module, {"enum": [1, True, 2, None, 1.5, ["x"]]}) == module.OneOf(
+        module.Int(options=[1, 2]),
+        module.Type(bool, options=[True]),
+        module.Const(None),
+        module.Float(min=1.5, max=1.5),
+        module.Const(["x"]),
+    )
+    assert load(module, {"type": "boolean", "enum": [True]}) == module.Type(
+        bool, options=[True]
+    )
+    assert load(
+        module, {"type": ["boolean", "null"], "enum": [False, None]}
+    ) == module.Type(bool, options=[False], nullable=True)
+
+
+def test_load_values(module):
+    # Booleans are never equal to numbers
+    v = load(module, {"enum": [0, 1]})
+    assert v(0) == 0
+    assert v(1.0) == 1
+    for value in (True, False, 2, "1"):
+        with pytest.raises(exc.ValidationError):
+            v(value)
+
+    v = load(module, {"const": False})
+    assert v(False) is False
+    for value in (0, 0.0, None):
+        with pytest.raises(exc.ValidationError):
+            v(value)
+
+    v = load(module, {"const": 1.5})
+    assert v(1.5) == 1.5
+    with pytest.raises(exc.ValidationError):
+        v(True)
+
+    v = load(module, {"const": 2.0})
+    assert v(2) == 2.0
+    with pytest.raises(exc.ValidationError):
+        v(2.5)
+
+    v = load(module, {"type": "boolean", "enum": [True]})
+    assert v(True) is True
+    for value in (1, False):
+        with pytest.raises(exc.ValidationError):
+            v(value)
+
+
+def test_load_unions(module):
+    assert load(module, {"type": ["integer", "string"]}) == module.OneOf(
+        module.Int(), module.Str(dontstrip=True)
+    )
+    assert load(module, {"type": ["integer", "string", "null"]}) == module.OneOf(
+        module.Const(None), module.Int(), module.Str(dontstrip=True)
+    )
+    assert load(
+        module, {"anyOf": [{"type": "integer"}, {"type": "boolean"}]}
+    ) == module.OneOf(module.Int(), module.Bool())
+
+
+def test_load_arrays(module):
+    assert load(module, {"type": "array"}) == module.List(module.Any())
+    assert load(
+        module,
+        {
+            "type": "array",
+            "items": {"type": "integer"},
+            "minItems": 1,
+            "maxItems": 3,
+            "uniqueItems": False,
+        },
+    ) == module.List(module.Int(), minlen=1, maxlen=3)
+
+    expected = module.Tuple(module.Int(), module.Str(dontstrip=True))
+    assert (
+        load(
+            module,
+            {
+                "type": "array",
+                "prefixItems": [{"type": "integer"}, {"type": "string"}],
+                "items": False,
+                "minItems": 2,
+            },
+        )
+        == expected
+    )
+    assert (
+        load(
+            module,
+            {
+                "type": "array",
+                "items": [{"type": "integer"}, {"type": "string"}],
+                "additionalItems": False,
+                "minItems": 2,
+                "maxItems": 2,
+            },
+        )
+        == expected
+    )
+
+
+def test_load_objects(module):
+    assert load(module, {"type": "object"}) == module.Dict(
+        extra=(module.Any(), module.Any())
+    )
+    v = load(
+        module,
+        {
+            "type": "object",
+            "properties": {"x": {"type": "integer"}, "y": {"type": "string"}},
+            "required": ["x", "z"],
+            "additionalProperties": False,
+            "minProperties": 1,
+            "maxProperties": 2,
+        },
+    )
+    assert v == module.Dict(
+        {"x": module.Int(), "y": module.Str(dontstrip=True), "z": module.Any()},
+        optional=["y"],
+        minlen=1,
+        maxlen=2,
+    )
+    assert load(
+        module,
+        {
+            "type": "object",
+            "additionalProperties": {"type": "integer"},
+            "propertyNames": {"pattern": "^[a-z]+$"},
+        },
+    ) == module.Dict(
+        extra=(
+            module.Str(dontstrip=True, pattern="^[a-z]+$", match="search"),
+            module.Int(),
+        )
+    )
+
+    v = load(
+        module,
+        {
+            "type": "object",
+            "properties": {"location": {"type": "object"}},
+            "required": ["location"],
+        },
+    )
+    assert v({"location": {"lat": 1}, "name": "x"}) == {
+        "location": {"lat": 1},
+        "name": "x",
+    }
+    with pytest.raises(exc.SchemaError) as info:
+        v({})
+    assert isinstance(info.value[0], exc.MissingKeyError)
+
+
+def test_load_refs(module):
+    doc = {
+        "$id": "tree",
+        "type": "object",
+        "properties": {
+            "value": {"$ref": "#/$defs/value"},
+            "children": {"type": "array", "items": {"$ref": "#"}},
+            "tag": {"$ref": "#/definitions/a~1b"},
+        },
+        "required": ["value"],
+        "additionalProperties": False,
+        "$defs": {"value": {"type": "integer", "minimum": 0}},
+        "definitions": {"a/b": {"type": "string"}},
+    }
+    v = load(module, doc)
+    assert module.instances.get("tree#") is v
+    assert module.instances.get("tree#/$defs/value") == module.Int(min=0)
+    assert module.instances.get("tree#/definitions/a~1b") == module.Str(
+        dontstrip=True
+    )
+    assert v.schema["value"] == module.LazyRef("tree#/$defs/value")
+
+    data = {"value": 1, "tag": "x", "children": [{"value": 2, "children": []}]}
+    assert v(data) == data
+    with pytest.raises(exc.SchemaError) as info:
+        v({"value": 1, "children": [{"value": -1}]})
+    assert isinstance(info.value[0], exc.MinValueError)
+
+    # Loading again replaces registered definitions
+    v = load(module, doc)
+    assert module.instances.get("tree#") is v
+
+    v = load(module, doc, name="other")
+    assert module.instances.get("other#") is v
+
+    # Definitions of anonymous documents do not replace each other
+    v = load(module, {"$ref": "#/$defs/x", "$defs": {"x": {"type": "boolean"}}})
+    assert v.use.startswith("jsonschema")
+    assert v.use.endswith("#/$defs/x")
+    assert module.instances.get(v.use) == module.Bool()
+    w = load(module, {"$ref": "#/$defs/x", "$defs": {"x": {"type": "integer"}}})
+    assert w.use != v.use
+    assert module.instances.get(v.use) == module.Bool()
+    assert v(True) is True
+    with pytest.raises(exc.InvalidTypeError):
+        w(True)
+
+
+def test_load_unsupported(module):
+    def error(doc):
+        with pytest.raises(ValueError) as info:
+            load(module, doc)
+        return info.value.args[0]
+
+    assert error(False) == "Unsupported JSON Schema False at '#'"
+    assert error({"type": "string", "format": "email", "x-y": 1}) == (
+        "Unsupported JSON Schema keywords ['x-y'] at '#'"
+    )
+    assert error({"type": "object", "properties": {"a/b": {"oneOf": []}}}) == (
+        "Unsupported JSON Schema keywords ['oneOf'] at '#/properties/a~1b'"
+    )
+    assert error({"type": "number", "exclusiveMinimum": 0}) == (
+        "Unsupported JSON Schema keywords ['exclusiveMinimum'] at '#'"
+    )
+    assert error({"type": "number", "enum": [1.5]}) == (
+        "Unsupported JSON Schema keywords ['enum'] at '#'"
+    )
+    assert error({"type": "integer", "multipleOf": 2}) == (
+        "Unsupported JSON Schema keywords ['multipleOf'] at '#'"
+    )
+    assert error({"type": "array", "uniqueItems": True}) == (
+        "Unsupported JSON Schema keywords ['uniqueItems'] at '#'"
+    )
+    assert error({"type": "object", "patternProperties": {}}) == (
+        "Unsupported JSON Schema keywords ['patternProperties'] at '#'"
+    )
+    assert error(
+        {"type": "object", "additionalProperties": False, "propertyNames": {}}
+    ) == ("Unsupported JSON Schema keywords ['propertyNames'] at '#'")
+    assert error({"$ref": "#", "type": "string"}) == (
+        "Unsupported JSON Schema keywords ['type'] at '#'"
+    )
+    assert error({"anyOf": [], "type": "string"}) == (
+        "Unsupported JSON Schema keywords ['type'] at '#'"
+    )
+    assert error({"const": 1, "enum": [1]}) == (
+        "Unsupported JSON Schema keywords ['enum'] at '#'"
+    )
+    assert error({"enum": [1], "not": {}}) == (
+        "Unsupported JSON Schema keywords ['not'] at '#'"
+    )
+    assert error({"not": {}}) == "Unsupported JSON Schema keywords ['not'] at '#'"
+    assert error({"properties": {}, "required": []}) == (
+        "JSON Schema keywords ['properties', 'required'] "
+        "without 'type' are not supported at '#'"
+    )
+    assert error({"type": "tuple"}) == "Unsupported JSON Schema type 'tuple' at '#'"
+    assert error({"type": "string", "enum": ["a", 1]}) == (
+        "Unsupported JSON Schema 'enum' value 1 at '#'"
+    )
+    assert error({"type": "integer", "enum": [True]}) == (
+        "Unsupported JSON Schema 'enum' value True at '#'"
+    )
+    assert error({"type": "boolean", "enum": [1]}) == (
+        "Unsupported JSON Schema 'enum' value 1 at '#'"
+    )
+    # Nested numbers and booleans would be compared by ``Const``
+    assert error({"const": [1]}) == "Unsupported JSON Schema 'const' value [1] at '#'"
+    assert error({"enum": ["a", {"b": [True]}]}) == (
+        "Unsupported JSON Schema 'enum' value {'b': [True]} at '#'"
+    )
+    assert error({"type": "integer", "exclusiveMinimum": True}) == (
+        "Unsupported JSON Schema 'exclusiveMinimum' value True at '#'"
+    )
+    assert error({"type": "array", "prefixItems": [{}]}) == (
+        "JSON Schema arrays with 'prefixItems' "
+        "of variable length are not supported at '#'"
+    )
+    assert error({"type": "array", "items": [{}], "minItems": 1}) == (
+        "JSON Schema arrays with 'prefixItems' "
+        "of variable length are not supported at '#'"
+    )
+    assert error(
+        {"type": "array", "prefixItems": [{}], "items": False, "minItems": 2}
+    ) == (
+        "JSON Schema arrays with 'prefixItems' "
+        "of variable length are not supported at '#'"
+    )
+    assert error(
+        {
+            "type": "array",
+            "prefixItems": [{}],
+            "items": False,
+            "minItems": 1,
+            "maxItems": 0,
+        }
+    ) == "JSON Schema 'maxItems' is less than 'minItems' at '#'"
+    assert error({"$ref": "other.json#/$defs/x"}) == (
+        "Unsupported JSON Schema reference 'other.json#/$defs/x' at '#', "
+        "only references to the document and its definitions are supported"
+    )
+    assert error({"$ref": "#/$defs/x/properties/y"}).startswith(
+        "Unsupported JSON Schema reference '#/$defs/x/properties/y' at '#'"
+    )
+    assert error({"$ref": "#/$defs/x"}) == (
+        "Unresolvable JSON Schema reference '#/$defs/x' at '#'"
+    )
+    assert error({"$ref": "#/definitions/x", "definitions": []}) == (
+        "Unresolvable JSON Schema reference '#/definitions/x' at '#'"
+    )
+    # Nothing is registered, if any part of the document is not supported
+    assert error(
+        {
+            "type": "array",
+            "items": {"$ref": "#/$defs/x"},
+            "$defs": {"x": {"type": "object", "not": {}}},
+            "$id": "broken",
+        }
+    ) == "Unsupported JSON Schema keywords ['not'] at '#/$defs/x'"
+    with pytest.raises(KeyError):
+        module.instances.get("broken#/$defs/x")
+
+def test_load_default_classes():
+    assert validx.jsonschema is jsonschema
+    try:
+        v = jsonschema.load({"type": "integer"})
+        assert type(v) is validx.Int
+    finally:
+        validx.instances.clear()
+
+
+def test_dump_scalars(module):
+    def dump(validator):
+        result = validator.to_jsonschema()
+        assert result.pop("$schema") == jsonschema.DRAFT
+        return result
+
+    assert dump(module.Any()) == {}
+    assert dump(module.Const(None)) == {"const": None}
+    assert dump(module.Bool(nullable=True)) == {"type": ["boolean", "null"]}
+    assert dump(module.Int(min=0, max=10, options=[2, 1])) == {
+        "type": "integer",
+        "minimum": 0,
+        "maximum": 10,
+        "enum": [1, 2],
+    }
+    assert dump(module.Int(nullable=True, options=[1])) == {
+        "type": ["integer", "null"],
+        "enum": [1, None],
+    }
+    assert dump(module.Float(min=0)) == {"type": "number", "minimum": 0.0}
+    assert dump(module.Str(normspace=True)) == {"type": "string"}
+    assert dump(module.Str(minlen=1, maxlen=2, dontstrip=True)) == {
+        "type": "string",
+        "minLength": 1,
+        "maxLength": 2,
+    }
+    assert dump(module.Str(pattern="a|b", dontstrip=True)) == {
+        "type": "string",
+        "pattern": "^(?:a|b)",
+    }
+    assert dump(module.Str(pattern="a|b", match="full", dontstrip=True)) == {
+        "type": "string",
+        "pattern": "^(?:a|b)$",
+    }
+    assert dump(module.Str(pattern="a|b", match="search", dontstrip=True)) == {
+        "type": "string",
+        "pattern": "a|b",
+    }
+    assert dump(module.Str(options=["b", "a"], dontstrip=True)) == {
+        "type": "string",
+        "enum": ["a", "b"],
+    }
+    assert dump(module.Type(bool, options=[True], nullable=True)) == {
+        "type": ["boolean", "null"],
+        "enum": [True, None],
+    }
+
+
+def test_dump_containers(module):
+    def dump(validator):
+        result = validator.to_jsonschema()
+        del result["$schema"]
+        return result
+
+    assert dump(module.List(module.Any(), minlen=1, maxlen=2)) == {
+        "type": "array",
+        "minItems": 1,
+        "maxItems": 2,
+    }
+    assert dump(module.List(module.Any(), unique=True)) == {"type": "array"}
+    assert dump(module.List(module.Int(), nullable=True, sort=1)) == {
+        "type": ["array", "null"],
+        "items": {"type": "integer"},
+    }
+    assert dump(module.Tuple(module.Int(), module.Bool())) == {
+        "type": "array",
+        "prefixItems": [{"type": "integer"}, {"type": "boolean"}],
+        "items": False,
+        "minItems": 2,
+    }
+    assert dump(
+        module.Dict(
+            {"x": module.Int(), "y": module.Int(), "z": module.Int()},
+            optional=["y"],
+            defaults={"z": 0},
+            dispose=["w"],
+            minlen=1,
+            maxlen=3,
+            dontcopy=True,
+        )
+    ) == {
+        "type": "object",
+        "properties": {
+            "x": {"type": "integer"},
+            "y": {"type": "integer"},
+            "z": {"type": "integer"},
+            "w": {},
+        },
+        "required": ["x"],
+        "additionalProperties": False,
+        "minProperties": 1,
+        "maxProperties": 3,
+    }
+    assert dump(module.Dict(extra=(module.Any(), module.Any()))) == {
+        "type": "object"
+    }
+    assert dump(
+        module.Dict(
+            extra=(module.Str(pattern="^x", dontstrip=True), module.Int()),
+            nullable=True,
+        )
+    ) == {
+        "type": ["object", "null"],
+        "propertyNames": {"type": "string", "pattern": "^(?:^x)"},
+        "additionalProperties": {"type": "integer"},
+    }
+    assert dump(module.OneOf(module.Int(), module.Const("x"), adaptive=True)) == {
+        "anyOf": [{"type": "integer"}, {"const": "x"}]
+    }
+
+
+def test_dump_refs(module):
+    module.Dict(
+        {"value": module.Int(), "children": module.List(module.LazyRef("node"))},
+        alias="node",
+    )
+    v = module.List(module.LazyRef("node"))
+    doc = v.to_jsonschema()
+    assert doc == {
+        "$schema": jsonschema.DRAFT,
+        "type": "array",
+        "items": {"$ref": "#/$defs/node"},
+        "$defs": {
+            "node": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "integer"},
+                    "children": {"type": "array", "items": {"$ref": "#/$defs/node"}},
+                },
+                "required": ["value", "children"],
+                "additionalProperties": False,
+            }
+        },
+    }
+
+    module.Int(alias="a/b")
+    assert module.LazyRef("a/b").to_jsonschema() == {
+        "$schema": jsonschema.DRAFT,
+        "$ref": "#/$defs/a~1b",
+        "$defs": {"a/b": {"type": "integer"}},
+    }
+
+    # References are URI fragments, so pointers are percent-encoded
+    module.Int(alias="a b%#?")
+    assert module.LazyRef("a b%#?").to_jsonschema() == {
+        "$schema": jsonschema.DRAFT,
+        "$ref": "#/$defs/a%20b%25%23?",
+        "$defs": {"a b%#?": {"type": "integer"}},
+    }
+
+
+def test_dump_unsupported(module):
+    def error(validator):
+        with pytest.raises(ValueError) as info:
+            validator.to_jsonschema()
+        return info.value.args[0]
+
+    assert error(module.Date()) == "Date validator cannot be exported to JSON Schema"
+    assert error(module.List(module.Set(module.Int()))) == (
+        "Set validator cannot be exported to JSON Schema"
+    )
+    assert error(module.Int(coerce=True)) == (
+        "Parameters ['coerce'] of Int validator cannot be exported to JSON Schema"
+    )
+    assert error(module.Str(encoding="utf-8", max_input_len=10)) == (
+        "Parameters ['encoding', 'max_input_len'] "
+        "of Str validator cannot be exported to JSON Schema"
+    )
+    # Stripped and normalized values are checked, so constraints cannot be exported
+    assert error(module.Str(minlen=2)) == (
+        "Parameters ['minlen'] of Str validator cannot be exported to JSON Schema, "
+        "unless 'dontstrip' is set and 'normspace' is not"
+    )
+    assert error(
+        module.Str(maxlen=2, pattern="a", options=["a"], dontstrip=True, normspace=True)
+    ) == (
+        "Parameters ['maxlen', 'options', 'pattern'] of Str validator "
+        "cannot be exported to JSON Schema, "
+        "unless 'dontstrip' is set and 'normspace' is not"
+    )
+    # Duplicates are dropped before length is checked
+    assert error(module.List(module.Int(), unique=True, minlen=1, maxlen=2)) == (
+        "Parameters ['maxlen', 'minlen'] of List validator "
+        "cannot be exported to JSON Schema, unless 'unique' is not set"
+    )
+    assert error(module.Type(int)) == (
+        "Type validator cannot be exported to JSON Schema, unless 'tp' is bool"
+    )
+    assert error(module.Float(nan=True)) == (
+        "Parameters ['nan'] of Float validator cannot be exported to JSON Schema"
+    )
+    module.Int(alias="x")
+    assert error(module.LazyRef("x", maxdepth=1)) == (
+        "Parameters ['maxdepth'] of LazyRef validator cannot be exported to JSON Schema"
+    )
+
+
+def test_round_trip(module):
+    v = module.Dict(
+        {
+            "id": module.Int(min=1),
+            "name": module.Str(dontstrip=True, pattern="^[a-z]+$", match="search"),
+            "score": module.Float(min=0, max=1, nullable=True),
+            "tags": module.List(
+                module.Str(dontstrip=True, options=["a", "b"]), maxlen=3
+            ),
+            "point": module.Tuple(module.Int(), module.Int()),
+            "kind": module.OneOf(module.Const("x"), module.Bool()),
+            "flag": module.Type(bool, options=[False]),
+            "meta": module.Dict(extra=(module.Any(), module.Any())),
+        },
+        optional=["score", "meta", "flag"],
+    )
+    assert load(module, v.to_jsonschema()) == v
+
+    # Aliases of loaded definitions are exported as valid references
+    doc = {
+        "$id": "tree",
+        "type": "array",
+        "items": {"$ref": "#/$defs/node"},
+        "$defs": {"node": {"type": "array", "items": {"$ref": "#/$defs/node"}}},
+    }
+    v = load(module, doc)
+    exported = v.to_jsonschema()
+    assert exported["items"] == {"$ref": "#/$defs/tree%23~1$defs~1node"}
+    assert list(exported["$defs"]) == ["tree#/$defs/node"]
+    w = load(module, exported, name="copy")
+    assert w.item == module.LazyRef("copy#/$defs/tree%23~1$defs~1node")
+    assert module.instances.get(w.item.use) == module.List(w.item)
+    assert w([[[]], []]) == [[[]], []]
+    with pytest.raises(exc.SchemaError):
+        w([[1]])
@@ -1,5 +1,6 @@
 import pickle
 from collections import deque
+from collections.abc import Mapping
 
 import pytest
 
@@ -88,3 +89,244 @@ def test_one_of_context(module):
     context = {}
     v(None, context)
     assert context["marked"]
+
+
+def test_one_of_adaptive(module, monkeypatch):
+    monkeypatch.setattr(module.pipelines, "ADAPTIVE_PERIOD", 4)
+
+    class Tracked(module.Validator):
+        __slots__ = ()
+
+        def __call__(self, value, __context=None):
+            __context.setdefault("tried", []).append(self)
+            return module.Str()(value)
+
+    tracked = Tracked()
+    v = module.OneOf(module.Int(), tracked, adaptive=True)
+    assert v.adaptive
+    assert v.dump() == {
+        "__class__": "OneOf",
+        "steps": [{"__class__": "Int"}, {"__class__": "Tracked"}],
+        "adaptive": True,
+    }
+    assert "_order" not in repr(v)
+    assert v != module.OneOf(module.Int(), tracked)
+
+    # Declaration order is used, until enough statistics are collected
+    for _ in range(4):
+        context = {}
+        assert v("x", context) == "x"
+        assert context["tried"] == [tracked]
+    assert v(1) == 1
+
+    # Then the more successful step is tried first
+    context = {}
+    assert v(1, context) == 1
+    assert context["tried"] == [tracked]
+
+    # Errors are reported in declaration order
+    with pytest.raises(exc.SchemaError) as info:
+        v(None)
+    assert len(info.value) == 2
+    assert isinstance(info.value[0], exc.InvalidTypeError)
+    assert info.value[0].context == deque([exc.Step(0)])
+    assert info.value[0].expected == int
+    assert isinstance(info.value[1], exc.InvalidTypeError)
+    assert info.value[1].context == deque([exc.Step(1)])
+    assert info.value[1].expected == str
+
+    # The order follows changes of input data
+    for _ in range(8):
+        assert v(1) == 1
+    context = {}
+    assert v(1, context) == 1
+    assert "tried" not in context
+
+
+def test_one_of_dispatch(module):
+    class Point:
+        pass
+
+    point = Point()
+
+    v = module.OneOf(
+        module.Int(),
+        module.Str(),
+        module.Dict({"x": module.Int()}),
+        module.List(module.Int()),
+    )
+    assert v(1) == 1
+    assert v(1.0) == 1
+    assert v(" x ") == "x"
+    assert v({"x": 1}) == {"x": 1}
+    assert v([1, 2]) == [1, 2]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v(None)
+    assert [type(e) for e in info.value] == [exc.InvalidTypeError] * 4
+    assert [e.context for e in info.value] == [
+        deque([exc.Step(0)]),
+        deque([exc.Step(1)]),
+        deque([exc.Step(2)]),
+        deque([exc.Step(3)]),
+    ]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({"x": None})
+    assert [type(e) for e in info.value] == [
+        exc.InvalidTypeError,
+        exc.InvalidTypeError,
+        exc.InvalidTypeError,
+        exc.InvalidTypeError,
+    ]
+    assert info.value[2].context == deque([exc.Step(2), "x"])
+
+    v = module.OneOf(
+        module.Float(),
+        module.Decimal(nullable=True),
+        module.Bool(),
+        module.Bytes(),
+        module.Set(module.Int()),
+        module.Tuple(module.Int()),
+        module.Type(Point),
+        module.Const("x"),
+        module.AllOf(module.Str(), module.Str(minlen=2)),
+        module.OneOf(module.Str(), module.Int()),
+    )
+    assert v(1.5) == 1.5
+    assert v(None) is None
+    assert v(True) is True
+    assert v(b"x") == b"x"
+    assert v({1}) == {1}
+    assert v(point) is point
+    assert v("x") == "x"
+    assert v("xy") == "xy"
+
+    with pytest.raises(exc.SchemaError) as info:
+        v(["x"])
+    assert [e.context[0] for e in info.value] == [
+        exc.Step(num) for num in range(10)
+    ] + [exc.Step(9)]
+    assert info.value[4].context == deque([exc.Step(4), 0])
+    assert info.value[5].context == deque([exc.Step(5), 0])
+
+    # Coercion makes accepted types unknown
+    assert module.OneOf(module.Dict({}), module.Int(coerce=True))("1") == 1
+    assert module.OneOf(module.Dict({}), module.Str(coerce=True))(1) == "1"
+    assert module.OneOf(module.Int(), module.Type(int, coerce=True))("1") == 1
+    assert module.OneOf(module.Int(), module.Str(encoding="utf-8"))(b"x") == "x"
+    assert module.OneOf(module.Int(), module.Bool(coerce_str=True))("on") is True
+    assert module.OneOf(module.Str(), module.Bool(coerce_int=True))(1) is True
+    assert module.OneOf(module.Int(), module.Str(coerce=True))(None) == "None"
+
+    # Values of different numeric types can be equal
+    v = module.OneOf(module.Str(), module.Const(1))
+    assert v(1.0) == 1.0
+    assert v(True) is True
+    with pytest.raises(exc.SchemaError):
+        v(b"1")
+    v = module.OneOf(module.Str(), module.Const(point))
+    assert v(point) is point
+
+
+
+def test_one_of_dispatch_fallback(module, monkeypatch):
+    # Result of a skipped step is returned, if the step unexpectedly succeeds
+    monkeypatch.setattr(module.pipelines, "_accepts", lambda step, tp: tp is not str)
+    v = module.OneOf(module.Int(), module.Str())
+    assert v("x") == "x"
+    with pytest.raises(exc.SchemaError) as info:
+        v(b"x")
+    assert len(info.value) == 2
+
+
+# =============================================================================
+
+
+def test_tagged(module):
+    v = module.Tagged(
+        "type",
+        {
+            "point": module.Dict(
+                {"type": module.Const("point"), "x": module.Int(), "y": module.Int()}
+            ),
+            "label": module.Dict({"type": module.Const("label"), "text": module.Str()}),
+        },
+    )
+    assert v({"type": "point", "x": 1, "y": 2}) == {"type": "point", "x": 1, "y": 2}
+    assert v({"type": "label", "text": "x"}) == {"type": "label", "text": "x"}
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+    assert v.dump() == {
+        "__class__": "Tagged",
+        "key": "type",
+        "variants": {
+            "point": {
+                "__class__": "Dict",
+                "schema": {
+                    "type": {"__class__": "Const", "value": "point"},
+                    "x": {"__class__": "Int"},
+                    "y": {"__class__": "Int"},
+                },
+            },
+            "label": {
+                "__class__": "Dict",
+                "schema": {
+                    "type": {"__class__": "Const", "value": "label"},
+                    "text": {"__class__": "Str"},
+                },
+            },
+        },
+    }
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({"type": "point", "x": 1})
+    assert len(info.value) == 1
+    assert isinstance(info.value[0], exc.MissingKeyError)
+    assert info.value[0].context == deque(["y"])
+
+    with pytest.raises(exc.InvalidTypeError) as info:
+        v(None)
+    assert info.value.expected == Mapping
+    assert info.value.actual == type(None)
+
+    with pytest.raises(exc.MissingKeyError) as info:
+        v({"text": "x"})
+    assert info.value.context == deque(["type"])
+
+    with pytest.raises(exc.OptionsError) as info:
+        v({"type": "circle"})
+    assert info.value.context == deque(["type"])
+    assert info.value.expected == ["point", "label"]
+    assert info.value.actual == "circle"
+
+    with pytest.raises(exc.OptionsError) as info:
+        v({"type": ["point"]})
+    assert info.value.context == deque(["type"])
+    assert info.value.actual == ["point"]
+
+    with pytest.raises(TypeError) as info:
+        module.Tagged("type", {"point": None})
+    assert info.value.args == (
+        "%s.Tagged.variants['point'] value should be of type %r"
+        % (module.Tagged.__module__, module.Validator),
+    )
+
+    # Tagged unions accept only mappings
+    v = module.OneOf(module.Str(), v)
+    assert v("x") == "x"
+    assert v({"type": "label", "text": "x"}) == {"type": "label", "text": "x"}
+
+
+def test_tagged_context(module):
+    class MarkContext(module.Validator):
+        def __call__(self, value, __context=None):
+            __context["marked"] = True
+            return value
+
+    v = module.Tagged("type", {"x": MarkContext()})
+
+    context = {}
+    v({"type": "x"}, context)
+    assert context["marked"]
+    assert v({"type": "x"}) == {"type": "x"}
@@ -0,0 +1,214 @@
+import json
+from decimal import Decimal
+from datetime import date, time, datetime, timezone
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from validx import serializers
+
+
+def test_probe():
+    value = {
+        "a": [1, 2.5, "x", True, None],
+        "b": (date(2020, 1, 2), time(3, 4)),
+        "c": {Decimal("1.10")},
+        "d": datetime(2020, 1, 2, 3, 4, tzinfo=timezone.utc),
+        "e": b"x",
+    }
+    assert serializers.probe(value) == {
+        "a": [1, 2.5, "x", True, None],
+        "b": ["2020-01-02", "03:04:00"],
+        "c": ["1.10"],
+        "d": "2020-01-02T03:04:00+00:00",
+        "e": b"x",
+    }
+
+
+def test_scalars(module):
+    serialize = module.Int().serializer()
+    assert serialize(1) == 1
+
+    serialize = module.Decimal(nullable=True).serializer()
+    assert serialize(Decimal("1.10")) == "1.10"
+    assert serialize(None) is None
+
+    serialize = module.Date(nullable=True).serializer()
+    assert serialize(date(2020, 1, 2)) == "2020-01-02"
+    assert serialize(None) is None
+
+    serialize = module.Time().serializer()
+    assert serialize(time(3, 4)) == "03:04:00"
+
+    serialize = module.Datetime().serializer()
+    assert serialize(datetime(2020, 1, 2, 3, 4)) == "2020-01-02T03:04:00"
+
+    serialize = module.Const("x").serializer()
+    assert serialize("x") == "x"
+
+    serialize = module.Const((1, 2)).serializer()
+    assert serialize((1, 2)) == [1, 2]
+
+    serialize = module.Any().serializer()
+    assert serialize({"x": date(2020, 1, 2)}) == {"x": "2020-01-02"}
+
+
+def test_containers(module):
+    value = [1, 2]
+    assert module.List(module.Int()).serializer()(value) is value
+
+    serialize = module.List(module.Date(), nullable=True).serializer()
+    assert serialize([date(2020, 1, 2)]) == ["2020-01-02"]
+    assert serialize(None) is None
+
+    serialize = module.Set(module.Int(), nullable=True).serializer()
+    assert serialize({1}) == [1]
+    assert serialize(None) is None
+
+    serialize = module.Set(module.Decimal()).serializer()
+    assert serialize({Decimal("1.5")}) == ["1.5"]
+
+    value = (1, "x")
+    assert module.Tuple(module.Int(), module.Str()).serializer()(value) is value
+
+    serialize = module.Tuple(module.Int(), module.Date(), nullable=True).serializer()
+    assert serialize((1, date(2020, 1, 2))) == [1, "2020-01-02"]
+    assert serialize(None) is None
+
+    value = {"x": 1}
+    assert module.Dict({"x": module.Int()}).serializer()(value) is value
+
+    v = module.Dict(
+        {"x": module.Int(), "y": module.Date()},
+        extra=(module.Str(), module.Decimal()),
+        optional=["y"],
+        nullable=True,
+    )
+    serialize = v.serializer()
+    value = {"x": 1, "y": date(2020, 1, 2), "z": Decimal("1.5")}
+    assert serialize(value) == {"x": 1, "y": "2020-01-02", "z": "1.5"}
+    assert value["y"] == date(2020, 1, 2)
+    assert serialize({"x": 1}) == {"x": 1}
+    assert serialize(None) is None
+
+    serialize = module.Dict(extra=(module.Str(), module.Date())).serializer()
+    assert serialize({"x": date(2020, 1, 2)}) == {"x": "2020-01-02"}
+
+
+class Event(NamedTuple):
+    kind: str
+    date: date
+
+
+@dataclass
+class Note:
+    kind: str
+    text: str
+
+
+class Period(object):
+    __slots__ = ("start", "end")
+
+    def __init__(self, start, end=None):
+        self.start = start
+        if end is not None:
+            self.end = end
+
+
+def test_dict_into(module):
+    serialize = module.Dict(
+        {"kind": module.Str(), "date": module.Date()}, into=Event, nullable=True
+    ).serializer()
+    value = Event("x", date(2020, 1, 2))
+    assert serialize(value) == {"kind": "x", "date": "2020-01-02"}
+    assert serialize(None) is None
+
+    serialize = module.Dict({"kind": module.Str(), "text": module.Str()}, into=Note)
+    serialize = serialize.serializer()
+    assert serialize(Note("y", "z")) == {"kind": "y", "text": "z"}
+
+    v = module.Dict(
+        {"start": module.Date(), "end": module.Date()}, optional=["end"], into=Period
+    )
+    serialize = v.serializer()
+    assert serialize(v({"start": date(2020, 1, 2)})) == {"start": "2020-01-02"}
+    assert serialize(v({"start": date(2020, 1, 2), "end": date(2020, 1, 3)})) == {
+        "start": "2020-01-02",
+        "end": "2020-01-03",
+    }
+
+    v = module.Tagged(
+        "kind",
+        {
+            "event": module.Dict(
+                {"kind": module.Str(), "date": module.Date()}, into=Event
+            ),
+            "note": module.Dict({"kind": module.Str(), "text": module.Str()}, into=Note),
+            "raw": module.Dict({"kind": module.Str(), "date": module.Date()}),
+        },
+    )
+    serialize = v.serializer()
+    assert serialize(v({"kind": "event", "date": date(2020, 1, 2)})) == {
+        "kind": "event",
+        "date": "2020-01-02",
+    }
+    assert serialize(v({"kind": "note", "text": "x"})) == {"kind": "note", "text": "x"}
+    assert serialize(v({"kind": "raw", "date": date(2020, 1, 2)})) == {
+        "kind": "raw",
+        "date": "2020-01-02",
+    }
+
+
+def test_pipelines(module):
+    serialize = module.AllOf(module.Any(), module.Datetime()).serializer()
+    assert serialize(datetime(2020, 1, 2)) == "2020-01-02T00:00:00"
+
+    serialize = module.OneOf(module.Int(), module.Date()).serializer()
+    assert serialize(1) == 1
+    assert serialize(date(2020, 1, 2)) == "2020-01-02"
+
+    v = module.Tagged(
+        "kind",
+        {
+            "a": module.Dict({"kind": module.Str(), "x": module.Int()}),
+            "b": module.Dict({"kind": module.Str(), "x": module.Date()}),
+        },
+    )
+    serialize = v.serializer()
+    assert serialize({"kind": "a", "x": 1}) == {"kind": "a", "x": 1}
+    assert serialize({"kind": "b", "x": date(2020, 1, 2)}) == {
+        "kind": "b",
+        "x": "2020-01-02",
+    }
+
+    value = {"kind": "a", "x": 1}
+    v = module.Tagged("kind", {"a": module.Dict({"kind": module.Str()})})
+    assert v.serializer()(value) is value
+
+    serialize = module.Budget(module.Date(), maxnodes=1).serializer()
+    assert serialize(date(2020, 1, 2)) == "2020-01-02"
+
+
+def test_lazy_ref(module):
+    v = module.Dict(
+        {"date": module.Date(), "children": module.List(module.LazyRef("node"))},
+        optional=["children"],
+        alias="node",
+    )
+    serialize = v.serializer()
+    value = v(
+        {
+            "date": date(2020, 1, 1),
+            "children": [{"date": date(2020, 1, 2), "children": []}],
+        }
+    )
+    result = serialize(value)
+    assert result == {
+        "date": "2020-01-01",
+        "children": [{"date": "2020-01-02", "children": []}],
+    }
+    assert json.loads(json.dumps(result)) == result
+
+    serialize = module.LazyRef("int").serializer()
+    module.Int(alias="int")
+    assert serialize(1) == 1
+    assert serialize(2) == 2
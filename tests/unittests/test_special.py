@@ -1,4 +1,5 @@
 import pickle
+import time
 from collections import deque
 
 import pytest
@@ -56,7 +57,275 @@ def test_lazyref_context(module):
     context = {}
     v(None, context)
     assert context["marked"]
-    assert context["foo.recursion_depth"] == 0
+
+
+# =============================================================================
+
+
+def test_budget_nodes(module):
+    v = module.Budget(module.List(module.List(module.Int())), maxnodes=5)
+    assert v([[1, 2], [3]]) == [[1, 2], [3]]
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    with pytest.raises(exc.SchemaError) as info:
+        v([[1, 2], [3, 4]])
+    assert len(info.value) == 1
+    assert isinstance(info.value[0], exc.BudgetExceededError)
+    assert info.value[0].context == deque([1])
+    assert info.value[0].expected == 5
+    assert info.value[0].actual == 6
+    assert info.value[0].resource == "nodes"
+
+    # Huge container is rejected before processing of its items
+    with pytest.raises(exc.BudgetExceededError) as info:
+        v([[]] * 1000000)
+    assert info.value.actual == 1000000
+
+    v = module.Budget(
+        module.Dict(
+            {
+                "x": module.Tuple(module.Int(), module.Int()),
+                "y": module.Set(module.Int()),
+            }
+        ),
+        maxnodes=6,
+    )
+    assert v({"x": (1, 2), "y": {1, 2}}) == {"x": (1, 2), "y": {1, 2}}
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({"x": (1, 2), "y": {1, 2, 3}})
+    assert info.value[0].context == deque(["y"])
+    assert info.value[0].actual == 7
+
+
+def test_budget_nodes_iterator(module):
+    v = module.Budget(module.List(module.Int()), maxnodes=3)
+    assert v(iter([1, 2, 3])) == [1, 2, 3]
+    with pytest.raises(exc.BudgetExceededError) as info:
+        v(iter(range(1000000)))
+    assert info.value.expected == 3
+    assert info.value.actual == 4
+
+    v = module.Budget(module.Set(module.Int()), maxnodes=3)
+    assert v(iter([1, 2, 3])) == {1, 2, 3}
+    with pytest.raises(exc.BudgetExceededError) as info:
+        v(iter(range(1000000)))
+    assert info.value.actual == 4
+
+
+def test_budget_chars(module):
+    v = module.Budget(
+        module.Dict(extra=(module.Str(), module.Bytes())), maxchars=6
+    )
+    assert v({"a": b"xy", "b": b"z"}) == {"a": b"xy", "b": b"z"}
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({"a": b"xy", "b": b"zzz"})
+    assert len(info.value) == 1
+    assert info.value[0].context == deque(["b", exc.EXTRA_VALUE])
+    assert info.value[0].expected == 6
+    assert info.value[0].actual == 7
+    assert info.value[0].resource == "chars"
+
+    v = module.Budget(module.Str(encoding="utf-8"), maxchars=3)
+    assert v(b"abc") == "abc"
+    with pytest.raises(exc.BudgetExceededError) as info:
+        v(b"abcd")
+    assert info.value.actual == 4
+
+    # Validators still can be called without context
+    assert module.Str()("abc") == "abc"
+    assert module.Bytes()(b"abc") == b"abc"
+
+
+def test_budget_depth(module):
+    v = module.Budget(
+        module.Dict({"x": module.LazyRef("foo")}, optional=["x"], alias="foo"),
+        maxdepth=2,
+    )
+    data = {"x": {"x": {}}}
+    assert v(data) == data
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({"x": {"x": {"x": {}}}})
+    assert len(info.value) == 1
+    assert info.value[0].context == deque(["x", "x", "x"])
+    assert info.value[0].expected == 2
+    assert info.value[0].actual == 3
+    assert info.value[0].resource == "depth"
+
+    # Depth is restored on leaving each reference
+    data = {"x": {"x": {}}}
+    v = module.Budget(module.List(module.LazyRef("foo")), maxdepth=3)
+    assert v([data, data]) == [data, data]
+
+
+def test_budget_timeout(module):
+    class Sleep(module.Validator):
+        def __call__(self, value, __context=None):
+            time.sleep(0.02)
+            return value
+
+    v = module.Budget(
+        module.Tuple(Sleep(), module.List(module.Int())), timeout=0.01
+    )
+    with pytest.raises(exc.SchemaError) as info:
+        v((None, [1]))
+    assert len(info.value) == 1
+    assert info.value[0].context == deque([1])
+    assert info.value[0].expected == 0.01
+    assert info.value[0].actual > 0.01
+    assert info.value[0].resource == "time"
+
+    v = module.Budget(module.List(module.Int()), timeout=10)
+    assert v([1]) == [1]
+
+
+def test_budget_nested(module):
+    inner = module.Budget(module.List(module.Int()), maxnodes=10)
+    v = module.Budget(module.List(inner), maxnodes=6)
+    assert v([[1, 2], [3, 4]]) == [[1, 2], [3, 4]]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v([[1, 2], [3, 4, 5]])
+    assert info.value[0].context == deque([1])
+    assert info.value[0].expected == 2
+    assert info.value[0].actual == 3
+
+    # The outer budget is exhausted by the inner one
+    with pytest.raises(exc.SchemaError) as info:
+        v([[1, 2], [3, 4, 5], [6]])
+    assert len(info.value) == 1
+
+    inner = module.Budget(module.List(module.Int()), maxnodes=2)
+    v = module.Budget(module.List(inner), maxnodes=10)
+    with pytest.raises(exc.SchemaError) as info:
+        v([[1, 2], [3, 4, 5]])
+    assert info.value[0].context == deque([1])
+    assert info.value[0].expected == 2
+    assert info.value[0].actual == 3
+
+    # Exhausted inner budget does not affect the outer one
+    with pytest.raises(exc.SchemaError) as info:
+        v([[1, 2, 3], [4, 5, 6]])
+    assert len(info.value) == 2
+
+    for outer_timeout, inner_timeout in [(10, None), (10, 100), (100, 10), (None, 10)]:
+        context = {}
+        inner = module.Budget(module.Any(), timeout=inner_timeout)
+        module.Budget(
+            module.AllOf(inner, module.Any()), timeout=outer_timeout
+        )(None, context)
+        assert context == {}
+
+    # Timeout of the outer budget is inherited
+    class Sleep(module.Validator):
+        def __call__(self, value, __context=None):
+            time.sleep(0.02)
+            return value
+
+    inner = module.Budget(module.Tuple(Sleep(), module.List(module.Int())))
+    v = module.Budget(inner, timeout=0.01)
+    with pytest.raises(exc.SchemaError) as info:
+        v((None, [1]))
+    assert info.value[0].expected == 0.01
+    assert info.value[0].resource == "time"
+
+    inner = module.Budget(
+        module.Tuple(Sleep(), module.List(module.Int())), timeout=100
+    )
+    v = module.Budget(inner, timeout=0.01)
+    with pytest.raises(exc.SchemaError) as info:
+        v((None, [1]))
+    assert info.value[0].expected == 0.01
+
+
+def test_budget_exhausted(module):
+    class Count(module.Validator):
+        calls = 0
+
+        def __call__(self, value, __context=None):
+            Count.calls += 1
+            return value
+
+    # The rest of items is rejected without processing
+    v = module.Budget(
+        module.List(module.AllOf(Count(), module.Str())), maxchars=10
+    )
+    with pytest.raises(exc.SchemaError) as info:
+        v(["abcdefghij"] * 200000)
+    assert len(info.value) == 1
+    assert info.value[0].context == deque([1, exc.Step(1)])
+    assert info.value[0].resource == "chars"
+    assert Count.calls == 2
+
+    string = "x" * 11
+    for v, data, context in [
+        (module.List(module.Str(), inplace=True), [string] * 2, [0]),
+        (module.Set(module.Str()), {string, string + "x"}, [None]),
+        (
+            module.Dict({"x": module.Str(), "y": module.Str()}, optional=["y"]),
+            {"x": string, "z": None},
+            ["x"],
+        ),
+        (module.Dict({"x": module.Str()}, defaults={"x": lambda: string}), {}, ["x"]),
+        (module.Dict(extra=(module.Str(), module.Str())), {string: "y"}, [string]),
+        (
+            module.Dict({"x": module.Str()}, optional=["x"], inplace=True),
+            {"x": string, "y": None, "z": None},
+            ["x"],
+        ),
+        (
+            module.Dict(extra=(module.Str(), module.Str()), inplace=True),
+            {string: "y", "z": "z"},
+            [string],
+        ),
+        (
+            module.Dict(extra=(module.Str(), module.Str()), inplace=True),
+            {"y": string, "z": "z"},
+            ["y"],
+        ),
+    ]:
+        with pytest.raises(exc.SchemaError) as info:
+            module.Budget(v, maxchars=10)(data)
+        assert len(info.value) == 1
+        assert list(info.value[0].context)[: len(context)] == context
+        assert info.value[0].resource == "chars"
+
+    # The rest of steps is not tried
+    v = module.Budget(
+        module.OneOf(
+            module.Tuple(module.Str(), module.Int()), module.List(module.Str())
+        ),
+        maxchars=10,
+    )
+    with pytest.raises(exc.SchemaError) as info:
+        v([string, 1])
+    assert len(info.value) == 1
+    assert info.value[0].context == deque([exc.Step(0), 0])
+
+
+def test_budget_exhausted_one_of_fallback(module, monkeypatch):
+    monkeypatch.setattr(module.pipelines, "_accepts", lambda step, tp: tp is not str)
+    v = module.Budget(module.OneOf(module.Str(), module.Int()), maxchars=10)
+    with pytest.raises(exc.BudgetExceededError) as info:
+        v("x" * 11)
+    assert info.value.context == deque([exc.Step(0)])
+
+
+def test_budget_context(module):
+    v = module.Budget(module.Int(), maxnodes=1)
+    context = {}
+    assert v(1, context) == 1
+    assert context == {}
+
+    with pytest.raises(TypeError) as info:
+        module.Budget(module.Int(), timeout=True)
+    assert info.value.args == (
+        "%s.Budget.timeout should not be of type %r"
+        % (module.Budget.__module__, bool),
+    )
 
 
 # =============================================================================
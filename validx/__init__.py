@@ -4,6 +4,7 @@ try:
     from .cy import (
         __impl__,
         Validator,
+        ValidationContext,
         Int,
         Float,
         Decimal,
@@ -19,7 +20,9 @@ try:
         Dict,
         AllOf,
         OneOf,
+        Tagged,
         LazyRef,
+        Budget,
         Type,
         Const,
         Any,
@@ -30,6 +33,7 @@ except ImportError:  # pragma: no cover
     from .py import (  # type: ignore
         __impl__,
         Validator,
+        ValidationContext,
         Int,
         Float,
         Decimal,
@@ -45,7 +49,9 @@ except ImportError:  # pragma: no cover
         Dict,
         AllOf,
         OneOf,
+        Tagged,
         LazyRef,
+        Budget,
         Type,
         Const,
         Any,
@@ -53,10 +59,14 @@ except ImportError:  # pragma: no cover
         instances,
     )
 
+from . import jsonschema
+from .hints import from_type
+
 
 __all__ = [
     "exc",
     "Validator",
+    "ValidationContext",
     "Int",
     "Float",
     "Decimal",
@@ -72,12 +82,16 @@ __all__ = [
     "Dict",
     "AllOf",
     "OneOf",
+    "Tagged",
     "LazyRef",
+    "Budget",
     "Type",
     "Const",
     "Any",
     "classes",
     "instances",
+    "from_type",
+    "jsonschema",
 ]
 
 __impl__ = __impl__
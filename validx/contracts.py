@@ -126,7 +126,7 @@ def expect_length(obj, attr, value, nullable=False):
     return value
 
 
-def expect_str(obj, attr, value, nullable=False):
+def expect_str(obj, attr, value, nullable=False, options=None):
     """
     Check, whether the value satisfies expectations of base string
 
@@ -146,11 +146,25 @@ def expect_str(obj, attr, value, nullable=False):
         accept ``None`` as a valid value.
         Default: ``False`` — does not accept ``None``.
 
+    :param options:
+        acceptable values.
+        Default: ``None`` — accept any string.
+    :type options: None or tuple
+
     :raises TypeError:
         if ``not isinstance(value, str)``.
 
+    :raises ValueError:
+        if ``options is not None`` and ``value not in options``.
+
     """
-    return expect(obj, attr, value, nullable=nullable, types=str)
+    value = expect(obj, attr, value, nullable=nullable, types=str)
+    if value is not None and options is not None and value not in options:
+        raise ValueError(
+            "%s.%s.%s should be one of %r"
+            % (obj.__class__.__module__, obj.__class__.__name__, attr, options)
+        )
+    return value
 
 
 def expect_callable(obj, attr, value, nullable=False):
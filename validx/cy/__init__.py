@@ -1,11 +1,12 @@
 from .abstract import Validator
+from .context import ValidationContext
 from .numbers import Int, Float, Decimal
 from .chars import Str, Bytes
 from .datetimes import Date, Time, Datetime
 from .bools import Bool
 from .containers import List, Set, Tuple, Dict
-from .pipelines import AllOf, OneOf
-from .special import LazyRef, Type, Const, Any
+from .pipelines import AllOf, OneOf, Tagged
+from .special import LazyRef, Budget, Type, Const, Any
 from . import classes, instances
 
 
@@ -13,6 +14,7 @@ __impl__ = "Cython"
 
 __all__ = [
     "Validator",
+    "ValidationContext",
     "Int",
     "Float",
     "Decimal",
@@ -28,7 +30,9 @@ __all__ = [
     "Dict",
     "AllOf",
     "OneOf",
+    "Tagged",
     "LazyRef",
+    "Budget",
     "Type",
     "Const",
     "Any",
@@ -52,7 +56,9 @@ classes.add(Tuple)
 classes.add(Dict)
 classes.add(AllOf)
 classes.add(OneOf)
+classes.add(Tagged)
 classes.add(LazyRef)
+classes.add(Budget)
 classes.add(Type)
 classes.add(Const)
 classes.add(Any)
@@ -1,6 +1,8 @@
+import json
 from warnings import warn
 from collections.abc import Mapping, Sequence, Container
 
+from .. import serializers, jsonschema
 from . cimport classes, instances
 
 
@@ -50,10 +52,112 @@ cdef class Validator:
 
     def params(self):
         for slot in self.__slots__:
+            if slot.startswith("_"):
+                continue  # Private state is not a parameter
             value = getattr(self, slot)
             if value is not None and value is not False:
                 yield slot, value
 
+    def loads(self, data, **kw):
+        """
+        Decode JSON document and validate the result.
+
+        :param data:
+            JSON document.
+        :type data: str, bytes or bytearray
+
+        :param \\**kw:
+            keyword arguments for :func:`json.loads`,
+            e.g. ``parse_float=decimal.Decimal``.
+
+        :raises json.JSONDecodeError:
+            if the document is not valid JSON.
+            Like :class:`validx.exc.ValidationError`,
+            it is a subclass of ``ValueError``.
+
+        Containers of the decoded document are not used anywhere else,
+        so it is safe to validate them using ``inplace`` parameter
+        of :class:`validx.py.List` and :class:`validx.py.Dict` validators,
+        which avoids allocation of new containers.
+
+        ..  testsetup:: loads
+
+            from validx import Dict, List, Int
+
+        ..  doctest:: loads
+
+            >>> schema = Dict({"x": List(Int(), inplace=True)}, inplace=True)
+            >>> schema.loads(b'{"x": [1, 2, 3]}')
+            {'x': [1, 2, 3]}
+
+        """
+        return self(json.loads(data, **kw))
+
+    def serializer(self):
+        """
+        Build serializer of validated data.
+
+        The serializer is a function,
+        that converts data returned by the validator into JSON-ready data,
+        i.e. the result can be passed to :func:`json.dumps` as is.
+        Dates and times are converted into ISO 8601 strings,
+        decimals — into strings, sets and tuples — into lists.
+        Conversions are picked using the validator tree,
+        so values are not probed for their types,
+        except ones returned by ``OneOf``, ``Type``, and ``Any`` validators.
+        Parts of data, that are JSON-ready as is, are not walked at all.
+
+        The serializer should be built once and reused.
+
+        ..  testsetup:: serializer
+
+            from datetime import date
+            from validx import Dict, List, Date, Int
+
+        ..  doctest:: serializer
+
+            >>> schema = Dict({"id": Int(), "dates": List(Date())})
+            >>> serialize = schema.serializer()
+            >>> serialize(schema({"id": 1, "dates": [date(2020, 1, 2)]}))
+            {'id': 1, 'dates': ['2020-01-02']}
+
+        """
+        return serializers.build(self, lambda alias: instances.get(alias))
+
+    def to_jsonschema(self):
+        """
+        Export validator into JSON Schema.
+
+        The validator is dumped (see :meth:`dump`),
+        and then converted into JSON Schema document of draft 2020-12,
+        see :func:`validx.jsonschema.dump` for supported validators.
+        Documents are loaded back by :func:`validx.jsonschema.load`.
+
+        :raises ValueError:
+            if the validator cannot be expressed in JSON Schema.
+
+        ..  testsetup:: to_jsonschema
+
+            from validx import Dict, Int, Str
+
+        ..  doctest:: to_jsonschema
+
+            >>> schema = Dict({"id": Int(min=1), "name": Str()}, optional=["name"])
+            >>> schema.to_jsonschema() == {
+            ...     "$schema": "https://json-schema.org/draft/2020-12/schema",
+            ...     "type": "object",
+            ...     "properties": {
+            ...         "id": {"type": "integer", "minimum": 1},
+            ...         "name": {"type": "string"},
+            ...     },
+            ...     "required": ["id"],
+            ...     "additionalProperties": False,
+            ... }
+            True
+
+        """
+        return jsonschema.dump(self, lambda alias: instances.get(alias))
+
     def dump(self):
         """
         Dump validator.
@@ -141,44 +245,7 @@ cdef class Validator:
             % params
         )
 
-        _update = {}
-        _unset = {}
-
-        if update is not None:
-            for key, value in update.items():
-                if key.startswith("/"):
-                    key = key.replace("/", ".").lstrip(".")
-                    _update[key] = value
-                    warn(
-                        "This syntax is deprecated. "
-                        "Consider to use '%s+' instead." % key,
-                        DeprecationWarning,
-                    )
-                elif key.endswith("+"):
-                    key = key.rstrip("+")
-                    _update[key] = value
-                elif key.endswith("-"):
-                    key = key.rstrip("-")
-                    _unset[key] = value
-                else:
-                    context_key, value_key = (
-                        key.rsplit(".", 1) if "." in key else ("", key)
-                    )
-                    _update.setdefault(context_key, {})[value_key] = value
-        if kw:
-            _update.setdefault("", {}).update(kw)
-
-        if unset is not None:
-            for key, value in unset.items():
-                key = key.replace("/", ".").lstrip(".")
-                _unset[key] = value
-                warn(
-                    "This syntax is deprecated. "
-                    "Consider to use '%s-' instead "
-                    "and place it into update param." % key,
-                    DeprecationWarning,
-                )
-
+        _update, _unset = _parse_update(update, unset, kw)
         return _load_recurcive(params, _update, _unset)
 
     def clone(self, update=None, unset=None, **kw):
@@ -202,14 +269,69 @@ cdef class Validator:
             True
 
 
-        In fact, the method is a shortcut for:
+        Only validators along updated paths are rebuilt,
+        nested validators untouched by the update are shared
+        with the original one by reference.
+        It is safe, because validators are immutable.
+        The result is equal to:
 
         ..  code-block:: python
 
             self.load(self.dump(), update, **kw)
 
         """
-        return self.load(self.dump(), update, unset, **kw)
+        _update, _unset = _parse_update(update, unset, kw)
+        return _clone_recursive(self, _update, _unset, _touched(_update, _unset))
+
+
+def _parse_update(update, unset, kw):
+    _update = {}
+    _unset = {}
+
+    if update is not None:
+        for key, value in update.items():
+            if key.startswith("/"):
+                key = key.replace("/", ".").lstrip(".")
+                _update[key] = value
+                warn(
+                    "This syntax is deprecated. "
+                    "Consider to use '%s+' instead." % key,
+                    DeprecationWarning,
+                )
+            elif key.endswith("+"):
+                key = key.rstrip("+")
+                _update[key] = value
+            elif key.endswith("-"):
+                key = key.rstrip("-")
+                _unset[key] = value
+            else:
+                context_key, value_key = key.rsplit(".", 1) if "." in key else ("", key)
+                _update.setdefault(context_key, {})[value_key] = value
+    if kw:
+        _update.setdefault("", {}).update(kw)
+
+    if unset is not None:
+        for key, value in unset.items():
+            key = key.replace("/", ".").lstrip(".")
+            _unset[key] = value
+            warn(
+                "This syntax is deprecated. "
+                "Consider to use '%s-' instead "
+                "and place it into update param." % key,
+                DeprecationWarning,
+            )
+
+    return _update, _unset
+
+
+def _touched(update, unset):
+    # Paths of updated nodes and all their ancestors, including the root one
+    result = {""}
+    for key in list(update) + list(unset):
+        parts = key.split(".")
+        for num in range(1, len(parts) + 1):
+            result.add(".".join(parts[:num]))
+    return result
 
 
 def _load_recurcive(params, update=None, unset=None, path=()):
@@ -222,55 +344,105 @@ def _load_recurcive(params, update=None, unset=None, path=()):
             key: _load_recurcive(value, update, unset, path + (str(key),))
             for key, value in params.items()
         }
-        if update_this is not None:
-            result.update(
-                {key: _load_recurcive(value) for key, value in update_this.items()}
-            )
-        if unset_this is not None:
-            for key in unset_this:
-                try:
-                    del result[key]
-                except KeyError:
-                    raise KeyError("%r is not in dict at '%s'" % (key, path_key))
-        if "__class__" in result:
-            classname = result.pop("__class__")
-            class_ = classes.get(classname)
-            return class_(**result)
-        if "__clone__" in result:
-            alias = result.pop("__clone__")
-            instance = instances.get(alias)
-            return instance.clone(**result)
-        if "__use__" in result:
-            return instances.get(result["__use__"])
-        return result
+        return _load_dict(result, update_this, unset_this, path_key)
 
     if isinstance(params, set):
-        result = set(params)
-        if update_this is not None:
-            result.update(update_this)
-        if unset_this is not None:
-            for value in unset_this:
-                try:
-                    result.remove(value)
-                except KeyError:
-                    raise KeyError("%r is not in set at '%s'" % (value, path_key))
-        return result
+        return _load_set(set(params), update_this, unset_this, path_key)
 
     if isinstance(params, list):
         result = [
             _load_recurcive(value, update, unset, path + (str(num),))
             for num, value in enumerate(params)
         ]
-        if update_this is not None:
-            result.extend(_load_recurcive(value) for value in update_this)
-        if unset_this is not None:
-            for value in unset_this:
-                value = _load_recurcive(value)
-                try:
-                    result.remove(value)
-                except ValueError:
-                    raise ValueError("%r is not in list at '%s'" % (value, path_key))
-        return result
+        return _load_list(result, update_this, unset_this, path_key)
 
     return params
 
+
+def _clone_recursive(value, update, unset, touched, path=()):
+    # It works like ``_load_recurcive(value.dump(), ...)``,
+    # but walks the validator tree itself,
+    # and rebuilds only nodes along updated paths
+    path_key = ".".join(path)
+    if path_key not in touched:
+        return value  # Untouched subtree is shared
+    update_this = update.get(path_key)
+    unset_this = unset.get(path_key)
+
+    if isinstance(value, Validator):
+        items = [("__class__", value.__class__.__name__)]
+        items.extend(value.params())
+    elif isinstance(value, Mapping):
+        items = value.items()
+    else:
+        items = None
+    if items is not None:
+        result = {
+            key: _clone_recursive(item, update, unset, touched, path + (str(key),))
+            for key, item in items
+        }
+        return _load_dict(result, update_this, unset_this, path_key)
+
+    if isinstance(value, (str, bytes)):
+        return value
+
+    if isinstance(value, Sequence):
+        result = [
+            _clone_recursive(item, update, unset, touched, path + (str(num),))
+            for num, item in enumerate(value)
+        ]
+        return _load_list(result, update_this, unset_this, path_key)
+
+    if isinstance(value, Container):
+        return _load_set(set(value), update_this, unset_this, path_key)
+
+    return value
+
+
+def _load_dict(result, update_this, unset_this, path_key):
+    if update_this is not None:
+        result.update(
+            {key: _load_recurcive(value) for key, value in update_this.items()}
+        )
+    if unset_this is not None:
+        for key in unset_this:
+            try:
+                del result[key]
+            except KeyError:
+                raise KeyError("%r is not in dict at '%s'" % (key, path_key))
+    if "__class__" in result:
+        classname = result.pop("__class__")
+        class_ = classes.get(classname)
+        return class_(**result)
+    if "__clone__" in result:
+        alias = result.pop("__clone__")
+        instance = instances.get(alias)
+        return instance.clone(**result)
+    if "__use__" in result:
+        return instances.get(result["__use__"])
+    return result
+
+
+def _load_set(result, update_this, unset_this, path_key):
+    if update_this is not None:
+        result.update(update_this)
+    if unset_this is not None:
+        for value in unset_this:
+            try:
+                result.remove(value)
+            except KeyError:
+                raise KeyError("%r is not in set at '%s'" % (value, path_key))
+    return result
+
+
+def _load_list(result, update_this, unset_this, path_key):
+    if update_this is not None:
+        result.extend(_load_recurcive(value) for value in update_this)
+    if unset_this is not None:
+        for value in unset_this:
+            value = _load_recurcive(value)
+            try:
+                result.remove(value)
+            except ValueError:
+                raise ValueError("%r is not in list at '%s'" % (value, path_key))
+    return result
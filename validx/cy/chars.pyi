@@ -13,6 +13,8 @@ class Str(abstract.Validator):
     maxlen: t.Optional[int]
     pattern: t.Optional[str]
     options: t.Optional[t.Container[str]]
+    max_input_len: t.Optional[int]
+    match: t.Optional[str]
 
     def __init__(
         self,
@@ -24,8 +26,10 @@ class Str(abstract.Validator):
         encoding: t.Optional[str] = None,
         minlen: t.Optional[int] = None,
         maxlen: t.Optional[int] = None,
-        pattern: t.Optional[str] = None,
+        pattern: t.Union[str, t.Pattern[str], None] = None,
         options: t.Optional[t.Container[str]] = None,
+        max_input_len: t.Optional[int] = None,
+        match: t.Optional[str] = None,
         alias: t.Optional[str] = None,
         replace: bool = False,
     ) -> None:
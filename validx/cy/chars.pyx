@@ -4,6 +4,7 @@ import re
 from .. import exc
 from .. import contracts
 from . cimport abstract
+from .context cimport ValidationContext
 
 
 cdef class Str(abstract.Validator):
@@ -33,12 +34,30 @@ cdef class Str(abstract.Validator):
     :param int maxlen:
         upper length limit.
 
-    :param str pattern:
+    :param pattern:
         validate string using regular expression.
+        It is compiled on creation of the validator.
+        Compiled pattern is also accepted,
+        its flags are kept as inline ones,
+        so the validator is dumped with pattern as a string.
+    :type pattern: str or re.Pattern
+
+    :param str match:
+        how ``pattern`` is matched:
+        ``"full"`` — against the whole string,
+        ``"prefix"`` — against beginning of the string (default),
+        ``"search"`` — anywhere in the string.
 
     :param iterable options:
         explicit enumeration of valid values.
 
+    :param int max_input_len:
+        upper length limit of raw input value,
+        it is checked before any decoding and transformation,
+        i.e. it limits amount of work on pathologically long values.
+        For ``bytes`` it is number of bytes,
+        for coerced values it is length of their string representation.
+
 
     :raises InvalidTypeError:
         * if ``value is None`` and ``not self.nullable``;
@@ -51,7 +70,8 @@ cdef class Str(abstract.Validator):
         if ``len(value) < self.minlen``.
 
     :raises MaxLengthError:
-        if ``len(value) > self.maxlen``.
+        * if ``len(value) > self.max_input_len`` before any transformation;
+        * if ``len(value) > self.maxlen``.
 
     :raises PatternMatchError:
         if ``value`` does not match ``self.pattern``.
@@ -79,6 +99,8 @@ cdef class Str(abstract.Validator):
         "maxlen",
         "pattern",
         "options",
+        "max_input_len",
+        "match",
     )
 
     cdef bint _nullable
@@ -90,6 +112,9 @@ cdef class Str(abstract.Validator):
     cdef long _maxlen
     cdef str _pattern
     cdef frozenset _options
+    cdef long _max_input_len
+    cdef str _match_mode
+    cdef object _match
 
     @property
     def nullable(self):
@@ -127,6 +152,16 @@ cdef class Str(abstract.Validator):
     def options(self):
         return self._options
 
+    @property
+    def max_input_len(self):
+        if self._max_input_len == limits.LONG_MAX:
+            return None
+        return self._max_input_len
+
+    @property
+    def match(self):
+        return self._match_mode
+
     def __init__(
         self,
         nullable=False,
@@ -138,6 +173,8 @@ cdef class Str(abstract.Validator):
         maxlen=None,
         pattern=None,
         options=None,
+        max_input_len=None,
+        match=None,
         alias=None,
         replace=False,
     ):
@@ -148,10 +185,21 @@ cdef class Str(abstract.Validator):
         encoding = contracts.expect_str(self, "encoding", encoding, nullable=True)
         minlen = contracts.expect_length(self, "minlen", minlen, nullable=True)
         maxlen = contracts.expect_length(self, "maxlen", maxlen, nullable=True)
-        pattern = contracts.expect_str(self, "pattern", pattern, nullable=True)
+        if isinstance(pattern, _Pattern):
+            regex = pattern
+            pattern = contracts.expect_str(self, "pattern", _pattern_source(pattern))
+        else:
+            pattern = contracts.expect_str(self, "pattern", pattern, nullable=True)
+            regex = re.compile(pattern) if pattern else None
         options = contracts.expect_container(
             self, "options", options, nullable=True, item_type=str
         )
+        max_input_len = contracts.expect_length(
+            self, "max_input_len", max_input_len, nullable=True
+        )
+        match = contracts.expect_str(
+            self, "match", match, nullable=True, options=_MATCH_MODES
+        )
 
         self._nullable = nullable
         self._coerce = coerce
@@ -162,14 +210,23 @@ cdef class Str(abstract.Validator):
         self._maxlen = limits.LONG_MAX if maxlen is None else maxlen
         self._pattern = pattern
         self._options = options
+        self._max_input_len = (
+            limits.LONG_MAX if max_input_len is None else max_input_len
+        )
+        self._match_mode = match
+        self._match = _match_method(regex, match)
 
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
         if value is None and self.nullable:
             return value
+        cdef long length
         if not isinstance(value, str):
             if isinstance(value, bytes) and self.encoding is not None:
+                length = len(value)
+                if length > self._max_input_len:
+                    raise exc.MaxLengthError(expected=self.max_input_len, actual=length)
                 try:
                     value = value.decode(self.encoding)
                 except UnicodeDecodeError:
@@ -178,16 +235,27 @@ cdef class Str(abstract.Validator):
                 value = str(value)
             else:
                 raise exc.InvalidTypeError(expected=str, actual=type(value))
-        if not self.dontstrip:
+        length = len(value)
+        if isinstance(__context, ValidationContext):
+            budget = (<ValidationContext>__context).budget
+            if budget is not None:
+                budget.spend_chars(length)
+        if length > self._max_input_len:
+            raise exc.MaxLengthError(expected=self.max_input_len, actual=length)
+        if not self._dontstrip:
             value = value.strip()
-        if self.normspace:
+            if self._normspace:
+                # The same as ``re.sub(r"\s+", " ", value)`` for stripped value,
+                # but faster
+                value = " ".join(value.split())
+        elif self._normspace:
             value = re.sub(r"\s+", " ", value)
-        cdef long length = len(value)
+        length = len(value)
         if length < self._minlen:
             raise exc.MinLengthError(expected=self.minlen, actual=length)
         if length > self._maxlen:
             raise exc.MaxLengthError(expected=self.maxlen, actual=length)
-        if self.pattern and not re.match(self.pattern, value):
+        if self._match is not None and self._match(value) is None:
             raise exc.PatternMatchError(expected=self.pattern, actual=value)
         if self.options is not None and value not in self.options:
             raise exc.OptionsError(expected=self.options, actual=value)
@@ -258,8 +326,45 @@ cdef class Bytes(abstract.Validator):
         if not isinstance(value, bytes):
             raise exc.InvalidTypeError(expected=bytes, actual=type(value))
         cdef long length = len(value)
+        if isinstance(__context, ValidationContext):
+            budget = (<ValidationContext>__context).budget
+            if budget is not None:
+                budget.spend_chars(length)
         if length < self._minlen:
             raise exc.MinLengthError(expected=self.minlen, actual=length)
         if length > self._maxlen:
             raise exc.MaxLengthError(expected=self.maxlen, actual=length)
         return value
+
+
+_Pattern = type(re.compile(""))
+_MATCH_MODES = ("full", "prefix", "search")
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+
+
+def _pattern_source(regex):
+    # Flags passed to ``re.compile()`` are turned into inline ones,
+    # so the pattern can be dumped and compiled again.
+    if not isinstance(regex.pattern, str):
+        return regex.pattern  # It will be rejected by contract
+    flags = regex.flags & ~re.compile(regex.pattern).flags
+    inline = "".join(char for flag, char in _INLINE_FLAGS if flags & flag)
+    if not inline:
+        return regex.pattern
+    return "(?%s)%s" % (inline, regex.pattern)
+
+
+def _match_method(regex, match):
+    if regex is None:
+        return None
+    if match == "full":
+        return regex.fullmatch
+    if match == "search":
+        return regex.search
+    return regex.match
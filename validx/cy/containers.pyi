@@ -9,6 +9,8 @@ class List(abstract.Validator):
     minlen: t.Optional[int]
     maxlen: t.Optional[int]
     unique: t.Optional[bool]
+    dontcopy: t.Optional[bool]
+    inplace: t.Optional[bool]
 
     def __init__(
         self,
@@ -18,6 +20,8 @@ class List(abstract.Validator):
         minlen: t.Optional[int] = None,
         maxlen: t.Optional[int] = None,
         unique: t.Optional[bool] = None,
+        dontcopy: t.Optional[bool] = None,
+        inplace: t.Optional[bool] = None,
         alias: t.Optional[str] = None,
         replace: bool = False,
     ) -> None:
@@ -48,11 +52,13 @@ class Tuple(abstract.Validator):
     __slots__: t.Tuple[str, ...]
     items: t.List[abstract.Validator]
     nullable: t.Optional[bool]
+    dontcopy: t.Optional[bool]
 
     def __init__(
         self,
         *items: abstract.Validator,
         nullable: t.Optional[bool] = None,
+        dontcopy: t.Optional[bool] = None,
         alias: t.Optional[str] = None,
         replace: bool = False,
     ) -> None:
@@ -70,6 +76,10 @@ class Dict(abstract.Validator):
     optional: t.Optional[t.Container]
     dispose: t.Optional[t.Container]
     multikeys: t.Optional[t.Container]
+    dontcopy: t.Optional[bool]
+    inplace: t.Optional[bool]
+    prevalidate: t.Optional[bool]
+    into: t.Optional[t.Callable[..., t.Any]]
 
     def __init__(
         self,
@@ -83,6 +93,10 @@ class Dict(abstract.Validator):
         optional: t.Optional[t.Container] = None,
         dispose: t.Optional[t.Container] = None,
         multikeys: t.Optional[t.Container] = None,
+        dontcopy: t.Optional[bool] = None,
+        inplace: t.Optional[bool] = None,
+        prevalidate: t.Optional[bool] = None,
+        into: t.Optional[t.Callable[..., t.Any]] = None,
         alias: t.Optional[str] = None,
         replace: bool = False,
     ) -> None:
@@ -1,11 +1,18 @@
 from libc cimport limits
 
+import decimal
+import datetime
+import inspect
 from copy import deepcopy
-from collections.abc import Sequence, Mapping, Iterable
+from functools import partial
+from itertools import islice
+from collections.abc import Sequence, Mapping, Iterable, Sized
 
 from .. import exc
 from .. import contracts
 from . cimport abstract
+from . import special
+from .context cimport ValidationContext, setup_context
 
 
 cdef class List(abstract.Validator):
@@ -35,6 +42,18 @@ cdef class List(abstract.Validator):
     :param bool unique:
         drop duplicate items.
 
+    :param bool dontcopy:
+        return the original list,
+        if it is not changed by validation
+        and has not to be sorted.
+
+    :param bool inplace:
+        write validated items back into the original list,
+        instead of building a new one.
+        It affects only values of ``list`` type,
+        a new list is built for any other iterable.
+        If validation fails, the original list may be partially modified.
+
 
     :raises InvalidTypeError:
         if ``not isinstance(value, Iterable)``
@@ -45,6 +64,10 @@ cdef class List(abstract.Validator):
 
     :raises MaxLengthError:
         if ``len(value) > self.maxlen``.
+        Length of sized value is checked before validation of its items,
+        unless ``unique`` is set.
+        Otherwise, validation stops as soon as the number of valid items
+        exceeds ``maxlen``.
 
     :raises SchemaError:
         with all errors,
@@ -60,6 +83,8 @@ cdef class List(abstract.Validator):
         "minlen",
         "maxlen",
         "unique",
+        "dontcopy",
+        "inplace",
     )
 
     cdef object _item
@@ -69,6 +94,8 @@ cdef class List(abstract.Validator):
     cdef long _minlen
     cdef long _maxlen
     cdef bint _unique
+    cdef bint _dontcopy
+    cdef bint _inplace
 
     @property
     def item(self):
@@ -98,6 +125,14 @@ cdef class List(abstract.Validator):
     def unique(self):
         return self._unique
 
+    @property
+    def dontcopy(self):
+        return self._dontcopy
+
+    @property
+    def inplace(self):
+        return self._inplace
+
     def __init__(
         self,
         item,
@@ -107,6 +142,8 @@ cdef class List(abstract.Validator):
         minlen=None,
         maxlen=None,
         unique=False,
+        dontcopy=False,
+        inplace=False,
         alias=None,
         replace=False,
     ):
@@ -117,6 +154,8 @@ cdef class List(abstract.Validator):
         minlen = contracts.expect_length(self, "minlen", minlen, nullable=True)
         maxlen = contracts.expect_length(self, "maxlen", maxlen, nullable=True)
         unique = contracts.expect_flag(self, "unique", unique)
+        dontcopy = contracts.expect_flag(self, "dontcopy", dontcopy)
+        inplace = contracts.expect_flag(self, "inplace", inplace)
 
         self._item = item
         self._nullable = nullable
@@ -125,52 +164,144 @@ cdef class List(abstract.Validator):
         self._minlen = 0 if minlen is None else minlen
         self._maxlen = limits.LONG_MAX if maxlen is None else maxlen
         self._unique = unique
+        self._dontcopy = dontcopy
+        self._inplace = inplace
 
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
-        if __context is None:
-            __context = {}  # Setup context, if it's top level call
+        if type(__context) is not ValidationContext:
+            # Setup context, if it's top level call
+            __context = setup_context(__context)
 
         if value is None and self.nullable:
             return value
         if not isinstance(value, (list, tuple, set, frozenset)):
-            if not isinstance(value, Iterable) or isinstance(
-                value, (str, bytes, dict, Mapping)
+            if (
+                type(value) in _NOT_ITERABLE_TYPES
+                or not isinstance(value, Iterable)
+                or isinstance(value, (str, bytes, dict, Mapping))
             ):
                 raise exc.InvalidTypeError(expected=Iterable, actual=type(value))
 
-        result = []
+        budget = (<ValidationContext>__context).budget
+        if budget is not None:
+            if isinstance(value, Sized):
+                budget.spend_nodes(len(value))
+            else:
+                value = budget.iterate(value)  # Items are counted on the fly
+
+        # Upper limits of unique and consumed items, checked during iteration
+        cdef long limit = limits.LONG_MAX
+        cdef long raw_limit = limits.LONG_MAX
+        cdef long size
+        if self._minlen > 0 or self._maxlen < limits.LONG_MAX:
+            if not self._unique and isinstance(value, Sized):
+                # No items are dropped, so length of result is known in advance
+                size = len(value)
+                if size < self._minlen:
+                    raise exc.MinLengthError(expected=self.minlen, actual=size)
+                if size > self._maxlen:
+                    raise exc.MaxLengthError(expected=self.maxlen, actual=size)
+            elif self._unique:
+                limit = self._maxlen
+            else:
+                # Each item counts, whether it is valid or not,
+                # so unsized iterable is read no further than the limit
+                raw_limit = self._maxlen
+
+        if self._inplace and type(value) is list:
+            return self._validate_inplace(value, __context)
+
+        cdef list result
+        if self._dontcopy and not self._sort and type(value) is list:
+            result = None  # It will be created on the first changed item
+        else:
+            result = []
         errors = []
         if self.unique:
             unique = set()
 
+        cdef long count = 0
+        cdef long consumed = 0
         for num, val in _enumerate(value):
+            consumed += 1
+            if consumed > raw_limit:
+                raise exc.MaxLengthError(expected=self.maxlen, actual=consumed)
             try:
-                val = self.item(val, __context)
+                new_val = self.item(val, __context)
             except exc.ValidationError as e:
-                errors.extend(ne.add_context(num) for ne in e)
+                errors.append(e.add_context(num))
+                if budget is not None and budget.exhausted:
+                    raise exc.SchemaError(errors)
                 continue
             if self.unique:
-                if val in unique:
+                if new_val in unique:
+                    if result is None:
+                        result = value[:num]
                     continue
-                unique.add(val)
-            result.append(val)
+                unique.add(new_val)
+            count += 1
+            if count > limit:
+                raise exc.MaxLengthError(expected=self.maxlen, actual=count)
+            if result is None:
+                if new_val is val:
+                    continue
+                result = value[:num]
+            result.append(new_val)
 
         if errors:
             raise exc.SchemaError(errors)
+        if result is None:
+            result = value
 
+        # Upper limit has been already checked
         cdef long length = len(result)
         if length < self._minlen:
             raise exc.MinLengthError(expected=self.minlen, actual=length)
-        if length > self._maxlen:
-            raise exc.MaxLengthError(expected=self.maxlen, actual=length)
 
         if self._sort:
             result.sort(reverse=self._sort < 0, key=self._sort_key)
 
         return result
 
+    cdef list _validate_inplace(self, list value, context):
+        # Valid items are moved to the head of the list,
+        # so dropped duplicates are cut off with its tail.
+        cdef list errors = []
+        if self._unique:
+            unique = set()
+
+        cdef long length = 0
+        for num, val in enumerate(value):
+            try:
+                val = self._item(val, context)
+            except exc.ValidationError as e:
+                errors.append(e.add_context(num))
+                if context.budget is not None and context.budget.exhausted:
+                    raise exc.SchemaError(errors)
+                continue
+            if self._unique:
+                if val in unique:
+                    continue
+                unique.add(val)
+            value[length] = val
+            length += 1
+            if length > self._maxlen:
+                raise exc.MaxLengthError(expected=self.maxlen, actual=length)
+
+        if errors:
+            raise exc.SchemaError(errors)
+        del value[length:]
+
+        if length < self._minlen:
+            raise exc.MinLengthError(expected=self.minlen, actual=length)
+
+        if self._sort:
+            value.sort(reverse=self._sort < 0, key=self._sort_key)
+
+        return value
+
 
 cdef class Set(abstract.Validator):
     """
@@ -199,6 +330,8 @@ cdef class Set(abstract.Validator):
 
     :raises MaxLengthError:
         if ``len(value) > self.maxlen``.
+        Validation stops as soon as the number of unique valid items
+        exceeds ``maxlen``.
 
     :raises SchemaError:
         with all errors,
@@ -251,17 +384,27 @@ cdef class Set(abstract.Validator):
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
-        if __context is None:
-            __context = {}  # Setup context, if it's top level call
+        if type(__context) is not ValidationContext:
+            # Setup context, if it's top level call
+            __context = setup_context(__context)
 
         if value is None and self.nullable:
             return value
         if not isinstance(value, (list, tuple, set, frozenset)):
-            if not isinstance(value, Iterable) or isinstance(
-                value, (str, bytes, dict, Mapping)
+            if (
+                type(value) in _NOT_ITERABLE_TYPES
+                or not isinstance(value, Iterable)
+                or isinstance(value, (str, bytes, dict, Mapping))
             ):
                 raise exc.InvalidTypeError(expected=Iterable, actual=type(value))
 
+        budget = (<ValidationContext>__context).budget
+        if budget is not None:
+            if isinstance(value, Sized):
+                budget.spend_nodes(len(value))
+            else:
+                value = budget.iterate(value)  # Items are counted on the fly
+
         result = set()
         errors = []
 
@@ -269,18 +412,21 @@ cdef class Set(abstract.Validator):
             try:
                 val = self.item(val, __context)
             except exc.ValidationError as e:
-                errors.extend(ne.add_context(num) for ne in e)
+                errors.append(e.add_context(num))
+                if budget is not None and budget.exhausted:
+                    raise exc.SchemaError(errors)
                 continue
             result.add(val)
+            if len(result) > self._maxlen:
+                raise exc.MaxLengthError(expected=self.maxlen, actual=len(result))
 
         if errors:
             raise exc.SchemaError(errors)
 
+        # Upper limit has been already checked
         cdef long length = len(result)
         if length < self._minlen:
             raise exc.MinLengthError(expected=self.minlen, actual=length)
-        if length > self._maxlen:
-            raise exc.MaxLengthError(expected=self.maxlen, actual=length)
 
         return result
 
@@ -296,6 +442,10 @@ cdef class Tuple(abstract.Validator):
     :param bool nullable:
         accept ``None`` as a valid value.
 
+    :param bool dontcopy:
+        return the original tuple,
+        if it is not changed by validation.
+
 
     :raises InvalidTypeError:
         if ``not isinstance(value, (list, tuple))``.
@@ -309,10 +459,11 @@ cdef class Tuple(abstract.Validator):
 
     """
 
-    __slots__ = ("items", "nullable")
+    __slots__ = ("items", "nullable", "dontcopy")
 
     cdef tuple _items
     cdef bint _nullable
+    cdef bint _dontcopy
 
     @property
     def items(self):
@@ -322,42 +473,76 @@ cdef class Tuple(abstract.Validator):
     def nullable(self):
         return self._nullable
 
-    def __init__(self, *items_, items=None, nullable=False, alias=None, replace=False):
+    @property
+    def dontcopy(self):
+        return self._dontcopy
+
+    def __init__(
+        self,
+        *items_,
+        items=None,
+        nullable=False,
+        dontcopy=False,
+        alias=None,
+        replace=False,
+    ):
         items = contracts.expect_sequence(
             self, "items", items or items_, item_type=abstract.Validator
         )
         nullable = contracts.expect_flag(self, "nullable", nullable)
+        dontcopy = contracts.expect_flag(self, "dontcopy", dontcopy)
 
         self._items = items
         self._nullable = nullable
+        self._dontcopy = dontcopy
 
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
-        if __context is None:
-            __context = {}  # Setup context, if it's top level call
+        if type(__context) is not ValidationContext:
+            # Setup context, if it's top level call
+            __context = setup_context(__context)
 
         if value is None and self.nullable:
             return value
         if not isinstance(value, (list, tuple)):
-            if not isinstance(value, Sequence) or isinstance(value, (str, bytes)):
+            if (
+                type(value) in _NOT_SEQUENCE_TYPES
+                or not isinstance(value, Sequence)
+                or isinstance(value, (str, bytes))
+            ):
                 raise exc.InvalidTypeError(expected=Sequence, actual=type(value))
         if len(self.items) != len(value):
             raise exc.TupleLengthError(expected=len(self.items), actual=len(value))
-
-        result = []
+        budget = (<ValidationContext>__context).budget
+        if budget is not None:
+            budget.spend_nodes(len(value))
+
+        cdef list result
+        if self._dontcopy and type(value) is tuple:
+            result = None  # It will be created on the first changed item
+        else:
+            result = []
         errors = []
 
         for num, val in enumerate(value):
             try:
-                val = self.items[num](val, __context)
+                new_val = self.items[num](val, __context)
             except exc.ValidationError as e:
-                errors.extend(ne.add_context(num) for ne in e)
+                errors.append(e.add_context(num))
+                if budget is not None and budget.exhausted:
+                    raise exc.SchemaError(errors)
                 continue
-            result.append(val)
+            if result is None:
+                if new_val is val:
+                    continue
+                result = list(value[:num])
+            result.append(new_val)
 
         if errors:
             raise exc.SchemaError(errors)
+        if result is None:
+            return value
         return tuple(result)
 
 
@@ -385,6 +570,9 @@ cdef class Dict(abstract.Validator):
 
     :param dict defaults:
         default values for missing keys.
+        Immutable values (numbers, strings, tuples, etc.) are used as is,
+        callable ones are called to get a default value,
+        and other ones are deeply copied.
 
     :param optional:
         list of optional keys.
@@ -401,6 +589,38 @@ cdef class Dict(abstract.Validator):
         ``val = value.getall(key)`` or ``val = value.getlist(key)``.
     :type multikeys: list or tuple
 
+    :param bool dontcopy:
+        return the original dictionary,
+        if it is not changed by validation.
+
+    :param bool inplace:
+        write validated values back into the original dictionary,
+        and remove disposed keys from it,
+        instead of building a new one.
+        It affects only values of ``dict`` type,
+        a new dictionary is built for any other mapping.
+        If validation fails, the original dictionary may be partially modified.
+
+    :param bool prevalidate:
+        validate immutable defaults once on creation of the validator,
+        instead of each time they are used.
+        Use it only if validation of defaults does not depend on context
+        or current time.
+        Defaults of validators, that refer to other ones by ``LazyRef``,
+        are not prevalidated.
+
+    :param into:
+        callable, that builds the result from validated items
+        passed as keyword arguments,
+        e.g. a dataclass, a ``NamedTuple``, or a class with ``__slots__``.
+        Validated items are not copied into a new dictionary,
+        unless any of them is changed by validation.
+        If signature of the callable is known,
+        it is checked on creation of the validator:
+        keys, that may be missing, should have defaults,
+        and arbitrary keyword arguments should be accepted along with ``extra``.
+    :type into: type or callable
+
 
     :raises InvalidTypeError:
         if ``not isinstance(value, collections.abc.Mapping)``.
@@ -410,6 +630,8 @@ cdef class Dict(abstract.Validator):
 
     :raises MaxLengthError:
         if ``len(value) > self.maxlen``.
+        Validation stops as soon as the number of keys of the result
+        exceeds ``maxlen``.
 
     :raises SchemaError:
         with all errors,
@@ -417,6 +639,9 @@ cdef class Dict(abstract.Validator):
         extra validators,
         and missing required and forbidden extra keys.
 
+    :raises CoerceError:
+        if ``into`` fails to build the result from validated items.
+
     :note:
         on error raised by ``extra`` validators,
         context marker :class:`validx.exc.Extra` will be used to indicate,
@@ -450,6 +675,10 @@ cdef class Dict(abstract.Validator):
         "optional",
         "dispose",
         "multikeys",
+        "dontcopy",
+        "inplace",
+        "prevalidate",
+        "into",
     )
 
     cdef object _schema
@@ -461,6 +690,16 @@ cdef class Dict(abstract.Validator):
     cdef frozenset _optional
     cdef frozenset _dispose
     cdef frozenset _multikeys
+    cdef bint _dontcopy
+    cdef bint _inplace
+    cdef bint _prevalidate
+    cdef object _into
+    cdef frozenset _enforced
+    cdef dict _positions
+    cdef frozenset _keys
+    cdef dict _static
+    cdef dict _factories
+    cdef dict _ready
 
     @property
     def schema(self):
@@ -498,6 +737,22 @@ cdef class Dict(abstract.Validator):
     def multikeys(self):
         return self._multikeys
 
+    @property
+    def dontcopy(self):
+        return self._dontcopy
+
+    @property
+    def inplace(self):
+        return self._inplace
+
+    @property
+    def prevalidate(self):
+        return self._prevalidate
+
+    @property
+    def into(self):
+        return self._into
+
     def __init__(
         self,
         schema=None,
@@ -509,6 +764,10 @@ cdef class Dict(abstract.Validator):
         optional=None,
         dispose=None,
         multikeys=None,
+        dontcopy=False,
+        inplace=False,
+        prevalidate=False,
+        into=None,
         alias=None,
         replace=False,
     ):
@@ -542,6 +801,13 @@ cdef class Dict(abstract.Validator):
         multikeys = contracts.expect_container(
             self, "multikeys", multikeys, nullable=True, empty=True
         )
+        dontcopy = contracts.expect_flag(self, "dontcopy", dontcopy)
+        inplace = contracts.expect_flag(self, "inplace", inplace)
+        prevalidate = contracts.expect_flag(self, "prevalidate", prevalidate)
+        into = contracts.expect_callable(self, "into", into, nullable=True)
+        enforced = _enforced_keys(schema, defaults, optional)
+        if into is not None:
+            _expect_into(self, into, extra, enforced)
 
         self._schema = schema
         self._nullable = nullable
@@ -552,19 +818,51 @@ cdef class Dict(abstract.Validator):
         self._optional = optional
         self._dispose = dispose
         self._multikeys = multikeys
+        self._dontcopy = dontcopy
+        self._inplace = inplace
+        self._prevalidate = prevalidate
+        self._into = into
+        self._enforced = enforced
+        self._positions = _key_positions(schema)
+        self._keys = _exact_keys(schema, minlen, maxlen, dispose)
+        self._static, self._factories = _default_factories(schema, defaults)
+        self._ready = _prevalidated(schema, self._static) if prevalidate else {}
 
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
-        if __context is None:
-            __context = {}  # Setup context, if it's top level call
+        if type(__context) is not ValidationContext:
+            # Setup context, if it's top level call
+            __context = setup_context(__context)
 
         if value is None and self.nullable:
             return value
-        if not isinstance(value, (dict, Mapping)):
+        if type(value) is not dict and (
+            type(value) in _NOT_MAPPING_TYPES or not isinstance(value, Mapping)
+        ):
             raise exc.InvalidTypeError(expected=Mapping, actual=type(value))
-
-        result = {}
+        budget = (<ValidationContext>__context).budget
+        if budget is not None:
+            budget.spend_nodes(len(value))
+
+        cdef dict result
+        if (
+            self._keys is not None
+            and type(value) is dict
+            and len(value) == len(self._keys)
+            and value.keys() == self._keys
+        ):
+            result = self._validate_exact(value, __context)
+            return result if self._into is None else _build(self._into, result)
+        if self._inplace and type(value) is dict:
+            result = self._validate_inplace(value, __context)
+            return result if self._into is None else _build(self._into, result)
+
+        # Items are unpacked by ``into``, so they are not copied unless changed
+        if (self._dontcopy or self._into is not None) and type(value) is dict:
+            result = None  # It will be created on the first changed item
+        else:
+            result = {}
         errors = []
         getall = None
         if self.multikeys is not None:
@@ -576,8 +874,11 @@ cdef class Dict(abstract.Validator):
             #   werkzeug.datastructures.MultiDict (value.getlist)
             getall = getattr(value, "getall", None) or getattr(value, "getlist", None)
 
-        for key, val in value.items():
+        for num, item in enumerate(value.items()):
+            key, val = item
             if self.dispose is not None and key in self.dispose:
+                if result is None:
+                    result = dict(islice(value.items(), num))
                 continue
             if getall is not None and key in self.multikeys:
                 val = getall(key)
@@ -585,61 +886,348 @@ cdef class Dict(abstract.Validator):
                 try:
                     val = self.schema[key](val, __context)
                 except exc.ValidationError as schema_error:
-                    errors.extend(ne.add_context(key) for ne in schema_error)
+                    errors.append(schema_error.add_context(key))
+                    if budget is not None and budget.exhausted:
+                        raise exc.SchemaError(errors)
             elif self.extra is not None:
                 try:
                     key = self.extra[0](key, __context)
                 except exc.ValidationError as extra_key_error:
-                    errors.extend(
-                        ne.add_context(exc.EXTRA_KEY).add_context(key)
-                        for ne in extra_key_error
+                    errors.append(
+                        extra_key_error.add_context(exc.EXTRA_KEY).add_context(key)
                     )
+                    if budget is not None and budget.exhausted:
+                        raise exc.SchemaError(errors)
                 try:
                     val = self.extra[1](val, __context)
                 except exc.ValidationError as extra_value_error:
-                    errors.extend(
-                        ne.add_context(exc.EXTRA_VALUE).add_context(key)
-                        for ne in extra_value_error
+                    errors.append(
+                        extra_value_error.add_context(exc.EXTRA_VALUE).add_context(key)
                     )
+                    if budget is not None and budget.exhausted:
+                        raise exc.SchemaError(errors)
             else:
                 errors.append(exc.ForbiddenKeyError(key))
+            if result is None:
+                if key is item[0] and val is item[1]:
+                    # Nothing is dropped yet, so the result has ``num + 1`` keys
+                    if num >= self._maxlen:
+                        raise exc.MaxLengthError(expected=self.maxlen, actual=num + 1)
+                    continue
+                result = dict(islice(value.items(), num))
             result[key] = val
+            # Keys are never removed from the result, so it cannot get shorter
+            if len(result) > self._maxlen:
+                raise exc.MaxLengthError(expected=self.maxlen, actual=len(result))
+
+        if result is None:
+            result = value
+        missing = self._enforced.difference(result)
+        if missing:
+            if result is value:
+                result = dict(value)
+            self._fill_missing(result, missing, errors, __context)
 
-        if self.schema is not None:
-            for key, validator in self.schema.items():
-                if key in result:
-                    continue
-                if self.defaults is not None:
-                    try:
-                        default = self.defaults[key]
-                    except KeyError:
-                        pass
-                    else:
-                        default = default() if callable(default) else deepcopy(default)
-                        try:
-                            result[key] = validator(default, __context)
-                        except exc.ValidationError as default_error:
-                            errors.extend(ne.add_context(key) for ne in default_error)
-                        continue
-                if self.optional is not None and key in self.optional:
+        if errors:
+            raise exc.SchemaError(errors)
+
+        cdef long length = len(result)
+        if length < self._minlen:
+            raise exc.MinLengthError(expected=self.minlen, actual=length)
+        if length > self._maxlen:
+            raise exc.MaxLengthError(expected=self.maxlen, actual=length)
+
+        if self._into is not None:
+            return _build(self._into, result)
+        return result
+
+    cdef dict _validate_inplace(self, dict value, context):
+        # Disposed and renamed keys are applied after the loop,
+        # because size of the dictionary cannot be changed during iteration.
+        cdef list errors = []
+        cdef list disposed = []
+        cdef list renamed = []
+        cdef long kept = 0
+        for key, val in value.items():
+            if self._dispose is not None and key in self._dispose:
+                disposed.append(key)
+                continue
+            if self._schema is not None and key in self._schema:
+                try:
+                    value[key] = self._schema[key](val, context)
+                except exc.ValidationError as schema_error:
+                    errors.append(schema_error.add_context(key))
+                    if context.budget is not None and context.budget.exhausted:
+                        raise exc.SchemaError(errors)
+            elif self._extra is not None:
+                new_key = key
+                try:
+                    new_key = self._extra[0](key, context)
+                except exc.ValidationError as extra_key_error:
+                    errors.append(
+                        extra_key_error.add_context(exc.EXTRA_KEY).add_context(key)
+                    )
+                    if context.budget is not None and context.budget.exhausted:
+                        raise exc.SchemaError(errors)
+                try:
+                    val = self._extra[1](val, context)
+                except exc.ValidationError as extra_value_error:
+                    errors.append(
+                        extra_value_error.add_context(exc.EXTRA_VALUE).add_context(
+                            new_key
+                        )
+                    )
+                    if context.budget is not None and context.budget.exhausted:
+                        raise exc.SchemaError(errors)
+                if new_key is not key:
+                    renamed.append((key, new_key, val))
                     continue
-                errors.append(exc.MissingKeyError(key))
+                value[key] = val
+            else:
+                errors.append(exc.ForbiddenKeyError(key))
+            # Kept keys stay in the result, renamed ones may collide with them
+            kept += 1
+            if kept > self._maxlen:
+                raise exc.MaxLengthError(expected=self.maxlen, actual=kept)
+
+        for key in disposed:
+            del value[key]
+        for key, new_key, val in renamed:
+            del value[key]
+        for key, new_key, val in renamed:
+            value[new_key] = val
+
+        missing = self._enforced.difference(value)
+        if missing:
+            self._fill_missing(value, missing, errors, context)
 
         if errors:
             raise exc.SchemaError(errors)
 
-        cdef long length = len(result)
+        cdef long length = len(value)
         if length < self._minlen:
             raise exc.MinLengthError(expected=self.minlen, actual=length)
         if length > self._maxlen:
             raise exc.MaxLengthError(expected=self.maxlen, actual=length)
 
+        return value
+
+    cdef _fill_missing(self, dict result, missing, list errors, context):
+        # Keep order of schema, it affects order of result and errors
+        for key in sorted(missing, key=self._positions.__getitem__):
+            if key in self._ready:
+                result[key] = self._ready[key]
+                continue
+            if key in self._static:
+                default = self._static[key]
+            elif key in self._factories:
+                default = self._factories[key]()
+            else:
+                errors.append(exc.MissingKeyError(key))
+                continue
+            try:
+                result[key] = self._schema[key](default, context)
+            except exc.ValidationError as default_error:
+                errors.append(default_error.add_context(key))
+                if context.budget is not None and context.budget.exhausted:
+                    raise exc.SchemaError(errors)
+
+    cdef dict _validate_exact(self, dict value, context):
+        # Value has exactly the keys of schema,
+        # so there are no extra, disposed, or missing keys,
+        # and its length is known to be valid.
+        schema = self._schema
+        cdef dict result
+        if self._inplace:
+            result = value
+        else:
+            result = None if self._dontcopy or self._into is not None else {}
+        cdef list errors = []
+        for key, val in value.items():
+            try:
+                new_val = schema[key](val, context)
+            except exc.ValidationError as schema_error:
+                errors.append(schema_error.add_context(key))
+                if context.budget is not None and context.budget.exhausted:
+                    raise exc.SchemaError(errors)
+                continue
+            if result is None:
+                if new_val is val:
+                    continue
+                # The rest of items will be overridden, if they are changed
+                result = dict(value)
+            result[key] = new_val
+        if errors:
+            raise exc.SchemaError(errors)
+        if result is None:
+            return value
         return result
 
+# Builtin types, which are known to be rejected by the containers,
+# so the slow checks against ``collections.abc`` classes can be skipped.
+# These are all the types produced by ``json.loads()`` and sets.
+_NOT_ITERABLE_TYPES = frozenset([type(None), bool, int, float, str, bytes, dict])
+_NOT_SEQUENCE_TYPES = _NOT_ITERABLE_TYPES | {set, frozenset}
+_NOT_MAPPING_TYPES = frozenset(
+    [type(None), bool, int, float, str, bytes, list, tuple, set, frozenset]
+)
+
+
 def _enumerate(iterable):
-    if isinstance(iterable, (list, tuple, Sequence)):
+    if type(iterable) is set or type(iterable) is frozenset:
+        for value in iterable:
+            yield None, value
+    elif isinstance(iterable, (list, tuple, Sequence)):
         yield from enumerate(iterable)
     else:
         for value in iterable:
             yield None, value
 
+
+def _enforced_keys(schema, defaults, optional):
+    # Keys of schema, which have to be either provided or set to default
+    if schema is None:
+        return frozenset()
+    return frozenset(
+        key
+        for key in schema
+        if optional is None
+        or key not in optional
+        or (defaults is not None and key in defaults)
+    )
+
+
+def _expect_into(obj, into, extra, enforced):
+    # Signature of ``into`` is checked, if it is known,
+    # otherwise errors are reported on validation, see ``_build()``
+    try:
+        params = inspect.signature(into).parameters.values()
+    except (TypeError, ValueError):
+        return
+    if any(param.kind == param.VAR_KEYWORD for param in params):
+        return
+    if extra is not None:
+        raise ValueError(
+            "%s.%s.into should accept arbitrary keyword arguments along with extra"
+            % (obj.__class__.__module__, obj.__class__.__name__)
+        )
+    missing = sorted(
+        param.name
+        for param in params
+        if param.default is param.empty
+        and param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+        and param.name not in enforced
+    )
+    if missing:
+        raise ValueError(
+            "%s.%s.into should provide defaults of keys %r, that may be missing"
+            % (obj.__class__.__module__, obj.__class__.__name__, missing)
+        )
+
+
+def _build(into, result):
+    try:
+        return into(**result)
+    except Exception:
+        raise exc.CoerceError(expected=into, actual=result)
+
+
+_IMMUTABLE_TYPES = frozenset(
+    [
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        decimal.Decimal,
+        datetime.date,
+        datetime.time,
+        datetime.datetime,
+        datetime.timedelta,
+    ]
+)
+
+
+def _immutable(value):
+    if type(value) in _IMMUTABLE_TYPES:
+        return True
+    if type(value) is tuple or type(value) is frozenset:
+        return all(_immutable(item) for item in value)
+    return False
+
+
+def _default_factories(schema, defaults):
+    # Immutable defaults can be shared between results,
+    # others are produced by factories: the callable default itself,
+    # type of an empty builtin container, or deep copying of the default.
+    static = {}
+    factories = {}
+    if schema is None or defaults is None:
+        return static, factories
+    for key, default in defaults.items():
+        if key not in schema:
+            continue
+        if callable(default):
+            factories[key] = default
+        elif _immutable(default):
+            static[key] = default
+        elif type(default) in (list, dict, set) and not default:
+            factories[key] = type(default)
+        else:
+            factories[key] = partial(deepcopy, default)
+    return static, factories
+
+
+def _prevalidated(schema, static):
+    # Defaults, which fail validation, are validated on each use,
+    # so errors are reported as usual.  Mutable results cannot be shared.
+    ready = {}
+    for key, default in static.items():
+        if _refers(schema[key]):
+            continue
+        try:
+            value = schema[key](default)
+        except exc.ValidationError:
+            continue
+        if _immutable(value):
+            ready[key] = value
+    return ready
+
+
+def _refers(validator):
+    # Whether the validator can pass validation to a referenced one,
+    # which might be not registered yet, or replaced later
+    stack = [validator]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, special.LazyRef):
+            return True
+        if isinstance(value, abstract.Validator):
+            stack.extend(item for slot, item in value.params())
+        elif isinstance(value, Mapping):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _key_positions(schema):
+    if schema is None:
+        return {}
+    return {key: pos for pos, key in enumerate(schema)}
+
+
+def _exact_keys(schema, minlen, maxlen, dispose):
+    # Keys of schema, if a value having exactly these keys
+    # can be validated without any other checks.
+    if schema is None:
+        return None
+    if minlen is not None and len(schema) < minlen:
+        return None
+    if maxlen is not None and len(schema) > maxlen:
+        return None
+    if dispose is not None and not dispose.isdisjoint(schema):
+        return None
+    return frozenset(schema)
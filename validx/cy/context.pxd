@@ -0,0 +1,12 @@
+cdef class ValidationContext:
+    cdef public object data
+    cdef public long depth
+    cdef public dict recursion
+    cdef public object budget
+    cdef public dict outcomes
+
+    cdef _read(self)
+    cdef _write(self)
+
+
+cpdef ValidationContext setup_context(context)
@@ -0,0 +1,154 @@
+"""Validation Context"""
+
+from types import MappingProxyType
+from collections.abc import Mapping, MutableMapping
+
+
+_EMPTY = MappingProxyType({})
+
+
+cdef class ValidationContext:
+    """
+    Validation Context
+
+    The context is shared by all validators within a single top level call.
+    It is created by the first validator, that is called without context.
+    State of built-in validators is kept in typed attributes,
+    and the context itself works as a mutable mapping,
+    so custom validators can keep their own data in it.
+
+    :param dict data:
+        mapping for data of custom validators.
+        It is used as is, so the data is visible to the caller.
+        If it is not specified,
+        a new dictionary will be created on the first write.
+
+    ..  attribute:: depth
+
+        Nesting of references within the call.
+
+    ..  attribute:: recursion
+
+        Nesting of references per alias,
+        it is counted for references with ``maxdepth`` limit only.
+
+    ..  attribute:: budget
+
+        State of the innermost :class:`validx.py.Budget` validator.
+
+    """
+
+    def __init__(self, data=None):
+        self.data = data
+        self.depth = 0
+        self.recursion = None
+        self.budget = None
+        self.outcomes = None  # Results of ``validx.engine``
+
+    def __repr__(self):
+        return "<%s(%r)>" % (self.__class__.__name__, dict(self._read()))
+
+    def __getitem__(self, key):
+        return self._read()[key]
+
+    def __setitem__(self, key, value):
+        self._write()[key] = value
+
+    def __delitem__(self, key):
+        if self.data is None:
+            raise KeyError(key)
+        del self.data[key]
+
+    def __contains__(self, key):
+        return key in self._read()
+
+    def __iter__(self):
+        return iter(self._read())
+
+    def __len__(self):
+        return len(self._read())
+
+    def get(self, key, default=None):
+        """Get value of the key, or default if it is missing"""
+        return self._read().get(key, default)
+
+    def setdefault(self, key, default=None):
+        """Get value of the key, setting it to default if it is missing"""
+        return self._write().setdefault(key, default)
+
+    def pop(self, key, *default):
+        """Remove the key and return its value"""
+        if self.data is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return self.data.pop(key, *default)
+
+    def keys(self):
+        """Get view of keys of custom data"""
+        return self._read().keys()
+
+    def values(self):
+        """Get view of values of custom data"""
+        return self._read().values()
+
+    def items(self):
+        """Get view of items of custom data"""
+        return self._read().items()
+
+    def update(self, *args, **kw):
+        """Update custom data from mapping or iterable of pairs, and keywords"""
+        self._write().update(*args, **kw)
+
+    def popitem(self):
+        """Remove and return some item"""
+        if self.data is None:
+            raise KeyError("popitem(): context is empty")
+        return self.data.popitem()
+
+    def clear(self):
+        """Remove all items"""
+        if self.data is not None:
+            self.data.clear()
+
+    def copy(self):
+        """Get shallow copy of custom data as a dictionary"""
+        return dict(self._read())
+
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) != dict(other.items())
+
+    cdef _read(self):
+        return _EMPTY if self.data is None else self.data
+
+    cdef _write(self):
+        if self.data is None:
+            self.data = {}
+        return self.data
+
+
+MutableMapping.register(ValidationContext)
+
+
+cpdef ValidationContext setup_context(context):
+    """
+    Setup context of top level call
+
+    :param dict context:
+        context passed by the caller, it might be a plain mapping.
+
+    :returns:
+        given context, if it is :class:`ValidationContext` already,
+        otherwise a new one, that wraps given mapping.
+
+    """
+    if isinstance(context, ValidationContext):
+        return context
+    return ValidationContext(context)
@@ -1,6 +1,15 @@
+import decimal
+from collections.abc import Sequence, Mapping, Iterable
+
 from .. import exc
 from .. import contracts
 from . cimport abstract
+from .context cimport ValidationContext, setup_context
+from . import bools, chars, containers, numbers, special
+
+
+# Number of successful calls between reorderings of adaptive ``OneOf`` steps.
+ADAPTIVE_PERIOD = 128
 
 
 cdef class AllOf(abstract.Validator):
@@ -38,8 +47,9 @@ cdef class AllOf(abstract.Validator):
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
-        if __context is None:
-            __context = {}  # Setup context, if it's top level call
+        if type(__context) is not ValidationContext:
+            # Setup context, if it's top level call
+            __context = setup_context(__context)
 
         cdef bint validated = False
         for num, step in enumerate(self.steps):
@@ -62,6 +72,12 @@ cdef class OneOf(abstract.Validator):
     :param Validator \\*steps:
         nested validators.
 
+    :param bool adaptive:
+        try steps in order of their success rate,
+        instead of declaration order.
+        The order is recalculated periodically,
+        so it follows changes of input data.
+
     :raises SchemaError:
         if all steps are failed,
         so it contains all errors,
@@ -70,33 +86,294 @@ cdef class OneOf(abstract.Validator):
     :note:
         it uses :class:`validx.exc.Step` marker to indicate,
         which step is failed.
+        Step numbers always refer to declaration order,
+        even if ``adaptive`` is ``True``.
+
+    :note:
+        steps, that cannot accept value of the given type,
+        are skipped, if it is statically known from their parameters.
+        For instance, ``OneOf(Int(), Str())`` tries ``Str()`` only
+        for strings.
+        Skipped steps are still used to build errors,
+        when the rest of steps are failed.
 
     """
 
-    __slots__ = ("steps",)
+    __slots__ = ("steps", "adaptive")
 
     cdef tuple _steps
+    cdef bint _adaptive
+    cdef tuple _order
+    cdef list _hits
+    cdef long _count
+    cdef dict _dispatch
 
     @property
     def steps(self):
         return self._steps
 
-    def __init__(self, *steps_, steps=None, alias=None, replace=False):
+    @property
+    def adaptive(self):
+        return self._adaptive
+
+    def __init__(
+        self, *steps_, steps=None, adaptive=False, alias=None, replace=False
+    ):
         self._steps = contracts.expect_sequence(
             self, "steps", steps or steps_, item_type=abstract.Validator
         )
+        self._adaptive = contracts.expect_flag(self, "adaptive", adaptive)
+        self._order = tuple(range(len(self._steps)))
+        self._hits = [0] * len(self._steps)
+        self._count = 0
+        self._dispatch = _dispatch_table(self._steps)
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
-        if __context is None:
-            __context = {}  # Setup context, if it's top level call
+        if type(__context) is not ValidationContext:
+            # Setup context, if it's top level call
+            __context = setup_context(__context)
 
-        errors = []
-        for num, step in enumerate(self.steps):
+        cdef tuple steps = self._steps
+        cdef list errors = None
+        for num in self._dispatch.get(type(value), self._order):
             try:
-                return step(value, __context)
+                result = steps[num](value, __context)
             except exc.ValidationError as e:
-                errors.extend(ne.add_context(exc.Step(num)) for ne in e)
-        if errors:
-            raise exc.SchemaError(errors)
-        assert False, "At least one validation step has to be passed"
+                if errors is None:
+                    errors = [None] * len(steps)
+                errors[num] = e.add_context(exc.Step(num))
+                budget = (<ValidationContext>__context).budget
+                if budget is not None and budget.exhausted:
+                    raise  # The rest of steps would be rejected anyway
+            else:
+                if self._adaptive:
+                    self._hit(num)
+                return result
+        if errors is None:
+            errors = [None] * len(steps)
+        for num, error in enumerate(errors):
+            if error is None:
+                # The step has been skipped, because it is known to fail
+                try:
+                    result = steps[num](value, __context)
+                except exc.ValidationError as e:
+                    errors[num] = e.add_context(exc.Step(num))
+                    budget = (<ValidationContext>__context).budget
+                    if budget is not None and budget.exhausted:
+                        raise
+                else:
+                    # The dispatch table is wrong about the step,
+                    # so the result is not lost anyway
+                    return result
+        raise exc.SchemaError(errors)
+
+    cdef _hit(self, long num):
+        cdef list hits = self._hits
+        hits[num] += 1
+        self._count += 1
+        if self._count < ADAPTIVE_PERIOD:
+            return
+        self._count = 0
+        order = sorted(range(len(self._steps)), key=hits.__getitem__, reverse=True)
+        # Halve the counters, so recent results outweigh the old ones.
+        for num in order:
+            hits[num] >>= 1
+        rank = {num: pos for pos, num in enumerate(order)}
+        self._dispatch = {
+            tp: tuple(sorted(candidates, key=rank.__getitem__))
+            for tp, candidates in self._dispatch.items()
+        }
+        self._order = tuple(order)
+
+
+cdef class Tagged(abstract.Validator):
+    """
+    Tagged Union Validator
+
+    It picks one of its variants by value of the tag key,
+    instead of trying each one in turn.
+
+
+    :param str key:
+        key of the tag, i.e. discriminator.
+
+    :param dict variants:
+        variant validators in format ``{<tag>: <validator>}``.
+
+
+    :raises InvalidTypeError:
+        if ``not isinstance(value, collections.abc.Mapping)``.
+
+    :raises MissingKeyError:
+        if the tag key is not provided.
+
+    :raises OptionsError:
+        if value of the tag does not match any variant,
+        the tag key is used as error context.
+
+    :note:
+        the whole value is passed to the matched variant,
+        so the variant should also accept the tag key,
+        e.g. using :class:`validx.py.Const` validator.
+
+    """
+
+    __slots__ = ("key", "variants")
+
+    cdef str _key
+    cdef object _variants
+
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def variants(self):
+        return self._variants
+
+    def __init__(self, key, variants, alias=None, replace=False):
+        self._key = contracts.expect_str(self, "key", key)
+        self._variants = contracts.expect_mapping(
+            self, "variants", variants, value_type=abstract.Validator
+        )
+        self._register(alias, replace)
+
+    def __call__(self, value, __context=None):
+        if type(__context) is not ValidationContext:
+            # Setup context, if it's top level call
+            __context = setup_context(__context)
+
+        if not isinstance(value, (dict, Mapping)):
+            raise exc.InvalidTypeError(expected=Mapping, actual=type(value))
+        try:
+            tag = value[self._key]
+        except KeyError:
+            raise exc.MissingKeyError(self._key)
+        try:
+            variant = self._variants[tag]
+        except (KeyError, TypeError):
+            raise exc.OptionsError(
+                expected=list(self._variants), actual=tag
+            ).add_context(self._key)
+        return variant(value, __context)
+
+
+# Types, which values are dispatched by ``OneOf`` without trying all its steps.
+# Classes of ``Type`` validators are also used.
+_DISPATCH_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    decimal.Decimal,
+    str,
+    bytes,
+    bytearray,
+    list,
+    tuple,
+    set,
+    frozenset,
+    dict,
+)
+
+# Builtin types, which values can be equal only to values of the same group.
+_EQUALITY_GROUPS = {
+    type(None): 0,
+    bool: 1,
+    int: 1,
+    float: 1,
+    complex: 1,
+    decimal.Decimal: 1,
+    str: 2,
+    bytes: 3,
+    bytearray: 3,
+    list: 4,
+    tuple: 5,
+    set: 6,
+    frozenset: 6,
+    dict: 7,
+}
+
+
+def _dispatch_table(steps):
+    # Maps types of values to numbers of steps, that can accept them.
+    # Types, that can be accepted by all steps, are omitted.
+    types = _DISPATCH_TYPES + tuple(
+        step.tp for step in steps if type(step) is special.Type
+    )
+    table = {}
+    for tp in types:
+        candidates = tuple(num for num, step in enumerate(steps) if _accepts(step, tp))
+        if len(candidates) < len(steps):
+            table[tp] = candidates
+    return table
+
+
+def _accepts(step, tp):
+    # Checks whether the validator can accept value of exact type ``tp``.
+    # It must return ``True``, if accepted types are not statically known.
+    cls = type(step)
+    if cls is numbers.Int or cls is numbers.Float:
+        if tp is type(None):
+            return step.nullable
+        return step.coerce or (
+            issubclass(tp, (int, float)) and not issubclass(tp, bool)
+        )
+    if cls is numbers.Decimal:
+        if tp is type(None):
+            return step.nullable
+        return step.coerce or (
+            issubclass(tp, (int, float, decimal.Decimal)) and not issubclass(tp, bool)
+        )
+    if cls is bools.Bool:
+        if tp is type(None):
+            return step.nullable
+        return (
+            issubclass(tp, bool)
+            or (step.coerce_str and issubclass(tp, str))
+            or (step.coerce_int and issubclass(tp, int))
+        )
+    if cls is chars.Str:
+        if tp is type(None):
+            return step.nullable or step.coerce  # ``None`` is coerced to ``"None"``
+        return (
+            step.coerce
+            or issubclass(tp, str)
+            or (step.encoding is not None and issubclass(tp, bytes))
+        )
+    if cls is chars.Bytes:
+        if tp is type(None):
+            return step.nullable
+        return issubclass(tp, bytes)
+    if cls is containers.List or cls is containers.Set:
+        if tp is type(None):
+            return step.nullable
+        return issubclass(tp, (list, tuple, set, frozenset)) or (
+            issubclass(tp, Iterable)
+            and not issubclass(tp, (str, bytes, dict, Mapping))
+        )
+    if cls is containers.Tuple:
+        if tp is type(None):
+            return step.nullable
+        return issubclass(tp, Sequence) and not issubclass(tp, (str, bytes))
+    if cls is containers.Dict:
+        if tp is type(None):
+            return step.nullable
+        return issubclass(tp, (dict, Mapping))
+    if cls is special.Type:
+        if tp is type(None):
+            return step.nullable
+        return step.coerce or issubclass(tp, step.tp)
+    if cls is special.Const:
+        group = _EQUALITY_GROUPS.get(tp)
+        value_group = _EQUALITY_GROUPS.get(type(step.value))
+        return group is None or value_group is None or group == value_group
+    if cls is Tagged:
+        return issubclass(tp, (dict, Mapping))
+    if cls is AllOf:
+        return _accepts(step.steps[0], tp)
+    if cls is OneOf:
+        return any(_accepts(nested, tp) for nested in step.steps)
+    return True
@@ -18,6 +18,28 @@ class LazyRef(abstract.Validator):
         ...
 
 
+class Budget(abstract.Validator):
+    __slots__: t.Tuple[str, ...]
+    step: abstract.Validator
+    maxnodes: t.Optional[int]
+    maxchars: t.Optional[int]
+    maxdepth: t.Optional[int]
+    timeout: t.Optional[float]
+
+    def __init__(
+        self,
+        step: abstract.Validator,
+        *,
+        maxnodes: t.Optional[int] = None,
+        maxchars: t.Optional[int] = None,
+        maxdepth: t.Optional[int] = None,
+        timeout: t.Optional[float] = None,
+        alias: t.Optional[str] = None,
+        replace: bool = False,
+    ) -> None:
+        ...
+
+
 class Type(abstract.Validator):
     __slots__: t.Tuple[str, ...]
     tp: t.Type[t.Any]
@@ -0,0 +1,243 @@
+"""
+Validation of deeply nested data
+
+Recursive structures are validated through ``LazyRef`` validators,
+i.e. by recursive calls of validators.
+Each level of data costs a few frames of call stack,
+so deeply nested documents hit Python recursion limit.
+
+Once nesting of references within a single call exceeds
+:data:`DEPTH_THRESHOLD`,
+the rest of data is validated by :func:`validate`.
+It walks validators along with the data using explicit stack,
+and finds calls of references, that will be done during validation.
+Then it validates the data bottom-up,
+starting from the deepest found references,
+so each step recursively goes at most :data:`DEPTH_THRESHOLD` levels down,
+where it meets already validated data.
+Outcomes of such steps are stored in validation context
+and picked up by ``LazyRef`` validators,
+so results and errors are exactly the same as of plain recursive validation.
+
+The only exception is ``Budget`` validator above the references.
+Its resources are spent in a different order:
+deeper data goes first,
+data shared by variants of ``OneOf`` is charged once,
+and data, that plain recursion would not reach,
+e.g. through next variants of ``OneOf`` after the valid one,
+is charged too.
+So limits of nodes, chars, and time are still applied,
+but the error of exceeded limit is reported at a different place of data,
+and the data close to the limits might be accepted or rejected differently.
+
+Walkers are picked by class names of validators,
+so the same code works for both Python and Cython implementations.
+
+"""
+
+from . import exc
+
+
+# Nesting of references, which turns the engine on.
+# It is also the number of levels validated by each step of the engine.
+DEPTH_THRESHOLD = 50
+
+
+def validate(ref, value, context, resolve):
+    """
+    Validate value by referenced validator without deep recursion
+
+    :param LazyRef ref:
+        reference, which has been called with the value.
+
+    :param value:
+        validated value.
+
+    :param ValidationContext context:
+        validation context.
+
+    :param resolve:
+        function that gets registered validator by its alias.
+
+    """
+    outcomes = context.outcomes
+    created = outcomes is None
+    if created:
+        outcomes = context.outcomes = {}
+    depth = context.depth
+    entered = []
+    try:
+        # Sites are visited depth-first and validated on the way back,
+        # so counters of references above each site are kept up to date,
+        # and the deeper sites are validated before the upper ones.
+        root = _Walker(resolve).walk(ref, value)
+        stack = [(root, iter(root[2]))]
+        while stack:
+            site, children = stack[-1]
+            child = next(children, None)
+            if child is not None:
+                try:
+                    child[0]._enter(context)
+                except exc.ValidationError:
+                    continue  # Sites below are not reachable during validation
+                entered.append(child[0])
+                stack.append((child, iter(child[2])))
+                continue
+            stack.pop()
+            if site is root:
+                break
+            entered.pop()._leave(context)
+            if site[3] % DEPTH_THRESHOLD == 0:
+                _prevalidate(site, context, outcomes)
+        context.depth = 0
+        return resolve(ref.use)(value, context)
+    finally:
+        for ancestor in reversed(entered):
+            ancestor._leave(context)
+        context.depth = depth
+        if created:
+            context.outcomes = None
+
+
+def key(ref, value):
+    """
+    Return key of outcome stored by :func:`validate`
+
+    References to the same validator share outcomes,
+    so data reachable through variants of ``OneOf`` is validated once.
+    Outcomes are kept until the end of the call for the same reason.
+
+    """
+    return (ref.use, ref.maxdepth, id(value))
+
+
+def replay(outcome):
+    """Return result or raise error stored by :func:`validate`"""
+    value, result, error = outcome
+    if error is not None:
+        raise _copy(error)
+    return result
+
+
+def _copy(error):
+    # Raised errors are linked into errors of the outer validators,
+    # so the stored one is never raised itself, but copied on each replay.
+    # Schema errors are copied flat, their nested errors hold the full context.
+    if isinstance(error, exc.SchemaError):
+        return exc.SchemaError([type(nested)(*nested.args) for nested in error])
+    return type(error)(*error.args)
+
+
+def _prevalidate(site, context, outcomes):
+    ref, value, children, level = site
+    context.depth = 0
+    try:
+        result = ref(value, context)
+    except exc.ValidationError as e:
+        outcome = (value, None, e)
+    else:
+        outcome = (value, result, None)
+    # The value is kept alive within the outcome,
+    # so its identifier cannot be reused by another object
+    outcomes[key(ref, value)] = outcome
+
+
+class _Walker(object):
+    # Sites of reference calls are tuples ``(ref, value, children, level)``,
+    # where the level is the number of sites on the path from the root.
+    # Each referenced validator is walked once per value,
+    # so the walk is linear even if variants of ``OneOf`` share the data.
+    # Only builtin containers are walked,
+    # so iterators of the data are never consumed.
+
+    def __init__(self, resolve):
+        self.resolve = resolve
+
+    def walk(self, ref, value):
+        root = (ref, value, [], 0)
+        seen = {key(ref, value)}
+        stack = [(self.resolve(ref.use), value, root)]
+        while stack:
+            validator, value, parent = stack.pop()
+            if type(validator).__name__ == "LazyRef":
+                site_key = key(validator, value)
+                if site_key in seen:
+                    continue
+                seen.add(site_key)
+                site = (validator, value, [], parent[3] + 1)
+                parent[2].append(site)
+                try:
+                    target = self.resolve(validator.use)
+                except KeyError:
+                    continue
+                stack.append((target, value, site))
+                continue
+            for cls in type(validator).__mro__:
+                method = getattr(self, "walk_" + cls.__name__, None)
+                if method is not None:
+                    for child, val in method(validator, value):
+                        stack.append((child, val, parent))
+                    break
+        return root
+
+    def walk_List(self, validator, value):
+        if type(value) in (list, tuple):
+            return [(validator.item, val) for val in value]
+        return ()
+
+    def walk_Set(self, validator, value):
+        if type(value) in (list, tuple, set, frozenset):
+            return [(validator.item, val) for val in value]
+        return ()
+
+    def walk_Tuple(self, validator, value):
+        if type(value) in (list, tuple) and len(value) == len(validator.items):
+            return list(zip(validator.items, value))
+        return ()
+
+    def walk_Dict(self, validator, value):
+        if type(value) is not dict:
+            return ()
+        schema = validator.schema or {}
+        dispose = validator.dispose or ()
+        extra = validator.extra
+        children = []
+        for key, val in value.items():
+            if key in dispose:
+                continue
+            if key in schema:
+                children.append((schema[key], val))
+            elif extra is not None:
+                children.append((extra[1], val))
+        return children
+
+    def walk_AllOf(self, validator, value):
+        # Next steps validate output of the previous ones,
+        # so they are walked, while it is known to be the value itself
+        children = []
+        for step in validator.steps:
+            children.append((step, value))
+            name = type(step).__name__
+            if name not in ("Any", "Const") and (name != "Type" or step.coerce):
+                break
+        return children
+
+    def walk_OneOf(self, validator, value):
+        return [(step, value) for step in validator.steps]
+
+    def walk_Tagged(self, validator, value):
+        if type(value) is not dict:
+            return ()
+        try:
+            variant = validator.variants.get(value.get(validator.key))
+        except TypeError:
+            return ()  # Unhashable tag
+        if variant is None:
+            return ()
+        return [(variant, value)]
+
+    def walk_Validator(self, validator, value):
+        # Other validators do not call references,
+        # and ``Budget`` sets up its own context for nested ones,
+        # so references below it are validated by plain recursion
+        return ()
@@ -15,6 +15,7 @@ from .errors import (
     DatetimeParseError,
     DatetimeTypeError,
     RecursionMaxDepthError,
+    BudgetExceededError,
     MappingKeyError,
     ForbiddenKeyError,
     MissingKeyError,
@@ -41,6 +42,7 @@ __all__ = [
     "DatetimeParseError",
     "DatetimeTypeError",
     "RecursionMaxDepthError",
+    "BudgetExceededError",
     "MappingKeyError",
     "ForbiddenKeyError",
     "MissingKeyError",
@@ -1,6 +1,12 @@
 from collections import deque
 from collections.abc import Sequence
 
+from .markers import Extra, Step
+
+# Version of error paths, it is bumped on each change of any path.
+# Sort keys are cached along with the version they are built at.
+_path_version = 0
+
 
 class ValidationError(ValueError, Sequence):
     """
@@ -8,7 +14,7 @@ class ValidationError(ValueError, Sequence):
 
     :param deque context:
         error context,
-        empty ``deque`` by default.
+        empty by default.
 
     :param \\**kw:
         concrete error attributes.
@@ -71,15 +77,72 @@ class ValidationError(ValueError, Sequence):
 
     """
 
-    __slots__ = ("context",)
+    __slots__ = ("_path", "_parent", "_sort_cache")
+
+    # Names of concrete error attributes,
+    # it is calculated from ``__slots__`` of each subclass,
+    # excluding private ones.
+    _fields = ()
+
+    def __init_subclass__(cls, **kw):
+        super(ValidationError, cls).__init_subclass__(**kw)
+        if "_fields" not in cls.__dict__:
+            cls._fields = tuple(
+                slot for slot in cls.__slots__ if not slot.startswith("_")
+            )
+        if "__init__" not in cls.__dict__ and cls._fields != cls.__base__._fields:
+            # Specialized constructor of the base class
+            # knows nothing about new attributes,
+            # so the generic one is used instead.
+            cls.__init__ = ValidationError.__init__
 
     def __init__(self, context=None, *args, **kw):
-        self.context = context or deque()
-        for slot, value in dict(zip(self.__slots__[1:], args), **kw).items():
+        # Error context is stored as an immutable path of nodes,
+        # that are added by the error itself,
+        # and a link to the parent error,
+        # which holds the path shared by all its nested errors.
+        # The full context is built on demand, see ``context`` property.
+        self._path = tuple(context) if context else ()
+        self._parent = None
+        for slot, value in dict(zip(self._fields, args), **kw).items():
             setattr(self, slot, value)
-        super(ValidationError, self).__init__(
-            *(getattr(self, slot) for slot in self.__slots__)
-        )
+
+    @property
+    def context(self):
+        return deque(self._nodes())
+
+    @context.setter
+    def context(self, value):
+        global _path_version
+        _path_version += 1
+        self._path = tuple(value)
+        self._parent = None
+
+    def _nodes(self):
+        path = self._path
+        parent = self._parent
+        while parent is not None:
+            path = parent._prefix + path
+            parent = parent._parent
+        return path
+
+    def _detach(self):
+        self._path = self._nodes()
+        self._parent = None
+
+    def _sort_key(self):
+        # The key is valid, until any path is changed,
+        # including the ones of parents, that are shared by this error.
+        try:
+            version, key = self._sort_cache
+        except AttributeError:
+            pass
+        else:
+            if version == _path_version:
+                return key
+        key = tuple(_node_sort_key(node) for node in self._nodes())
+        self._sort_cache = (_path_version, key)
+        return key
 
     def add_context(self, node):
         """
@@ -111,7 +174,13 @@ class ValidationError(ValueError, Sequence):
             deque(['foo'])
 
         """
-        self.context.appendleft(node)
+        global _path_version
+        _path_version += 1
+        if self._parent is not None:
+            # The error has been taken out of its parent,
+            # so the shared path becomes its own one
+            self._detach()
+        self._path = (node,) + self._path
         return self
 
     def __getitem__(self, index):
@@ -129,7 +198,7 @@ class ValidationError(ValueError, Sequence):
         pass
 
     def __repr__(self):
-        if self.context:
+        if self._nodes():
             return "<%s: %s>" % (self.format_context(), self.format_error())
         else:
             return "<%s>" % self.format_error()
@@ -140,14 +209,25 @@ class ValidationError(ValueError, Sequence):
     def __eq__(self, other):
         if type(self) is not type(other):
             return False
-        for slot in self.__slots__:
+        if self._nodes() != other._nodes():
+            return False
+        for slot in self._fields:
             if getattr(self, slot) != getattr(other, slot):
                 return False
         return True
 
+    @property
+    def args(self):
+        # Constructors do not pass attributes to ``ValueError.__init__``,
+        # so arguments are built on demand
+        return (self.context,) + tuple(getattr(self, slot) for slot in self._fields)
+
+    def __reduce__(self):
+        return (self.__class__, self.args)
+
     def format_context(self):
         def context():
-            for node in self.context:
+            for node in self._nodes():
                 if isinstance(node, str) and "." in node:
                     yield "[%s]" % node
                 else:
@@ -157,7 +237,7 @@ class ValidationError(ValueError, Sequence):
 
     def format_error(self):
         def params():
-            for slot in self.__slots__[1:]:  # Exclude ``context``
+            for slot in self._fields:
                 yield "%s=%r" % (slot, getattr(self, slot))
 
         return "%s(%s)" % (self.__class__.__name__, ", ".join(params()))
@@ -176,6 +256,12 @@ class ConditionError(ValidationError):
 
     __slots__ = ValidationError.__slots__ + ("expected", "actual")
 
+    def __init__(self, context=None, expected=None, actual=None):
+        self._path = tuple(context) if context else ()
+        self._parent = None
+        self.expected = expected
+        self.actual = actual
+
 
 class InvalidTypeError(ConditionError):
     """
@@ -392,6 +478,26 @@ class RecursionMaxDepthError(ConditionError):
     __slots__ = ConditionError.__slots__
 
 
+class BudgetExceededError(ConditionError):
+    """
+    Budget Exceeded Error
+
+    :param expected:
+        limit of the resource.
+
+    :param actual:
+        actual consumption of the resource.
+
+    :param str resource:
+        name of the exceeded resource:
+        ``"nodes"``, ``"chars"``, ``"depth"`` or ``"time"``,
+        see :class:`validx.py.Budget`.
+
+    """
+
+    __slots__ = ConditionError.__slots__ + ("resource",)
+
+
 class MappingKeyError(ValidationError):
     """
     Base Class for Mapping Key Errors
@@ -415,11 +521,16 @@ class MappingKeyError(ValidationError):
     __slots__ = ValidationError.__slots__
 
     def __init__(self, context=None, key=None):
-        if context is not None and not isinstance(context, deque):
-            context = deque([context])
-        super(MappingKeyError, self).__init__(context)
+        if context is None:
+            path = ()
+        elif isinstance(context, deque):
+            path = tuple(context)
+        else:
+            path = (context,)
         if key is not None:
-            self.add_context(key)
+            path = (key,) + path
+        self._path = path
+        self._parent = None
 
 
 class ForbiddenKeyError(MappingKeyError):
@@ -446,13 +557,68 @@ class SchemaError(ValidationError):
 
     """
 
-    __slots__ = ValidationError.__slots__ + ("errors",)
+    __slots__ = ValidationError.__slots__ + ("_prefix", "_errors", "_flat")
+    _fields = ("errors",)
 
     def __init__(self, context=None, errors=None):
         if context is not None and not isinstance(context, deque):
             errors = context
             context = None
-        super(SchemaError, self).__init__(context, errors=errors)
+        self._path = tuple(context) if context else ()
+        self._parent = None
+        self._prefix = ()
+        self.errors = errors
+
+    @property
+    def errors(self):
+        if self._flat is None:
+            self._flatten()
+        return self._flat
+
+    @errors.setter
+    def errors(self, errors):
+        global _path_version
+        _path_version += 1
+        nested = False
+        for error in errors or ():
+            if error._parent is not None:
+                error._detach()
+            error._parent = self
+            if isinstance(error, SchemaError):
+                nested = True
+        self._errors = errors
+        self._flat = None if nested else errors
+
+    def _flatten(self):
+        # Nested schema errors are unwrapped on demand.
+        # Their errors keep the link to them,
+        # so the full context is still available.
+        # They are unwrapped bottom-up without recursion,
+        # so errors of deeply nested data do not hit recursion limit.
+        pending = [self]
+        stack = [self]
+        while stack:
+            for error in stack.pop()._errors:
+                if isinstance(error, SchemaError) and error._flat is None:
+                    pending.append(error)
+                    stack.append(error)
+        for schema_error in reversed(pending):
+            flat = []
+            for error in schema_error._errors:
+                if isinstance(error, SchemaError):
+                    flat.extend(error._flat)
+                else:
+                    flat.append(error)
+            schema_error._flat = flat
+
+    def _detach(self):
+        prefix = self._prefix
+        parent = self._parent
+        while parent is not None:
+            prefix = parent._prefix + prefix
+            parent = parent._parent
+        self._prefix = prefix
+        super(SchemaError, self)._detach()
 
     def __getitem__(self, index):
         return self.errors[index]
@@ -466,7 +632,7 @@ class SchemaError(ValidationError):
 
     def sort(self, key=None, reverse=False):
         if key is None:
-            key = lambda error: tuple(repr(node) for node in error.context)
+            key = _sort_key
         self.errors.sort(key=key, reverse=reverse)
 
     def __repr__(self):
@@ -474,6 +640,36 @@ class SchemaError(ValidationError):
         return "<%s(errors=[\n%s\n])>" % (self.__class__.__name__, errors)
 
     def add_context(self, node):
-        for e in self.errors:
-            e.add_context(node)
+        # Only direct nested errors are touched here.
+        # Context of deeper ones is shared through the path prefix
+        # of the nested schema error, they are linked to.
+        global _path_version
+        _path_version += 1
+        for error in self._errors:
+            if error._parent is not self:
+                error.add_context(node)
+            elif isinstance(error, SchemaError):
+                error._prefix = (node,) + error._prefix
+            else:
+                error._path = (node,) + error._path
         return self
+
+
+def _sort_key(error):
+    return error._sort_key()
+
+
+def _node_sort_key(node):
+    # Sequence indexes go first, then mapping keys, then context markers.
+    # Nodes of other types are compared by their representation.
+    if isinstance(node, int):
+        return (0, node)
+    if node is None:
+        return (1, 0)
+    if isinstance(node, str):
+        return (2, node)
+    if isinstance(node, Step):
+        return (3, node.num)
+    if isinstance(node, Extra):
+        return (4, node.name)
+    return (5, repr(node))
@@ -105,6 +105,21 @@ class RecursionMaxDepthError(ConditionError):
     __slots__: t.Tuple[str, ...]
 
 
+class BudgetExceededError(ConditionError):
+    __slots__: t.Tuple[str, ...]
+    resource: str
+
+    def __init__(
+        self,
+        *,
+        context: t.Optional[t.Deque] = None,
+        expected: t.Any,
+        actual: t.Any,
+        resource: str,
+    ) -> None:
+        ...
+
+
 class MappingKeyError(ValidationError):
     __slots__: t.Tuple[str, ...]
 
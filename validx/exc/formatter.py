@@ -8,6 +8,13 @@ class Formatter(object):
     :param dict templates:
         templates that will be used to format errors.
 
+    :param bool sort:
+        sort nested errors by their context before formatting,
+        default is ``True``.
+        It is worth to disable sorting,
+        if the order of messages does not matter,
+        or the error has already been sorted.
+
     Each key of ``templates`` should be a subclass of
     :class:`validx.exc.ValidationError`.
 
@@ -31,7 +38,7 @@ class Formatter(object):
 
     """
 
-    def __init__(self, templates):
+    def __init__(self, templates, sort=True):
         assert isinstance(templates, dict), templates
         for exc_class, template in templates.items():
             assert isinstance(exc_class, type), exc_class
@@ -45,40 +52,122 @@ class Formatter(object):
                         assert callable(f[0]), f[0]
                         assert isinstance(f[1], str), f[1]
         self._templates = templates
+        self._formatters = {
+            exc_class: _compile(template) for exc_class, template in templates.items()
+        }
+        self._sort = sort
 
-    def __call__(self, error):
+    def __call__(self, error, sort=None):
         """
         Format Error
 
         :param ValidationError error:
             error to format.
 
+        :param bool sort:
+            overrides ``sort`` parameter of the formatter.
+
         :returns:
             list of context/message pairs: ``[(str, str), ...]``.
 
         """
+        if self._sort if sort is None else sort:
+            error.sort()
+        formatters = self._formatters
         result = []
-        error.sort()
         for e in error:
-            context = e.format_context()
-            template = self._templates.get(type(e))
-            if template is None:
-                result.append((context, e.format_error()))
-            elif isinstance(template, str):
-                result.append((context, template.format(e)))
-            elif isinstance(template, (list, tuple)):
-                for f in template:
-                    if isinstance(f, tuple) and f[0](e):
-                        result.append((context, f[1].format(e)))
-                        break
-                    elif isinstance(f, str):
-                        result.append((context, f.format(e)))
-                        break
-                else:
-                    result.append((context, e.format_error()))
+            formatter = formatters.get(type(e))
+            message = e.format_error() if formatter is None else formatter(e)
+            result.append((e.format_context(), message))
+        return result
+
+    def to_dicts(self, error, sort=None):
+        """
+        Format Error into JSON-ready dictionaries
+
+        :param ValidationError error:
+            error to format.
+
+        :param bool sort:
+            overrides ``sort`` parameter of the formatter.
+
+        :returns:
+            list of dictionaries:
+            ``[{"path": [...], "code": str, "message": str}, ...]``.
+            Where ``path`` is a list of context nodes,
+            context markers and nodes of non-JSON types
+            are replaced by their representation,
+            and ``code`` is a name of error class.
+
+        ..  doctest:: to_dicts
+
+            >>> from validx import exc, Dict, List, Int
+
+            >>> schema = Dict({"foo": List(Int(max=100))})
+            >>> try:
+            ...     schema({"foo": [1, 200]})
+            ... except exc.ValidationError as e:
+            ...     error = e
+
+            >>> exc.format_error.to_dicts(error)
+            [{'path': ['foo', 1], 'code': 'MaxValueError', 'message': 'Expected value ≤ 100, got 200.'}]
+
+        """
+        if self._sort if sort is None else sort:
+            error.sort()
+        formatters = self._formatters
+        result = []
+        for e in error:
+            formatter = formatters.get(type(e))
+            result.append(
+                {
+                    "path": [
+                        node
+                        if node is None or isinstance(node, (str, int, float))
+                        else repr(node)
+                        for node in e._nodes()
+                    ],
+                    "code": e.__class__.__name__,
+                    "message": (
+                        e.format_error() if formatter is None else formatter(e)
+                    ),
+                }
+            )
         return result
 
 
+def _compile(template):
+    # Templates are turned into callables,
+    # that accept an error and return a message.
+    if isinstance(template, str):
+        return template.format
+
+    conditions = []
+    default = None
+    for f in template:
+        if isinstance(f, str):
+            default = f.format
+            break
+        conditions.append((f[0], f[1].format))
+    if default is None:
+        default = _format_error
+    if not conditions:
+        return default
+    conditions = tuple(conditions)
+
+    def formatter(error):
+        for predicate, format in conditions:
+            if predicate(error):
+                return format(error)
+        return default(error)
+
+    return formatter
+
+
+def _format_error(error):
+    return error.format_error()
+
+
 format_error = Formatter(
     {
         errors.InvalidTypeError: [
@@ -139,6 +228,13 @@ format_error = Formatter(
         errors.RecursionMaxDepthError: (
             "Too many nested structures, limit is {0.expected}."
         ),
+        errors.BudgetExceededError: [
+            (
+                lambda error: error.resource == "time",
+                "Validation takes too long, limit is {0.expected} seconds.",
+            ),
+            "Validation budget is exceeded, limit of {0.resource} is {0.expected}.",
+        ],
         errors.ForbiddenKeyError: "Key is not allowed.",
         errors.MissingKeyError: "Required key is not provided.",
     }
@@ -11,7 +11,12 @@ AnyTemplate = t.Union[
 Templates = t.Dict[t.Type[ValidationError], AnyTemplate]
 
 class Formatter:
-    def __init__(self, templates: Templates) -> None: ...
-    def __call__(self, error: ValidationError) -> t.List[t.Tuple[str, str]]: ...
+    def __init__(self, templates: Templates, sort: bool = True) -> None: ...
+    def __call__(
+        self, error: ValidationError, sort: t.Optional[bool] = None
+    ) -> t.List[t.Tuple[str, str]]: ...
+    def to_dicts(
+        self, error: ValidationError, sort: t.Optional[bool] = None
+    ) -> t.List[t.Dict[str, t.Any]]: ...
 
 format_error: Formatter
@@ -0,0 +1,314 @@
+"""
+Validators built from type hints
+
+:func:`from_type` builds a validator tree,
+that accepts data described by the type hint,
+e.g. an annotated dataclass.
+Validators are created by names through the class registry,
+so the same code works for both Python and Cython implementations.
+
+"""
+
+import sys
+import types
+import typing
+import decimal
+import datetime
+import collections.abc
+
+try:
+    import dataclasses
+except ImportError:  # pragma: no cover
+    dataclasses = None  # type: ignore  # Python 3.6
+
+from . import classes as default_classes
+
+
+def from_type(tp, classes=None):
+    """
+    Build validator from type hint
+
+    :param tp:
+        type hint, e.g. ``int``, ``typing.List[str]``,
+        or annotated class: dataclass, ``NamedTuple``, or ``TypedDict``.
+
+    :param classes:
+        class registry of validators implementation,
+        i.e. :mod:`validx.py.classes` or :mod:`validx.cy.classes`.
+        Default is the registry of the fastest available implementation.
+
+    :raises TypeError:
+        if the type hint is not supported.
+
+    :returns:
+        validator, that is built once per type hint,
+        and then taken from cache.
+
+    The following hints are supported:
+
+    *   ``int``, ``float``, ``bool``, ``str``, ``bytes``, ``Decimal``,
+        ``date``, ``time``, ``datetime``
+        are validated by the validators of the same name,
+        strings are not stripped (``dontstrip`` is set);
+    *   ``typing.Any`` and ``object`` are validated by ``Any``;
+    *   lists, sequences, and variable-length tuples — by ``List``;
+    *   sets — by ``Set``;
+    *   fixed-length tuples — by ``Tuple``;
+    *   dictionaries and mappings — by ``Dict`` with ``extra`` validators;
+    *   dataclasses and ``NamedTuple`` classes — by ``Dict``
+        with ``into`` parameter set to the class,
+        fields with defaults are optional;
+    *   ``TypedDict`` classes — by ``Dict``;
+    *   ``Optional[X]`` sets ``nullable`` parameter of ``X`` validator;
+    *   ``Union[X, Y]`` is validated by ``OneOf``;
+    *   ``Literal`` values are validated as options of ``Str``, ``Int``,
+        or ``Type`` of the value,
+        so values of different types are never equal, e.g. ``True`` and ``1``;
+    *   ``Annotated[X, validator]`` is validated by the given validator.
+
+    Recursive classes are referenced using ``LazyRef``,
+    their validators are registered in the instance registry
+    under aliases ``<module>.<qualname>`` of the classes.
+
+    ..  testsetup:: from_type
+
+        from dataclasses import dataclass
+        from typing import List, Optional
+        from validx import from_type
+
+    ..  doctest:: from_type
+
+        >>> @dataclass
+        ... class Item:
+        ...     name: str
+        ...     tags: List[str]
+        ...     price: Optional[int] = None
+
+        >>> item = from_type(Item)
+        >>> item({"name": "Ale", "tags": ["beer"]})
+        Item(name='Ale', tags=['beer'], price=None)
+        >>> from_type(Item) is item
+        True
+
+    """
+    if classes is None:
+        classes = default_classes
+    try:
+        result, refs = _cache[(classes, tp)]
+    except KeyError:
+        pass
+    except TypeError:
+        return _Builder(classes).build(tp)  # Unhashable hint is not cached
+    else:
+        _restore(refs)
+        return result
+    builder = _Builder(classes)
+    result = builder.build(tp)
+    refs = tuple(builder.refs)
+    for key, validator in builder.built.items():
+        _cache[(classes, key)] = (validator, refs)
+    _cache[(classes, tp)] = (result, refs)
+    return result
+
+
+# Built validators and registered validators of recursive classes they refer to
+_cache = {}  # type: typing.Dict[typing.Any, typing.Any]
+
+_SCALARS = {
+    int: "Int",
+    float: "Float",
+    bool: "Bool",
+    str: "Str",
+    bytes: "Bytes",
+    decimal.Decimal: "Decimal",
+    datetime.date: "Date",
+    datetime.time: "Time",
+    datetime.datetime: "Datetime",
+}
+
+# Parameters of scalar validators, so they accept values as is
+_SCALAR_PARAMS = {str: {"dontstrip": True}}
+
+# Validators, which accept ``nullable`` parameter
+_NULLABLE = frozenset(_SCALARS.values()) | {"Type", "List", "Set", "Tuple", "Dict"}
+
+_LISTS = frozenset(
+    [
+        list,
+        collections.abc.Sequence,
+        collections.abc.MutableSequence,
+        collections.abc.Iterable,
+        collections.abc.Collection,
+    ]
+)
+_SETS = frozenset([set, frozenset, collections.abc.Set, collections.abc.MutableSet])
+_DICTS = frozenset([dict, collections.abc.Mapping, collections.abc.MutableMapping])
+
+_Literal = getattr(typing, "Literal", None)  # Python 3.8+
+_UnionType = getattr(types, "UnionType", None)  # Python 3.10+
+
+
+class _Builder(object):
+    def __init__(self, classes):
+        self.classes = classes
+        self.built = {}  # Validators of classes
+        self.refs = []  # Validators of recursive classes and their aliases
+        self.building = {}  # Classes on the stack, mapped to their recursion flag
+
+    def new(self, classname, *args, **kw):
+        return self.classes.get(classname)(*args, **kw)
+
+    def build(self, tp, nullable=False):
+        if isinstance(tp, type) and tp in _SCALARS:
+            params = _SCALAR_PARAMS.get(tp, {})
+            return self.new(_SCALARS[tp], nullable=nullable, **params)
+        if tp is typing.Any or tp is object:
+            return self.new("Any")  # It accepts ``None`` too
+        if isinstance(tp, typing.TypeVar):
+            return self.build(typing.Any)
+        metadata = getattr(tp, "__metadata__", None)
+        if metadata is not None:
+            # ``Annotated[X, validator]``, it cannot be a part of ``Union``,
+            # because validators are not hashable
+            for item in reversed(metadata):
+                if _is_validator(item):
+                    return item
+            return self.build(tp.__origin__, nullable)
+        origin = getattr(tp, "__origin__", None)
+        if origin is typing.Union or (
+            _UnionType is not None and isinstance(tp, _UnionType)
+        ):
+            return self.build_union(tp.__args__, nullable)
+        if origin is not None:
+            if _Literal is not None and origin is _Literal:
+                return self.build_literal(tp.__args__, nullable)
+            return self.build_generic(origin, getattr(tp, "__args__", ()), nullable)
+        if isinstance(tp, type):
+            if tp in _LISTS or tp in _SETS or tp in _DICTS or tp is tuple:
+                return self.build_generic(tp, (), nullable)
+            if self.is_record(tp):
+                validator = self.build_record(tp)
+                return self.nullable(validator) if nullable else validator
+        raise TypeError("Unsupported type hint %r" % (tp,))
+
+    def nullable(self, validator):
+        if type(validator).__name__ in _NULLABLE:
+            return validator.clone(nullable=True)
+        return self.new("OneOf", self.new("Const", None), validator)
+
+    def build_union(self, args, nullable):
+        nullable = nullable or type(None) in args
+        args = [arg for arg in args if arg is not type(None)]
+        if len(args) == 1:
+            return self.build(args[0], nullable)
+        validator = self.new("OneOf", *[self.build(arg) for arg in args])
+        return self.nullable(validator) if nullable else validator
+
+    def build_literal(self, values, nullable):
+        nullable = nullable or None in values
+        values = [value for value in values if value is not None]
+        if not values:
+            return self.new("Const", None)
+        # Values are compared within their own type only,
+        # because ``True == 1 == 1.0``
+        steps = []
+        for kind in dict.fromkeys(type(value) for value in values):
+            options = [value for value in values if type(value) is kind]
+            if kind is str:
+                steps.append(self.new("Str", options=options, dontstrip=True))
+            elif kind is int:
+                steps.append(self.new("Int", options=options))
+            else:
+                steps.append(self.new("Type", kind, options=options))
+        validator = steps[0] if len(steps) == 1 else self.new("OneOf", *steps)
+        return self.nullable(validator) if nullable else validator
+
+    def build_generic(self, origin, args, nullable):
+        if origin in _LISTS:
+            item = self.build(args[0] if args else typing.Any)
+            return self.new("List", item, nullable=nullable)
+        if origin in _SETS:
+            item = self.build(args[0] if args else typing.Any)
+            return self.new("Set", item, nullable=nullable)
+        if origin is tuple:
+            if not args or (len(args) == 2 and args[1] is Ellipsis):
+                item = self.build(args[0] if args else typing.Any)
+                return self.new("List", item, nullable=nullable)
+            items = [self.build(arg) for arg in args]
+            return self.new("Tuple", *items, nullable=nullable)
+        if origin in _DICTS:
+            key, value = args if args else (typing.Any, typing.Any)
+            extra = (self.build(key), self.build(value))
+            return self.new("Dict", extra=extra, nullable=nullable)
+        raise TypeError("Unsupported type hint %r" % (origin,))
+
+    def is_record(self, tp):
+        return (
+            (dataclasses is not None and dataclasses.is_dataclass(tp))
+            or (issubclass(tp, tuple) and hasattr(tp, "_fields"))
+            or (issubclass(tp, dict) and hasattr(tp, "__total__"))
+        )
+
+    def build_record(self, tp):
+        # Dataclasses, ``NamedTuple`` and ``TypedDict`` classes
+        if tp in self.built:
+            return self.built[tp]
+        if (self.classes, tp) in _cache:
+            validator, refs = _cache[(self.classes, tp)]
+            _restore(refs)
+            self.refs.extend(refs)
+            return validator
+        alias = "%s.%s" % (tp.__module__, tp.__qualname__)
+        if tp in self.building:
+            self.building[tp] = True  # It is recursive
+            return self.new("LazyRef", alias)
+        self.building[tp] = False
+        try:
+            hints = _type_hints(tp)
+            if issubclass(tp, dict):
+                names = list(hints)
+                required = getattr(tp, "__required_keys__", None)
+                if required is None:  # pragma: no cover
+                    required = names if tp.__total__ else ()  # Python < 3.9
+                optional = [name for name in names if name not in required]
+                into = None
+            elif issubclass(tp, tuple):
+                names = list(tp._fields)
+                optional = list(tp._field_defaults)
+                into = tp
+            else:
+                fields = [field for field in dataclasses.fields(tp) if field.init]
+                names = [field.name for field in fields]
+                optional = [
+                    field.name
+                    for field in fields
+                    if field.default is not dataclasses.MISSING
+                    or field.default_factory is not dataclasses.MISSING
+                ]
+                into = tp
+            schema = {name: self.build(hints[name]) for name in names}
+        finally:
+            recursive = self.building.pop(tp)
+        validator = self.new("Dict", schema, optional=optional or None, into=into)
+        if recursive:
+            validator._register(alias, replace=True)
+            self.refs.append((alias, validator))
+        self.built[tp] = validator
+        return validator
+
+
+def _restore(refs):
+    # The instance registry might be cleared since the validators were built
+    for alias, validator in refs:
+        validator._register(alias, replace=True)
+
+
+def _is_validator(value):
+    # Validators of both implementations
+    return any(cls.__name__ == "Validator" for cls in type(value).__mro__)
+
+
+def _type_hints(tp):
+    if sys.version_info >= (3, 9):
+        return typing.get_type_hints(tp, include_extras=True)
+    return typing.get_type_hints(tp)  # pragma: no cover
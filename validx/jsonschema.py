@@ -0,0 +1,694 @@
+"""
+JSON Schema import and export
+
+:func:`load` converts JSON Schema document into the dump format
+(see :meth:`validx.py.Validator.dump`),
+and loads validators from it using :meth:`validx.py.Validator.load`.
+:func:`dump` converts dumped validators back into JSON Schema.
+
+Validators are picked by class names,
+so the same code works for both Python and Cython implementations.
+
+Keywords and parameters, which have no exact counterpart on the other side,
+are never skipped silently,
+``ValueError`` is raised instead,
+so the result does not validate data in a different way than its source.
+
+"""
+
+import math
+from itertools import count
+from urllib.parse import quote, unquote
+
+
+# Dialect of exported documents
+DRAFT = "https://json-schema.org/draft/2020-12/schema"
+
+# Numbers of loaded documents without names
+_anonymous = count(1)
+
+
+def load(doc, name=None, classes=None):
+    """
+    Load validator from JSON Schema document
+
+    :param dict doc:
+        JSON Schema document, drafts 7 and 2020-12 are supported.
+
+    :param str name:
+        prefix of aliases of referenced definitions.
+        Default is ``$id`` of the document,
+        or a prefix generated for each call, like ``jsonschema1``.
+
+    :param classes:
+        class registry of validators implementation,
+        i.e. :mod:`validx.py.classes` or :mod:`validx.cy.classes`.
+        Default is the registry of the fastest available implementation.
+
+    :raises ValueError:
+        if the document contains unsupported keywords or references.
+
+    :returns:
+        root validator.
+
+    The following keywords are supported:
+
+    *   ``type``, each type is validated by its own validator,
+        and ``null`` sets ``nullable`` parameter,
+        unless ``enum`` is specified without ``null`` value:
+        ``string`` — by ``Str`` (with ``dontstrip`` set),
+        ``integer`` — by ``Int``,
+        ``number`` — by ``Float``,
+        ``boolean`` — by ``Bool``, or ``Type(bool)`` with ``enum``,
+        ``array`` — by ``List`` or ``Tuple``,
+        ``object`` — by ``Dict``,
+        ``null`` — by ``Const(None)``;
+    *   ``minLength``, ``maxLength``, and ``pattern`` of strings;
+    *   ``minimum``, ``maximum``, ``exclusiveMinimum``,
+        and ``exclusiveMaximum`` of integers,
+        ``minimum`` and ``maximum`` of numbers;
+    *   ``items``, ``prefixItems``, ``minItems``, and ``maxItems`` of arrays,
+        arrays with ``prefixItems`` must have fixed length;
+    *   ``properties``, ``required``, ``additionalProperties``,
+        ``propertyNames``, ``minProperties``, and ``maxProperties`` of objects;
+    *   ``enum`` of strings, integers, and booleans;
+    *   ``enum`` or ``const`` without ``type``,
+        booleans are never equal to numbers, as in JSON Schema:
+        integers are validated as options of ``Int``,
+        booleans — as options of ``Type(bool)``,
+        other numbers — by ``Float`` with equal limits,
+        and the rest of values — by ``Const``,
+        arrays and objects containing numbers or booleans are not supported;
+    *   ``anyOf`` — by ``OneOf``;
+    *   ``$ref`` to the document itself or to its ``$defs`` or ``definitions``
+        — by ``LazyRef``.
+        Referenced definitions are registered in the instance registry
+        under aliases ``<name><pointer>``, e.g. ``tree#/$defs/node``,
+        replacing validators with the same aliases.
+        Definitions of documents without names never replace each other.
+
+    Annotations, like ``title``, ``description``, ``default``,
+    and ``format``, are skipped.
+    Keywords of specific types must be accompanied by ``type``.
+
+    ..  testsetup:: jsonschema_load
+
+        from validx import jsonschema
+
+    ..  testcleanup:: jsonschema_load
+
+        from validx import instances
+        instances.clear()
+
+    ..  doctest:: jsonschema_load
+
+        >>> schema = jsonschema.load({
+        ...     "type": "object",
+        ...     "properties": {
+        ...         "name": {"type": "string", "maxLength": 10},
+        ...         "children": {"type": "array", "items": {"$ref": "#"}},
+        ...     },
+        ...     "required": ["name"],
+        ... })
+        >>> schema({"name": "x", "children": [{"name": "y"}]})
+        {'name': 'x', 'children': [{'name': 'y'}]}
+
+    """
+    if classes is None:
+        # The module is imported by the package on its initialization
+        from . import classes
+    if name is None:
+        name = doc.get("$id") if isinstance(doc, dict) else None
+    if name is None:
+        name = "jsonschema%d" % next(_anonymous)
+    loader = _Loader(doc, name)
+    root = loader.convert(doc, "#")
+    definitions = []
+    while loader.pending:
+        pointer, alias, target = loader.pending.pop()
+        params = root if pointer == "#" else loader.convert(target, pointer)
+        params["alias"] = alias
+        params["replace"] = True
+        definitions.append(params)
+    load = classes.get("Any").load  # ``Validator.load`` of the implementation
+    for params in definitions:
+        if params is not root:
+            load(params)
+    return load(root)
+
+
+def dump(validator, resolve):
+    """
+    Dump validator into JSON Schema document
+
+    :param Validator validator:
+        root validator of the tree.
+
+    :param resolve:
+        function that gets registered validator by its alias,
+        it is used to resolve ``LazyRef`` validators.
+
+    :raises ValueError:
+        if any validator of the tree or its parameter
+        cannot be expressed in JSON Schema.
+
+    :returns:
+        JSON Schema document of draft 2020-12,
+        referenced validators are placed into its ``$defs``.
+
+    Validators ``Int``, ``Float``, ``Str``, ``Bool``, ``List``, ``Tuple``,
+    ``Dict``, ``OneOf``, ``LazyRef``, ``Const``, ``Any``,
+    and ``Type`` of ``bool`` are supported.
+    Parameters, which only transform valid values,
+    like ``dontstrip``, ``sort``, or ``into``, are skipped.
+    However, ``Str`` checks its values after stripping and normalization,
+    so its constraints are exported only along with ``dontstrip``
+    and without ``normspace``.
+    In the same way, ``List`` checks its length after dropping duplicates,
+    so its length limits are not exported along with ``unique``.
+
+    """
+    dumper = _Dumper(resolve)
+    schema = dumper.dump(validator.dump())
+    result = {"$schema": DRAFT}
+    result.update(schema)
+    if dumper.defs:
+        result["$defs"] = dumper.defs
+    return result
+
+
+# Keywords, which do not affect validation
+_ANNOTATIONS = frozenset(
+    [
+        "$schema",
+        "$id",
+        "$comment",
+        "$defs",
+        "definitions",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "format",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+    ]
+)
+
+# Keywords, which do nothing without ``type``
+_TYPED = frozenset(
+    [
+        "minLength",
+        "maxLength",
+        "pattern",
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+        "multipleOf",
+        "items",
+        "prefixItems",
+        "additionalItems",
+        "minItems",
+        "maxItems",
+        "uniqueItems",
+        "properties",
+        "required",
+        "additionalProperties",
+        "patternProperties",
+        "propertyNames",
+        "minProperties",
+        "maxProperties",
+    ]
+)
+
+# Keywords of definitions, that can be referenced
+_DEFINITIONS = ("$defs", "definitions")
+
+# Characters, which are allowed in URI fragment besides unreserved ones
+_FRAGMENT_SAFE = "!$&'()*+,;=:@/?"
+
+# Parameters, which only transform valid values
+_TRANSFORMS = frozenset(
+    [
+        "dontstrip",
+        "normspace",
+        "sort",
+        "sort_key",
+        "unique",
+        "dontcopy",
+        "inplace",
+        "prevalidate",
+        "multikeys",
+        "into",
+        "adaptive",
+    ]
+)
+
+
+class _Loader(object):
+    def __init__(self, doc, name):
+        self.doc = doc
+        self.name = name
+        self.aliases = {}  # Pointers of referenced schemas mapped to their aliases
+        self.pending = []  # Referenced schemas, which are not converted yet
+
+    def convert(self, schema, path):
+        if schema is True:
+            return {"__class__": "Any"}
+        if not isinstance(schema, dict):
+            raise ValueError("Unsupported JSON Schema %r at '%s'" % (schema, path))
+        keys = set(schema) - _ANNOTATIONS
+        if "$ref" in schema:
+            self.check(keys, {"$ref"}, path)
+            return {"__class__": "LazyRef", "use": self.ref(schema["$ref"], path)}
+        if "anyOf" in schema:
+            self.check(keys, {"anyOf"}, path)
+            steps = [
+                self.convert(step, "%s/anyOf/%s" % (path, num))
+                for num, step in enumerate(schema["anyOf"])
+            ]
+            return {"__class__": "OneOf", "steps": steps}
+        if "type" not in schema:
+            return self.convert_untyped(schema, keys, path)
+        types = schema["type"]
+        if isinstance(types, str):
+            types = [types]
+        # Enumeration restricts all the types, including ``null``
+        nullable = "null" in types and None in schema.get("enum", [None])
+        used = {"type"}
+        steps = []
+        for tp in types:
+            if tp == "null":
+                continue
+            method = getattr(self, "convert_" + str(tp), None)
+            if method is None:
+                raise ValueError("Unsupported JSON Schema type %r at '%s'" % (tp, path))
+            steps.append(method(schema, used, path))
+        self.check(keys, used, path)
+        if not steps:
+            return {"__class__": "Const", "value": None}
+        if len(steps) == 1:
+            if nullable:
+                steps[0]["nullable"] = True
+            return steps[0]
+        if nullable:
+            steps.insert(0, {"__class__": "Const", "value": None})
+        return {"__class__": "OneOf", "steps": steps}
+
+    def convert_untyped(self, schema, keys, path):
+        typed = keys & _TYPED
+        if typed:
+            raise ValueError(
+                "JSON Schema keywords %s without 'type' are not supported at '%s'"
+                % (sorted(typed), path)
+            )
+        if "const" in schema:
+            self.check(keys, {"const"}, path)
+            return self.convert_values([schema["const"]], "const", path)
+        if "enum" in schema:
+            self.check(keys, {"enum"}, path)
+            return self.convert_values(schema["enum"], "enum", path)
+        self.check(keys, set(), path)
+        return {"__class__": "Any"}
+
+    def convert_values(self, values, keyword, path):
+        # Numbers and booleans are never equal in JSON Schema, unlike Python,
+        # so they are not compared by ``Const``
+        steps = []
+        options = {}  # Options of integers and booleans
+        for value in values:
+            kind = type(value)
+            if kind is int or kind is bool:
+                if kind not in options:
+                    options[kind] = []
+                    if kind is int:
+                        steps.append({"__class__": "Int", "options": options[kind]})
+                    else:
+                        steps.append(
+                            {"__class__": "Type", "tp": bool, "options": options[kind]}
+                        )
+                options[kind].append(value)
+            elif kind is float:
+                steps.append({"__class__": "Float", "min": value, "max": value})
+            elif _has_numbers(value):
+                raise ValueError(
+                    "Unsupported JSON Schema '%s' value %r at '%s'"
+                    % (keyword, value, path)
+                )
+            else:
+                steps.append({"__class__": "Const", "value": value})
+        if len(steps) == 1:
+            return steps[0]
+        return {"__class__": "OneOf", "steps": steps}
+
+    def convert_string(self, schema, used, path):
+        params = {"__class__": "Str", "dontstrip": True}
+        self.take(schema, used, params, {"minLength": "minlen", "maxLength": "maxlen"})
+        if "pattern" in schema:
+            used.add("pattern")
+            params["pattern"] = schema["pattern"]
+            params["match"] = "search"
+        self.take_options(schema, used, params, (str,), path)
+        return params
+
+    def convert_integer(self, schema, used, path):
+        params = {"__class__": "Int"}
+        low = []
+        high = []
+        if "minimum" in schema:
+            low.append(math.ceil(self.number(schema, "minimum", path)))
+        if "exclusiveMinimum" in schema:
+            low.append(math.floor(self.number(schema, "exclusiveMinimum", path)) + 1)
+        if "maximum" in schema:
+            high.append(math.floor(self.number(schema, "maximum", path)))
+        if "exclusiveMaximum" in schema:
+            high.append(math.ceil(self.number(schema, "exclusiveMaximum", path)) - 1)
+        if low:
+            params["min"] = max(low)
+        if high:
+            params["max"] = min(high)
+        used.update(["minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"])
+        self.take_options(schema, used, params, (int,), path)
+        return params
+
+    def convert_number(self, schema, used, path):
+        params = {"__class__": "Float"}
+        for keyword, param in (("minimum", "min"), ("maximum", "max")):
+            if keyword in schema:
+                used.add(keyword)
+                params[param] = self.number(schema, keyword, path)
+        return params
+
+    def convert_boolean(self, schema, used, path):
+        if "enum" in schema:
+            params = {"__class__": "Type", "tp": bool}
+            self.take_options(schema, used, params, (bool,), path)
+            return params
+        return {"__class__": "Bool"}
+
+    def convert_array(self, schema, used, path):
+        items = schema.get("items")
+        if isinstance(items, list):
+            # Draft 7 form of tuples
+            prefix = items
+            rest = schema.get("additionalItems", True)
+            used.update(["items", "additionalItems"])
+        elif "prefixItems" in schema:
+            prefix = schema["prefixItems"]
+            rest = schema.get("items", True)
+            used.update(["prefixItems", "items"])
+        else:
+            prefix = None
+        if prefix is not None:
+            length = len(prefix)
+            if rest is not False or schema.get("minItems") != length:
+                raise ValueError(
+                    "JSON Schema arrays with 'prefixItems' "
+                    "of variable length are not supported at '%s'" % path
+                )
+            if schema.get("maxItems", length) < length:
+                raise ValueError(
+                    "JSON Schema 'maxItems' is less than 'minItems' at '%s'" % path
+                )
+            used.update(["minItems", "maxItems"])
+            return {
+                "__class__": "Tuple",
+                "items": [
+                    self.convert(item, "%s/prefixItems/%s" % (path, num))
+                    for num, item in enumerate(prefix)
+                ],
+            }
+        params = {"__class__": "List"}
+        if "items" in schema:
+            used.add("items")
+            params["item"] = self.convert(items, path + "/items")
+        else:
+            params["item"] = {"__class__": "Any"}
+        self.take(schema, used, params, {"minItems": "minlen", "maxItems": "maxlen"})
+        if schema.get("uniqueItems") is False:
+            used.add("uniqueItems")
+        return params
+
+    def convert_object(self, schema, used, path):
+        params = {"__class__": "Dict"}
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        used.update(["properties", "required"])
+        fields = {
+            key: self.convert(value, "%s/properties/%s" % (path, _escape(key)))
+            for key, value in properties.items()
+        }
+        for key in required:
+            fields.setdefault(key, {"__class__": "Any"})
+        optional = [key for key in fields if key not in required]
+        if fields:
+            params["schema"] = fields
+        if optional:
+            params["optional"] = optional
+        additional = schema.get("additionalProperties", True)
+        used.add("additionalProperties")
+        if additional is not False:
+            names = schema.get("propertyNames", True)
+            used.add("propertyNames")
+            if isinstance(names, dict) and "type" not in names:
+                names = dict(names, type="string")  # Keys are always strings
+            params["extra"] = [
+                self.convert(names, path + "/propertyNames"),
+                self.convert(additional, path + "/additionalProperties"),
+            ]
+        self.take(
+            schema, used, params, {"minProperties": "minlen", "maxProperties": "maxlen"}
+        )
+        return params
+
+    def take(self, schema, used, params, keywords):
+        for keyword, param in keywords.items():
+            if keyword in schema:
+                used.add(keyword)
+                params[param] = schema[keyword]
+
+    def take_options(self, schema, used, params, types, path):
+        if "enum" not in schema:
+            return
+        options = [value for value in schema["enum"] if value is not None]
+        for value in options:
+            if type(value) not in types:
+                raise ValueError(
+                    "Unsupported JSON Schema 'enum' value %r at '%s'" % (value, path)
+                )
+        used.add("enum")
+        params["options"] = options
+
+    def number(self, schema, keyword, path):
+        value = schema[keyword]
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise ValueError(
+                "Unsupported JSON Schema '%s' value %r at '%s'" % (keyword, value, path)
+            )
+        return value
+
+    def check(self, keys, used, path):
+        unsupported = keys - used
+        if unsupported:
+            raise ValueError(
+                "Unsupported JSON Schema keywords %s at '%s'"
+                % (sorted(unsupported), path)
+            )
+
+    def ref(self, pointer, path):
+        alias = self.aliases.get(pointer)
+        if alias is None:
+            target = self.resolve(pointer, path)
+            alias = self.aliases[pointer] = self.name + pointer
+            self.pending.append((pointer, alias, target))
+        return alias
+
+    def resolve(self, pointer, path):
+        if pointer == "#":
+            return self.doc
+        # References are URI fragments, so JSON Pointers in them are percent-encoded
+        parts = unquote(pointer).split("/") if isinstance(pointer, str) else ()
+        if len(parts) != 3 or parts[0] != "#" or parts[1] not in _DEFINITIONS:
+            raise ValueError(
+                "Unsupported JSON Schema reference %r at '%s', "
+                "only references to the document and its definitions are supported"
+                % (pointer, path)
+            )
+        try:
+            return self.doc[parts[1]][_unescape(parts[2])]
+        except (KeyError, TypeError):
+            raise ValueError(
+                "Unresolvable JSON Schema reference %r at '%s'" % (pointer, path)
+            )
+
+
+class _Dumper(object):
+    def __init__(self, resolve):
+        self.resolve = resolve
+        self.defs = {}
+
+    def dump(self, params):
+        params = dict(params)
+        classname = params.pop("__class__")
+        method = getattr(self, "dump_" + classname, None)
+        if method is None:
+            raise ValueError(
+                "%s validator cannot be exported to JSON Schema" % classname
+            )
+        schema = method(params)
+        unsupported = set(params) - _TRANSFORMS
+        if unsupported:
+            raise ValueError(
+                "Parameters %s of %s validator cannot be exported to JSON Schema"
+                % (sorted(unsupported), classname)
+            )
+        return schema
+
+    def dump_Int(self, params):
+        schema = self.typed("integer", params)
+        self.put(schema, params, {"min": "minimum", "max": "maximum"})
+        self.put_options(schema, params)
+        return schema
+
+    def dump_Float(self, params):
+        schema = self.typed("number", params)
+        self.put(schema, params, {"min": "minimum", "max": "maximum"})
+        return schema
+
+    def dump_Str(self, params):
+        # Values are stripped and normalized before they are checked
+        constraints = sorted(set(params) & {"minlen", "maxlen", "pattern", "options"})
+        if constraints and (not params.get("dontstrip") or params.get("normspace")):
+            raise ValueError(
+                "Parameters %s of Str validator cannot be exported to JSON Schema, "
+                "unless 'dontstrip' is set and 'normspace' is not" % constraints
+            )
+        schema = self.typed("string", params)
+        self.put(schema, params, {"minlen": "minLength", "maxlen": "maxLength"})
+        match = params.pop("match", None)
+        if "pattern" in params:
+            pattern = params.pop("pattern")
+            if match != "search":
+                pattern = "^(?:%s)%s" % (pattern, "$" if match == "full" else "")
+            schema["pattern"] = pattern
+        self.put_options(schema, params)
+        return schema
+
+    def dump_Bool(self, params):
+        return self.typed("boolean", params)
+
+    def dump_Type(self, params):
+        if params.pop("tp") is not bool:
+            raise ValueError(
+                "Type validator cannot be exported to JSON Schema, unless 'tp' is bool"
+            )
+        schema = self.typed("boolean", params)
+        self.put_options(schema, params)
+        return schema
+
+    def dump_List(self, params):
+        # Duplicates are dropped before length is checked
+        constraints = sorted(set(params) & {"minlen", "maxlen"})
+        if constraints and params.get("unique"):
+            raise ValueError(
+                "Parameters %s of List validator cannot be exported to JSON Schema, "
+                "unless 'unique' is not set" % constraints
+            )
+        schema = self.typed("array", params)
+        item = self.dump(params.pop("item"))
+        if item:
+            schema["items"] = item
+        self.put(schema, params, {"minlen": "minItems", "maxlen": "maxItems"})
+        return schema
+
+    def dump_Tuple(self, params):
+        schema = self.typed("array", params)
+        items = params.pop("items")
+        schema["prefixItems"] = [self.dump(item) for item in items]
+        schema["items"] = False
+        schema["minItems"] = len(items)
+        return schema
+
+    def dump_Dict(self, params):
+        schema = self.typed("object", params)
+        fields = params.pop("schema", None) or {}
+        optional = params.pop("optional", None) or ()
+        defaults = params.pop("defaults", None) or {}
+        dispose = params.pop("dispose", None) or ()
+        properties = {key: self.dump(value) for key, value in fields.items()}
+        for key in dispose:
+            properties.setdefault(key, {})  # Disposed keys accept any value
+        required = [
+            key for key in fields if key not in optional and key not in defaults
+        ]
+        if properties:
+            schema["properties"] = properties
+        if required:
+            schema["required"] = required
+        extra = params.pop("extra", None)
+        if extra is None:
+            schema["additionalProperties"] = False
+        else:
+            names, additional = [self.dump(item) for item in extra]
+            if names:
+                schema["propertyNames"] = names
+            if additional:
+                schema["additionalProperties"] = additional
+        self.put(schema, params, {"minlen": "minProperties", "maxlen": "maxProperties"})
+        return schema
+
+    def dump_OneOf(self, params):
+        return {"anyOf": [self.dump(step) for step in params.pop("steps")]}
+
+    def dump_LazyRef(self, params):
+        alias = params.pop("use")
+        if alias not in self.defs:
+            self.defs[alias] = {}  # Placeholder for recursive references
+            self.defs[alias] = self.dump(self.resolve(alias).dump())
+        return {"$ref": "#/$defs/" + quote(_escape(alias), safe=_FRAGMENT_SAFE)}
+
+    def dump_Const(self, params):
+        return {"const": params.pop("value")}
+
+    def dump_Any(self, params):
+        return {}
+
+    def typed(self, tp, params):
+        if params.pop("nullable", False):
+            return {"type": [tp, "null"]}
+        return {"type": tp}
+
+    def put(self, schema, params, keywords):
+        for param, keyword in keywords.items():
+            if param in params:
+                schema[keyword] = params.pop(param)
+
+    def put_options(self, schema, params):
+        if "options" in params:
+            options = sorted(params.pop("options"))
+            if isinstance(schema["type"], list):
+                options.append(None)
+            schema["enum"] = options
+
+
+def _has_numbers(value):
+    # Arrays and objects are compared by ``Const``,
+    # so their numbers and booleans would be equal
+    if isinstance(value, (int, float)):
+        return True
+    if isinstance(value, list):
+        return any(_has_numbers(item) for item in value)
+    if isinstance(value, dict):
+        return any(_has_numbers(item) for item in value.values())
+    return False
+
+
+def _escape(key):
+    # Escape JSON Pointer reference token
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
@@ -24,6 +24,15 @@ class Validator(ABC):
     def params(self) -> t.Iterator[t.Tuple[str, t.Any]]:
         ...
 
+    def loads(self, data: t.Union[str, bytes, bytearray], **kw) -> t.Any:
+        ...
+
+    def serializer(self) -> t.Callable[[t.Any], t.Any]:
+        ...
+
+    def to_jsonschema(self) -> t.Dict[str, t.Any]:
+        ...
+
     def dump(self) -> t.Dict[str, t.Any]:
         ...
 
@@ -3,6 +3,7 @@ import re
 from .. import exc
 from .. import contracts
 from . import abstract
+from .context import ValidationContext
 
 
 class Str(abstract.Validator):
@@ -32,12 +33,30 @@ class Str(abstract.Validator):
     :param int maxlen:
         upper length limit.
 
-    :param str pattern:
+    :param pattern:
         validate string using regular expression.
+        It is compiled on creation of the validator.
+        Compiled pattern is also accepted,
+        its flags are kept as inline ones,
+        so the validator is dumped with pattern as a string.
+    :type pattern: str or re.Pattern
+
+    :param str match:
+        how ``pattern`` is matched:
+        ``"full"`` — against the whole string,
+        ``"prefix"`` — against beginning of the string (default),
+        ``"search"`` — anywhere in the string.
 
     :param iterable options:
         explicit enumeration of valid values.
 
+    :param int max_input_len:
+        upper length limit of raw input value,
+        it is checked before any decoding and transformation,
+        i.e. it limits amount of work on pathologically long values.
+        For ``bytes`` it is number of bytes,
+        for coerced values it is length of their string representation.
+
 
     :raises InvalidTypeError:
         * if ``value is None`` and ``not self.nullable``;
@@ -50,7 +69,8 @@ class Str(abstract.Validator):
         if ``len(value) < self.minlen``.
 
     :raises MaxLengthError:
-        if ``len(value) > self.maxlen``.
+        * if ``len(value) > self.max_input_len`` before any transformation;
+        * if ``len(value) > self.maxlen``.
 
     :raises PatternMatchError:
         if ``value`` does not match ``self.pattern``.
@@ -78,6 +98,9 @@ class Str(abstract.Validator):
         "maxlen",
         "pattern",
         "options",
+        "max_input_len",
+        "match",
+        "_match",
     )
 
     def __init__(
@@ -91,6 +114,8 @@ class Str(abstract.Validator):
         maxlen=None,
         pattern=None,
         options=None,
+        max_input_len=None,
+        match=None,
         alias=None,
         replace=False,
     ):
@@ -101,10 +126,21 @@ class Str(abstract.Validator):
         encoding = contracts.expect_str(self, "encoding", encoding, nullable=True)
         minlen = contracts.expect_length(self, "minlen", minlen, nullable=True)
         maxlen = contracts.expect_length(self, "maxlen", maxlen, nullable=True)
-        pattern = contracts.expect_str(self, "pattern", pattern, nullable=True)
+        if isinstance(pattern, _Pattern):
+            regex = pattern
+            pattern = contracts.expect_str(self, "pattern", _pattern_source(pattern))
+        else:
+            pattern = contracts.expect_str(self, "pattern", pattern, nullable=True)
+            regex = re.compile(pattern) if pattern else None
         options = contracts.expect_container(
             self, "options", options, nullable=True, item_type=str
         )
+        max_input_len = contracts.expect_length(
+            self, "max_input_len", max_input_len, nullable=True
+        )
+        match = contracts.expect_str(
+            self, "match", match, nullable=True, options=_MATCH_MODES
+        )
 
         setattr = object.__setattr__
         setattr(self, "nullable", nullable)
@@ -116,6 +152,9 @@ class Str(abstract.Validator):
         setattr(self, "maxlen", maxlen)
         setattr(self, "pattern", pattern)
         setattr(self, "options", options)
+        setattr(self, "max_input_len", max_input_len)
+        setattr(self, "match", match)
+        setattr(self, "_match", _match_method(regex, match))
 
         self._register(alias, replace)
 
@@ -124,6 +163,9 @@ class Str(abstract.Validator):
             return value
         if not isinstance(value, str):
             if isinstance(value, bytes) and self.encoding is not None:
+                length = len(value)
+                if self.max_input_len is not None and length > self.max_input_len:
+                    raise exc.MaxLengthError(expected=self.max_input_len, actual=length)
                 try:
                     value = value.decode(self.encoding)
                 except UnicodeDecodeError:
@@ -132,16 +174,26 @@ class Str(abstract.Validator):
                 value = str(value)
             else:
                 raise exc.InvalidTypeError(expected=str, actual=type(value))
+        if isinstance(__context, ValidationContext):
+            budget = __context.budget
+            if budget is not None:
+                budget.spend_chars(len(value))
+        if self.max_input_len is not None and len(value) > self.max_input_len:
+            raise exc.MaxLengthError(expected=self.max_input_len, actual=len(value))
         if not self.dontstrip:
             value = value.strip()
-        if self.normspace:
+            if self.normspace:
+                # The same as ``re.sub(r"\s+", " ", value)`` for stripped value,
+                # but faster
+                value = " ".join(value.split())
+        elif self.normspace:
             value = re.sub(r"\s+", " ", value)
         length = len(value)
         if self.minlen is not None and length < self.minlen:
             raise exc.MinLengthError(expected=self.minlen, actual=length)
         if self.maxlen is not None and length > self.maxlen:
             raise exc.MaxLengthError(expected=self.maxlen, actual=length)
-        if self.pattern and not re.match(self.pattern, value):
+        if self._match is not None and self._match(value) is None:
             raise exc.PatternMatchError(expected=self.pattern, actual=value)
         if self.options is not None and value not in self.options:
             raise exc.OptionsError(expected=self.options, actual=value)
@@ -196,9 +248,46 @@ class Bytes(abstract.Validator):
             return value
         if not isinstance(value, bytes):
             raise exc.InvalidTypeError(expected=bytes, actual=type(value))
+        if isinstance(__context, ValidationContext):
+            budget = __context.budget
+            if budget is not None:
+                budget.spend_chars(len(value))
         length = len(value)
         if self.minlen is not None and length < self.minlen:
             raise exc.MinLengthError(expected=self.minlen, actual=length)
         if self.maxlen is not None and length > self.maxlen:
             raise exc.MaxLengthError(expected=self.maxlen, actual=length)
         return value
+
+
+_Pattern = type(re.compile(""))
+_MATCH_MODES = ("full", "prefix", "search")
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+
+
+def _pattern_source(regex):
+    # Flags passed to ``re.compile()`` are turned into inline ones,
+    # so the pattern can be dumped and compiled again.
+    if not isinstance(regex.pattern, str):
+        return regex.pattern  # It will be rejected by contract
+    flags = regex.flags & ~re.compile(regex.pattern).flags
+    inline = "".join(char for flag, char in _INLINE_FLAGS if flags & flag)
+    if not inline:
+        return regex.pattern
+    return "(?%s)%s" % (inline, regex.pattern)
+
+
+def _match_method(regex, match):
+    if regex is None:
+        return None
+    if match == "full":
+        return regex.fullmatch
+    if match == "search":
+        return regex.search
+    return regex.match
@@ -0,0 +1,37 @@
+import typing as t
+
+
+class ValidationContext(t.MutableMapping[str, t.Any]):
+    __slots__: t.Tuple[str, ...]
+    data: t.Optional[t.MutableMapping[str, t.Any]]
+    depth: int
+    recursion: t.Optional[t.Dict[str, int]]
+    budget: t.Any
+    outcomes: t.Optional[t.Dict[t.Tuple[str, t.Optional[int], int], t.Any]]
+
+    def __init__(self, data: t.Optional[t.MutableMapping[str, t.Any]] = None) -> None:
+        ...
+
+    def __getitem__(self, key: str) -> t.Any:
+        ...
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        ...
+
+    def __delitem__(self, key: str) -> None:
+        ...
+
+    def __iter__(self) -> t.Iterator[str]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def copy(self) -> t.Dict[str, t.Any]:
+        ...
+
+
+def setup_context(
+    context: t.Optional[t.MutableMapping[str, t.Any]]
+) -> ValidationContext:
+    ...
@@ -18,11 +18,29 @@ class AllOf(abstract.Validator):
 class OneOf(abstract.Validator):
     __slots__: t.Tuple[str, ...]
     steps: t.List[abstract.Validator]
+    adaptive: bool
 
     def __init__(
         self,
         *steps: abstract.Validator,
+        adaptive: bool = False,
         alias: t.Optional[str] = None,
         replace: bool = False
     ) -> None:
         ...
+
+
+class Tagged(abstract.Validator):
+    __slots__: t.Tuple[str, ...]
+    key: str
+    variants: t.Mapping[t.Any, abstract.Validator]
+
+    def __init__(
+        self,
+        key: str,
+        variants: t.Mapping[t.Any, abstract.Validator],
+        *,
+        alias: t.Optional[str] = None,
+        replace: bool = False,
+    ) -> None:
+        ...
@@ -1,6 +1,11 @@
+import sys
+from time import monotonic
+
 from .. import exc
 from .. import contracts
+from .. import engine
 from . import abstract, instances
+from .context import ValidationContext, setup_context
 
 
 class LazyRef(abstract.Validator):
@@ -54,6 +59,14 @@ class LazyRef(abstract.Validator):
         if ``self.maxdepth is not None``
         and current recursion depth exceeds the limit.
 
+    Nesting of all references is also limited
+    by ``maxdepth`` parameter of :class:`validx.py.Budget` validator.
+
+    Data nested deeper than ``validx.engine.DEPTH_THRESHOLD`` references
+    is validated without deep recursion of validator calls,
+    so it does not hit Python recursion limit,
+    see :mod:`validx.engine`.
+
     """
 
     __slots__ = ("use", "maxdepth")
@@ -69,22 +82,161 @@ class LazyRef(abstract.Validator):
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
-        if __context is None:
-            __context = {}  # Setup context, if it's top level call
+        if type(__context) is not ValidationContext:
+            # Setup context, if it's top level call
+            __context = setup_context(__context)
 
-        instance = instances.get(self.use)
-        if self.maxdepth is None:
-            return instance(value, __context)
+        outcomes = __context.outcomes
+        if outcomes is not None:
+            outcome = outcomes.get(engine.key(self, value))
+            if outcome is not None:
+                return engine.replay(outcome)
 
+        self._enter(__context)
         try:
-            key = self.use + ".recursion_depth"
-            depth = __context.setdefault(key, 0) + 1
+            if __context.depth > engine.DEPTH_THRESHOLD:
+                return engine.validate(self, value, __context, instances.get)
+            return instances.get(self.use)(value, __context)
+        finally:
+            self._leave(__context)
+
+    def _enter(self, context):
+        # Counts nesting of references, it is restored by ``_leave()``
+        if self.maxdepth is not None:
+            if context.recursion is None:
+                context.recursion = {}
+            depth = context.recursion.get(self.use, 0) + 1
             if depth > self.maxdepth:
                 raise exc.RecursionMaxDepthError(expected=self.maxdepth, actual=depth)
-            __context[key] = depth
-            return instance(value, __context)
+        if context.budget is not None:
+            context.budget.enter()
+        if self.maxdepth is not None:
+            context.recursion[self.use] = depth
+        context.depth += 1
+
+    def _leave(self, context):
+        if self.maxdepth is not None:
+            context.recursion[self.use] -= 1
+        if context.budget is not None:
+            context.budget.leave()
+        context.depth -= 1
+
+
+class Budget(abstract.Validator):
+    """
+    Resource Budget Validator
+
+    It limits amount of work,
+    which is done by wrapped validator within a single call.
+    It protects from expensive input data,
+    like huge or deeply nested documents.
+    Consumed resources are tracked by nested validators,
+    and once any limit of nodes, chars, or time is exceeded,
+    the rest of data is rejected without processing.
+    Exceeded ``maxdepth`` rejects only the data nested too deep.
+    Data nested deeper than ``validx.engine.DEPTH_THRESHOLD`` references
+    is charged bottom-up,
+    so exceeded limit of nodes, chars, or time
+    might be reported at a different place of the data.
+
+    ..  testsetup:: budget
+
+        from validx import Budget, List, Int
+
+    ..  doctest:: budget
+        :options: +ELLIPSIS, -IGNORE_EXCEPTION_DETAIL
+
+        >>> schema = Budget(List(List(Int())), maxnodes=5)
+
+        >>> schema([[1, 2], [3]])
+        [[1, 2], [3]]
+
+        >>> schema([[1, 2], [3, 4]])
+        Traceback (most recent call last):
+            ...
+        validx.exc.errors.SchemaError: <SchemaError(errors=[
+            <1: BudgetExceededError(expected=5, actual=6, resource='nodes')>
+        ])>
+
+    :param Validator step:
+        wrapped validator.
+
+    :param int maxnodes:
+        upper limit of total number of items of all validated containers.
+
+    :param int maxchars:
+        upper limit of total length of all values
+        validated by :class:`validx.py.Str` and :class:`validx.py.Bytes`.
+
+    :param int maxdepth:
+        upper limit of nesting of recursive references,
+        i.e. :class:`validx.py.LazyRef` validators.
+        Nesting of other validators is limited by schema itself.
+
+    :param timeout:
+        time limit in seconds,
+        it is checked by containers before processing of their items.
+    :type timeout: int or float
+
+    Limits of nested ``Budget`` validators are applied within outer ones,
+    i.e. resources consumed by the inner validator
+    are also counted by the outer one.
+
+
+    :raises BudgetExceededError:
+        if consumption of any resource exceeds the limit.
+
+    """
+
+    __slots__ = ("step", "maxnodes", "maxchars", "maxdepth", "timeout")
+
+    def __init__(
+        self,
+        step,
+        maxnodes=None,
+        maxchars=None,
+        maxdepth=None,
+        timeout=None,
+        alias=None,
+        replace=False,
+    ):
+        step = contracts.expect(self, "step", step, types=abstract.Validator)
+        maxnodes = contracts.expect_length(self, "maxnodes", maxnodes, nullable=True)
+        maxchars = contracts.expect_length(self, "maxchars", maxchars, nullable=True)
+        maxdepth = contracts.expect_length(self, "maxdepth", maxdepth, nullable=True)
+        timeout = contracts.expect(
+            self, "timeout", timeout, nullable=True, types=(int, float), not_types=bool
+        )
+
+        setattr = object.__setattr__
+        setattr(self, "step", step)
+        setattr(self, "maxnodes", maxnodes)
+        setattr(self, "maxchars", maxchars)
+        setattr(self, "maxdepth", maxdepth)
+        setattr(self, "timeout", timeout)
+
+        self._register(alias, replace)
+
+    def __call__(self, value, __context=None):
+        if type(__context) is not ValidationContext:
+            # Setup context, if it's top level call
+            __context = setup_context(__context)
+
+        outer = __context.budget
+        state = _BudgetState(
+            _UNLIMITED if self.maxnodes is None else self.maxnodes,
+            _UNLIMITED if self.maxchars is None else self.maxchars,
+            _UNLIMITED if self.maxdepth is None else self.maxdepth,
+            self.timeout,
+            outer,
+        )
+        __context.budget = state
+        try:
+            return self.step(value, __context)
         finally:
-            __context[key] -= 1
+            if outer is not None:
+                outer.absorb(state)
+            __context.budget = outer
 
 
 class Type(abstract.Validator):
@@ -262,3 +414,91 @@ class Any(abstract.Validator):
 
     def __call__(self, value, __context=None):
         return value
+
+
+_UNLIMITED = sys.maxsize
+
+
+class _BudgetState:
+    # Resources consumed within a call of ``Budget`` validator,
+    # limits of outer budget are taken into account on creation.
+
+    __slots__ = (
+        "maxnodes",
+        "maxchars",
+        "maxdepth",
+        "timeout",
+        "deadline",
+        "nodes",
+        "chars",
+        "depth",
+        "exhausted",
+    )
+
+    def __init__(self, maxnodes, maxchars, maxdepth, timeout, outer):
+        self.maxnodes = maxnodes
+        self.maxchars = maxchars
+        self.maxdepth = maxdepth
+        self.timeout = timeout
+        self.deadline = None if timeout is None else monotonic() + timeout
+        if outer is not None:
+            self.maxnodes = min(self.maxnodes, outer.maxnodes - outer.nodes)
+            self.maxchars = min(self.maxchars, outer.maxchars - outer.chars)
+            self.maxdepth = min(self.maxdepth, outer.maxdepth - outer.depth)
+            if outer.deadline is not None and (
+                self.deadline is None or outer.deadline < self.deadline
+            ):
+                self.timeout = outer.timeout
+                self.deadline = outer.deadline
+        self.nodes = 0
+        self.chars = 0
+        self.depth = 0
+        # Once nodes, chars, or time are exceeded, the rest of data is rejected
+        self.exhausted = False
+
+    def spend_nodes(self, num):
+        self.nodes += num
+        if self.nodes > self.maxnodes:
+            self.exhausted = True
+            raise exc.BudgetExceededError(
+                expected=self.maxnodes, actual=self.nodes, resource="nodes"
+            )
+        if self.deadline is not None:
+            now = monotonic()
+            if now > self.deadline:
+                self.exhausted = True
+                raise exc.BudgetExceededError(
+                    expected=self.timeout,
+                    actual=now - self.deadline + self.timeout,
+                    resource="time",
+                )
+
+    def iterate(self, iterable):
+        for item in iterable:
+            self.spend_nodes(1)
+            yield item
+
+    def spend_chars(self, num):
+        self.chars += num
+        if self.chars > self.maxchars:
+            self.exhausted = True
+            raise exc.BudgetExceededError(
+                expected=self.maxchars, actual=self.chars, resource="chars"
+            )
+
+    def enter(self):
+        if self.depth + 1 > self.maxdepth:
+            raise exc.BudgetExceededError(
+                expected=self.maxdepth, actual=self.depth + 1, resource="depth"
+            )
+        self.depth += 1
+
+    def leave(self):
+        self.depth -= 1
+
+    def absorb(self, inner):
+        self.nodes += inner.nodes
+        self.chars += inner.chars
+        # Limits of the inner budget might be inherited from this one
+        if self.nodes > self.maxnodes or self.chars > self.maxchars:
+            self.exhausted = True
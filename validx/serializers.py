@@ -0,0 +1,251 @@
+"""
+Serializers of validated data
+
+The module builds serializers from validator trees,
+see :meth:`validx.py.Validator.serializer`.
+Each serializer is a function that accepts data,
+returned by the corresponding validator,
+and returns data that can be passed to :func:`json.dumps` as is.
+
+Builders are picked by class names of validators,
+so the same code works for both Python and Cython implementations.
+Validators, which output type is unknown in advance,
+e.g. ``OneOf`` or ``Any``, fall back to :func:`probe`.
+
+"""
+
+import decimal
+import datetime
+from collections.abc import Mapping
+
+try:
+    import dataclasses
+except ImportError:  # pragma: no cover
+    dataclasses = None  # type: ignore  # Python 3.6
+
+
+def build(validator, resolve):
+    """
+    Build serializer for the validator
+
+    :param Validator validator:
+        root validator of the tree.
+
+    :param resolve:
+        function that gets registered validator by its alias,
+        it is used to resolve ``LazyRef`` validators.
+
+    :returns:
+        serializer function.
+
+    """
+    serializer = _Builder(resolve).build(validator)
+    if serializer is None:
+        return _identity
+    return serializer
+
+
+def probe(value):
+    """
+    Convert value of unknown structure into JSON-ready data
+
+    :class:`datetime.date`, :class:`datetime.time`,
+    and :class:`datetime.datetime` are converted into ISO 8601 strings,
+    :class:`decimal.Decimal` — into strings,
+    sets and tuples — into lists.
+    Other values are returned as is.
+
+    """
+    tp = type(value)
+    if tp in _PLAIN_TYPES:
+        return value
+    if tp is dict:
+        return {key: probe(val) for key, val in value.items()}
+    if tp in (list, tuple, set, frozenset):
+        return [probe(item) for item in value]
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+_PLAIN_TYPES = frozenset([type(None), bool, int, float, str])
+
+
+def _identity(value):
+    return value
+
+
+_MISSING = object()
+
+
+def _attributes(into, schema):
+    # Converts objects built by ``into`` parameter of ``Dict`` validator
+    # back into dictionaries
+    if dataclasses is not None and dataclasses.is_dataclass(into):
+        names = [field.name for field in dataclasses.fields(into)]
+    else:
+        names = getattr(into, "_fields", None) or list(schema)  # ``NamedTuple``
+
+    def attributes(value):
+        result = {}
+        for name in names:
+            val = getattr(value, name, _MISSING)
+            if val is not _MISSING:
+                result[name] = val
+        return result
+
+    return attributes
+
+
+def _isoformat(value):
+    if value is None:
+        return value
+    return value.isoformat()
+
+
+def _decimal(value):
+    if value is None:
+        return value
+    return str(value)
+
+
+class _Builder(object):
+    # Builders return ``None`` for validators,
+    # which output is JSON-ready as is,
+    # so containers of such validators are not walked at all.
+
+    def __init__(self, resolve):
+        self.resolve = resolve
+        self.refs = {}
+
+    def build(self, validator):
+        for cls in type(validator).__mro__:
+            method = getattr(self, "build_" + cls.__name__, None)
+            if method is not None:
+                return method(validator)
+        return probe
+
+    def build_Int(self, validator):
+        return None
+
+    build_Float = build_Bool = build_Str = build_Int
+
+    def build_Decimal(self, validator):
+        return _decimal
+
+    def build_Date(self, validator):
+        return _isoformat
+
+    build_Time = build_Datetime = build_Date
+
+    def build_Const(self, validator):
+        if type(validator.value) in _PLAIN_TYPES:
+            return None
+        return probe
+
+    def build_List(self, validator):
+        item = self.build(validator.item)
+        if item is None:
+            return None
+
+        def serialize_list(value):
+            if value is None:
+                return value
+            return [item(val) for val in value]
+
+        return serialize_list
+
+    def build_Set(self, validator):
+        item = self.build(validator.item) or _identity
+
+        def serialize_set(value):
+            if value is None:
+                return value
+            return [item(val) for val in value]
+
+        return serialize_set
+
+    def build_Tuple(self, validator):
+        items = [self.build(item) for item in validator.items]
+        if all(item is None for item in items):
+            return None
+        items = [item or _identity for item in items]
+
+        def serialize_tuple(value):
+            if value is None:
+                return value
+            return [item(val) for item, val in zip(items, value)]
+
+        return serialize_tuple
+
+    def build_Dict(self, validator):
+        fields = {}
+        if validator.schema is not None:
+            for key, field in validator.schema.items():
+                field = self.build(field)
+                if field is not None:
+                    fields[key] = field
+        extra = None
+        if validator.extra is not None:
+            extra = self.build(validator.extra[1])
+        if not fields and extra is None and validator.into is None:
+            return None
+        schema = validator.schema or {}
+        items = dict if validator.into is None else _attributes(validator.into, schema)
+
+        def serialize_dict(value):
+            if value is None:
+                return value
+            result = items(value)
+            for key, field in fields.items():
+                if key in result:
+                    result[key] = field(result[key])
+            if extra is not None:
+                for key, val in result.items():
+                    if key not in schema:
+                        result[key] = extra(val)
+            return result
+
+        return serialize_dict
+
+    def build_AllOf(self, validator):
+        # Each step validates output of the previous one,
+        # so the result is produced by the last step
+        return self.build(validator.steps[-1])
+
+    def build_Budget(self, validator):
+        return self.build(validator.step)
+
+    def build_Tagged(self, validator):
+        variants = {
+            tag: self.build(variant) or _identity
+            for tag, variant in validator.variants.items()
+        }
+        if all(variant is _identity for variant in variants.values()):
+            return None
+        key = validator.key
+
+        def serialize_tagged(value):
+            if isinstance(value, Mapping):
+                return variants[value[key]](value)
+            return variants[getattr(value, key)](value)  # Built by ``into``
+
+        return serialize_tagged
+
+    def build_LazyRef(self, validator):
+        # Referenced validator is resolved on the first call,
+        # because the reference can be recursive or not registered yet
+        use = validator.use
+        if use not in self.refs:
+            resolved = []
+
+            def serialize_ref(value):
+                if not resolved:
+                    target = self.build(self.resolve(use))
+                    resolved.append(target or _identity)
+                return resolved[0](value)
+
+            self.refs[use] = serialize_ref
+        return self.refs[use]